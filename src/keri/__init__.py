@@ -45,4 +45,4 @@ from .recording import (RawRecord, StateEERecord, KeyStateRecord,
                         OobiQueryRecord, OobiRecord, EndpointRecord,
                         EndAuthRecord, LocationRecord, ObservedRecord,
                         CacheTypeRecord, MsgCacheRecord, TxnMsgCacheRecord,
-                        WellKnownAuthN)
+                        WellKnownAuthN, SnapshotRecord)
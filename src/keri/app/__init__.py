@@ -41,6 +41,6 @@ from .signaling import (signal, Signal, Signaler,
                         SignalsEnd, SignalIterable)
 from .signing import serialize, signPaths, transSeal
 from .specing import SpecResource
-from .storing import Mailboxer, Respondant
+from .storing import Mailboxer, MailboxCompactor, Respondant
 from .watching import (logger, Stateage, States, DiffState,
                        Adjudicator, AdjudicationDoer, diffState)
@@ -286,11 +286,29 @@ class WitnessReceiptor(doing.DoDoer):
     for receipts from each of those witnesses, and propagates those receipts to each
     of the other witnesses after receiving the complete set.
 
-    Removes all Doers and exits as Done once all witnesses have been sent the entire
-    receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
-    and an `all` method that runs and waits for more messages to receipt.
+    Events are receipted as a pipeline rather than one at a time.  Each round drains up
+    to .Batch events from .msgs, coalesces everything bound for the same witness into a
+    single outbound stream and keeps every event in flight until its own receipts are
+    complete, so a slow witness only delays the events it witnesses.  One messenger per
+    witness is reused across events and a cache of the KEL state each witness is known
+    to hold avoids resending delegation chains and full KELs.
+
+    Witness auth codes are sent with each outbound stream rather than bound to its
+    messenger.  A messenger is rebuilt when the endpoint of its witness changes and
+    dropped once idle for longer than .MaxIdle seconds.
+
+    Attributes:
+        witers (dict): messengers keyed by witness AID
+        urls (dict): endpoint urls each messenger was made for keyed by witness AID
+        idled (dict): tyme each unused messenger went idle keyed by witness AID
+        held (dict): highest sn of each KEL known to be held, keyed by (witness AID, AID)
+        met (set): (witness AID, witness AID) pairs already introduced to each other
+        pending (list): in-flight events, see .stage for the fields of each entry
     """
 
+    Batch = 64  # maximum number of new events staged per round
+    MaxIdle = 30.0  # seconds to keep an unused idle messenger
+
     def __init__(self, hby, msgs=None, cues=None, force=False, auths=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
@@ -303,141 +321,264 @@ class WitnessReceiptor(doing.DoDoer):
             cues (Deck): outgoing cues of events confirmed as fully receipted
                 Messages have {"pre": <str>, "sn": <int>, "auths": <dict>}
             force (bool): True means to send witnesses all receipts even if we have a full complement.
-            auths (dict): map of witness AIDs to (time,auth) tuples for providing TOTP auth for witnessing
+            auths (dict): map of witness AIDs to auth codes for witnessing used for
+                events without their own "auths"
         """
         self.hby = hby
         self.force = force
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.auths = auths if auths is not None else dict()
+        self.witers = dict()
+        self.urls = dict()
+        self.idled = dict()
+        self.held = dict()
+        self.met = set()
+        self.pending = []
 
         super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
 
-    def receiptDo(self, tymth=None, tock=0.0, **kwa):
+    def witer(self, hab, wit):
+        """ Returns the messenger for witness wit, creating it on first use or
+        rebuilding it when the endpoint of wit has changed. Messages not yet
+        sent by a rebuilt messenger move to its replacement.
+
+        Parameters:
+            hab (Hab): environment used to look up the witness endpoints
+            wit (str): qb64 AID of witness
         """
-        Sends events, their receipts, receipt signatures, delegation chain, and location record
-         URLs between witnesses in the set of current witnesses.
+        urls = hab.fetchUrls(eid=wit)
+        msgs = []
+        if wit in self.witers and self.urls[wit] != urls:  # endpoint changed
+            msgs = list(self.drop(wit).msgs)
+
+        if wit not in self.witers:
+            witer = messengerFrom(hab, wit, urls)
+            witer.msgs.extend(msgs)
+            self.witers[wit] = witer
+            self.urls[wit] = urls
+            self.extend([witer])
 
-        Returns:
-             a doifiable Hio generator to perform event and receipt sending.
+        self.idled.pop(wit, None)
+        return self.witers[wit]
 
-        Usage:
-            add result of doify on this method to doers list
+    def drop(self, wit):
+        """ Removes and returns the messenger of witness wit """
+        witer = self.witers.pop(wit)
+        self.urls.pop(wit, None)
+        self.idled.pop(wit, None)
+        self.remove([witer])
+        return witer
+
+    def holds(self, wit, pre, sn):
+        """ Returns True if witness wit is known to hold the KEL of pre through sn """
+        return self.held.get((wit, pre), -1) >= sn
+
+    @staticmethod
+    def out(outs, witer, auth):
+        """ Returns the outbound stream of this round for witer sent with auth """
+        return outs.setdefault((id(witer), auth), (witer, auth, bytearray()))[2]
+
+    def stage(self, evt, outs):
+        """
+        Stages one event from .msgs.  Queues the event, and whatever part of the KEL and
+        delegation chain each witness is not known to hold, onto outs.
+
+        Returns:
+            dict | None: pending entry with fields evt, hab, ser, sn, wits, auths,
+                chain and phase, or None when there is nothing left to do for the event.
+                chain is the (pre, sn) of each delegator KEL sent with the event
 
         Parameters:
-            tymth (function): function returning cycle time for configuring this Doer's cycle time.
-            tock (float): cycle time for this Doer, default is 0.0 seconds.
+            evt (dict): event from .msgs with {"pre": <str>, "sn": <int>, "auths": <dict>}
+            outs (dict): outbound stream for each messenger and auth of this round
         """
-        self.wind(tymth)
-        self.tock = tock
-        _ = (yield self.tock)
+        pre = evt["pre"]
+        if pre not in self.hby.habs:
+            return None
 
-        while True:
-            while self.msgs:
-                evt = self.msgs.popleft()
-                pre = evt["pre"]
+        hab = self.hby.habs[pre]
+        sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
+        wits = hab.kever.wits
+        auths = evt["auths"] if evt.get("auths") else self.auths
 
-                if pre not in self.hby.habs:
-                    continue
+        if len(wits) == 0:
+            return None
 
-                hab = self.hby.habs[pre]
+        msg = hab.msgOwnEvent(sn=sn, framed=True)
+        ser = serdering.SerderKERI(raw=msg)
+        entry = dict(evt=evt, hab=hab, ser=ser, sn=sn, wits=wits, auths=auths, chain=[],
+                     phase="receipt")
 
-                sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
-                wits = hab.kever.wits
+        # Check to see if we already have all the receipts we need for this event
+        if len(hab.db.wigs.get(keys=(ser.preb, ser.saidb))) == len(wits):
+            if not self.force:  # exit unless told to force resubmit of all receipts
+                self.learn(entry)
+                self.cues.push(evt)
+                return None
+            self.propagate(entry, outs)
+            return entry
 
-                if len(wits) == 0:
-                    continue
+        chain = entry["chain"] = list(self.delegators(hab.kever))
+        dmsgs = None
+        for wit in wits:
+            out = self.out(outs, self.witer(hab, wit), auths.get(wit))
 
-                msg = hab.msgOwnEvent(sn=sn, framed=True)
-                ser = serdering.SerderKERI(raw=msg)
+            if not all(self.holds(wit, dpre, dsn) for dpre, dsn in chain):
+                if dmsgs is None:  # clone delegation chain at most once per event
+                    dmsgs = b''.join(bytes(dmsg) for dmsg in hab.db.cloneDelegation(hab.kever))
+                out.extend(dmsgs)
 
-                witers = []
-                for wit in wits:
-                    auth = self.auths[wit] if wit in self.auths else None
-                    witer = messenger(hab, wit, auth=auth)
-                    witers.append(witer)
-                    self.extend([witer])
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
+                    "ba" in ser.ked and wit in ser.ked["ba"] and \
+                    not self.holds(wit, pre, sn - 1):  # Newly added witness, must send full KEL to catch up
+                for fmsg in hab.db.clonePreIter(pre=pre, version=ser.pvrsn):
+                    out.extend(fmsg)
 
-                # Check to see if we already have all the receipts we need for this event
-                wigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
-                completed = len(wigers) == len(wits)
-                if len(wigers) != len(wits):  # We have all the receipts, skip
-                    for idx, witer in enumerate(witers):
-                        wit = wits[idx]
+            out.extend(msg)
 
-                        for dmsg in hab.db.cloneDelegation(hab.kever):
-                            witer.msgs.append(bytearray(dmsg))
+        return entry
 
-                        if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
-                                "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                            for fmsg in hab.db.clonePreIter(pre=pre, version=ser.pvrsn):
-                                witer.msgs.append(bytearray(fmsg))
+    def delegators(self, kever):
+        """ Yields (pre, sn) of each delegator in the delegation chain of kever """
+        while kever.delegated and kever.delpre in self.hby.db.kevers:
+            kever = self.hby.db.kevers[kever.delpre]
+            yield kever.prefixer.qb64, kever.sner.num
 
-                        witer.msgs.append(bytearray(msg))  # make a copy
-                        _ = (yield self.tock)
+    def propagate(self, entry, outs):
+        """
+        Queues the full receipt set of a pending event onto outs so every witness holds
+        the receipts of every other witness, introducing witnesses that have not met yet.
+
+        Parameters:
+            entry (dict): pending event from .stage
+            outs (dict): outbound stream for each messenger and auth of this round
+        """
+        hab = entry["hab"]
+        ser = entry["ser"]
+        wits = entry["wits"]
+        awigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
 
-                    while True:
-                        wigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
-                        if len(wigers) == len(wits):
-                            break
-                        _ = yield self.tock
+        rserder = eventing.receipt(pre=ser.pre,
+                                   sn=entry["sn"],
+                                   said=ser.said,
+                                   version=ser.pvrsn,
+                                   kind=ser.kind)
 
-                # If we started with all our receipts, exit unless told to force resubmit of all receipts
-                if completed and not self.force:
-                    self.cues.push(evt)
+        for wit in wits:
+            ewits = []
+            wigers = []
+            for i, ewit in enumerate(wits):
+                if ewit == wit:
                     continue
+                ewits.append(ewit)
+                wigers.append(awigers[i])
 
-                # generate all rct msgs to send to all witnesses
-                awigers = wigers
-
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
-
-                    if len(wigers) == 0:
-                        continue
-
-                    rctMsg = bytearray()
-
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said,
-                                               version=ser.pvrsn,
-                                               kind=ser.kind)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers,
-                                                     framed=True, gvrsn=ser.pvrsn))
-
-                    witer.msgs.append(rctMsg)
-                    _ = (yield self.tock)
+            if len(wigers) == 0:
+                continue
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+            out = self.out(outs, self.witer(hab, wit), entry["auths"].get(wit))
 
-                self.remove(witers)
+            # Now that the witnesses have not met each other, send them each other's receipts
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
+                    ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                    ("ba" in ser.ked and wit in ser.ked["ba"]):  # introduce new witnesses
+                strangers = [ewit for ewit in ewits if (wit, ewit) not in self.met]
+                if strangers:
+                    out.extend(schemes(self.hby.db, eids=strangers))
 
-                self.cues.push(evt)
-                yield self.tock
+            out.extend(eventing.messagize(serder=rserder, wigers=wigers,
+                                          framed=True, gvrsn=ser.pvrsn))
+
+        entry["phase"] = "deliver"
+
+    def learn(self, entry):
+        """ Records the KEL state every witness of a fully receipted event now holds.
+        Only the delegation chain sent with the event is learned since the delegators
+        may have moved on since it was staged.
+        """
+        ser = entry["ser"]
+        for wit in entry["wits"]:
+            for pre, sn in [(ser.pre, entry["sn"])] + entry["chain"]:
+                if not self.holds(wit, pre, sn):
+                    self.held[(wit, pre)] = sn
+
+            if entry["phase"] == "deliver":
+                self.met.update((wit, ewit) for ewit in entry["wits"] if ewit != wit)
+
+    def delivered(self, wit):
+        """ Returns True when messenger of wit has sent everything queued on it """
+        witer = self.witers.get(wit)
+        return witer is None or (not witer.msgs and witer.idle)
+
+    @staticmethod
+    def flush(outs):
+        """ Hands the coalesced outbound stream of this round to each messenger.
+        Streams with an auth code are queued as (stream, auth) for that stream only.
+        """
+        for witer, auth, out in outs.values():
+            if out:
+                witer.msgs.append((out, auth) if auth is not None else out)
+
+    def prune(self):
+        """ Drops messengers that have been idle and unused for longer than .MaxIdle.
+        Trims what every messenger has sent since receipts arrive through the db
+        not the messenger responses.
+        """
+        busy = {wit for entry in self.pending for wit in entry["wits"]}
+        for wit in list(self.witers):
+            self.witers[wit].sent.clear()
+            if wit in busy or not self.delivered(wit):
+                self.idled.pop(wit, None)
+            elif self.tyme - self.idled.setdefault(wit, self.tyme) > self.MaxIdle:
+                self.drop(wit)
+
+    def receiptDo(self, tymth=None, tock=0.0, **kwa):
+        """
+        Sends events, their receipts, receipt signatures, delegation chain, and location record
+         URLs between witnesses in the set of current witnesses.
+
+        Each pending event advances on its own: "receipt" waits for a full set of
+        witness receipts, "deliver" waits until the propagated receipts have been sent
+        after which the event is cued.
+
+        Returns:
+             a doifiable Hio generator to perform event and receipt sending.
 
+        Usage:
+            add result of doify on this method to doers list
+
+        Parameters:
+            tymth (function): function returning cycle time for configuring this Doer's cycle time.
+            tock (float): cycle time for this Doer, default is 0.0 seconds.
+        """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        while True:
+            outs = dict()
+            staged = 0
+            while self.msgs and staged < self.Batch:
+                entry = self.stage(self.msgs.popleft(), outs)
+                staged += 1
+                if entry is not None:
+                    self.pending.append(entry)
+
+            for entry in list(self.pending):
+                if entry["phase"] == "receipt":
+                    ser = entry["ser"]
+                    wigers = entry["hab"].db.wigs.get(keys=(ser.preb, ser.saidb))
+                    if len(wigers) == len(entry["wits"]):
+                        self.propagate(entry, outs)
+
+                elif all(self.delivered(wit) for wit in entry["wits"]):
+                    self.pending.remove(entry)
+                    self.learn(entry)
+                    self.cues.push(entry["evt"])
+
+            self.flush(outs)
+            self.prune()
             yield self.tock
 
 
@@ -700,14 +841,17 @@ class TCPMessenger(doing.DoDoer):
             hab (Hab): habitat for KEL parsing and db access.
             wit (str): qb64 witness identifier.
             url (str): tcp endpoint URL for the witness.
-            msgs (Deck | None): outbound message queue.
-            sent (Deck | None): sent message queue.
+            msgs (Deck | None): outbound message queue. Entries are msg bytes
+                or (msg, auth) tuples whose auth is ignored over tcp.
+            sent (Deck | None): sent message queue. May be trimmed by its
+                consumer since .idle counts sent messages in .settled
         """
         self.hab = hab
         self.wit = wit
         self.url = url
         self.version = self.hab.psr.version
         self.posted = 0
+        self.settled = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -743,6 +887,8 @@ class TCPMessenger(doing.DoDoer):
                 yield self.tock
 
             msg = self.msgs.popleft()
+            if isinstance(msg, tuple):  # (msg, auth) auth not used over tcp
+                msg, _ = msg
             self.posted += 1
 
             client.tx(msg)  # send to connected remote
@@ -751,6 +897,7 @@ class TCPMessenger(doing.DoDoer):
                 yield self.tock
 
             self.sent.append(msg)
+            self.settled += 1
             yield self.tock
 
     def msgDo(self, tymth=None, tock=0.0, **opts):
@@ -759,7 +906,7 @@ class TCPMessenger(doing.DoDoer):
 
     @property
     def idle(self):
-        return len(self.sent) == self.posted
+        return self.settled == self.posted
 
 
 class TCPStreamMessenger(doing.DoDoer):
@@ -847,13 +994,16 @@ class HTTPMessenger(doing.DoDoer):
             hab (Hab): habitat for KEL parsing and db access.
             wit (str): qb64 witness identifier.
             url (str): http/https endpoint URL for the witness.
-            msgs (Deck | None): outbound message queue.
-            sent (Deck | None): response queue.
+            msgs (Deck | None): outbound message queue. Entries are msg bytes
+                or (msg, auth) tuples that override auth for that msg.
+            sent (Deck | None): response queue. May be trimmed by its
+                consumer since .idle counts responses in .settled
             auth (str | None): optional 2FA auth codes for witnesses.
         """
         self.hab = hab
         self.wit = wit
         self.posted = 0
+        self.settled = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -883,9 +1033,12 @@ class HTTPMessenger(doing.DoDoer):
                 yield self.tock
 
             msg = self.msgs.popleft()
+            auth = self.auth
+            if isinstance(msg, tuple):  # (msg, auth) auth for this msg only
+                msg, auth = msg
             headers = dict()
-            if self.auth is not None:
-                headers["Authorization"] = self.auth
+            if auth is not None:
+                headers["Authorization"] = auth
 
             self.posted += streamCESRRequests(client=self.client, dest=self.wit, ims=msg, headers=headers)
             while self.client.requests:
@@ -903,12 +1056,13 @@ class HTTPMessenger(doing.DoDoer):
             while self.client.responses:
                 rep = self.client.respond()
                 self.sent.append(rep)
+                self.settled += 1
                 yield
             yield
 
     @property
     def idle(self):
-        return len(self.msgs) == 0 and self.posted == len(self.sent)
+        return len(self.msgs) == 0 and self.posted == self.settled
 
 
 class HTTPStreamMessenger(doing.DoDoer):
@@ -5,6 +5,7 @@ keri.peer.httping module
 """
 import datetime
 import json
+from collections import deque
 from dataclasses import dataclass
 from urllib import parse
 
@@ -211,35 +212,138 @@ def streamCESRRequests(client, ims, dest, path=None, headers=None):
     return cnt
 
 
+class Exchange:
+    """
+    Exchange is one HTTP request made by a Clienter over a pooled hio HTTP
+    Client connection along with the responses to that request. Provides the
+    same .responses and .respond() as a hio HTTP Client so that callers read
+    responses the same way whether or not the connection is shared.
+
+    Attributes:
+        conn (Connection): pooled connection that carries the request
+        responses (deque): response dicts to this request
+        dt (datetime.datetime): when the request was made
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.responses = deque()
+        self.dt = nowUTC()
+
+    def respond(self):
+        """
+        Pops and returns next response from .responses as namedtuple if any
+        Otherwise returns None
+        """
+        if self.responses:
+            return http.clienting.Client.attrify(self.responses.popleft())
+        return None
+
+
+class Connection:
+    """
+    Connection is one pooled keep-alive hio HTTP Client with its ClientDoer
+    for a given (scheme, host, port).
+
+    Attributes:
+        key (tuple): (scheme, host, port) of pool holding this connection
+        client (http.clienting.Client): hio HTTP client
+        doer (http.clienting.ClientDoer): doer that services .client
+        pending (deque): Exchanges sent or queued on .client in request order
+        origin (tuple): normalized (scheme, host, port) .client was opened to
+
+    Properties:
+        target (tuple): normalized (scheme, host, port) .client now sends to
+        moved (bool): True when .client followed a redirect to another host
+            so no longer serves requests for .key
+    """
+
+    def __init__(self, key, client, doer):
+        self.key = key
+        self.client = client
+        self.doer = doer
+        self.pending = deque()
+        self.origin = self.target
+
+    @property
+    def target(self):
+        requester = self.client.requester
+        return (requester.scheme, requester.hostname, requester.port)
+
+    @property
+    def moved(self):
+        return self.target != self.origin
+
+
+class Router(deque):
+    """
+    Router is the .responses deque of a pooled hio HTTP Client. Instead of
+    holding the responses it hands each one on to the Exchange that made
+    its request so that no polling of the client is needed to route it.
+    """
+
+    def __init__(self, clienter, conn):
+        super(Router, self).__init__()
+        self.clienter = clienter
+        self.conn = conn
+
+    def append(self, response):
+        # after a redirect only the first response carries the original request
+        first = (response.get("redirects") or [response])[0]
+        exchange = first.get("request", {}).get("exchange")
+        self.clienter.settle(self.conn, exchange, response)
+
+
 class Clienter(doing.DoDoer):
     """
-    Clienter is a DoDoer that manages hio HTTP clients using a ClientDoer for each HTTP request.
-    It executes HTTP requests using a HIO HTTP Client run by a ClientDoer. Once a request has
-    received a response then the corresponding Doer is removed from this Clienter.
+    Clienter is a DoDoer that manages pools of keep-alive hio HTTP clients, one
+    pool per (scheme, host, port). Each request is queued on an idle pooled
+    connection when there is one, otherwise on a new connection up to
+    MaxHost connections per host, otherwise behind the requests already
+    in flight on the least loaded connection. Requests queued on a connection
+    are sent in order over the kept alive connection without reconnecting.
+
+    Each request returns an Exchange whose .responses receives the response.
+    Once a caller is done with an Exchange it removes it from this Clienter.
+
+    A connection that follows a redirect to another host, or that the far
+    side cuts off while requests are pending, is closed. Its requests not yet
+    sent are queued again on the pool for its key and its request in flight
+    gets an errored 503 response. So is a connection whose request in flight
+    is removed, such as by timing out, so that a far side that never answers
+    does not block later requests to its host.
 
     Doers:
-        - clientDo: Periodically checks for stale clients and removes them if they have not received a response
-          within the specified timeout period.
+        - clientDo: Periodically removes exchanges that are older than
+          TimeoutClient and closes connections idle longer than MaxIdle.
+          Scans only the stale ends of time ordered records not every client.
+          Also rehomes busy connections that were cut off.
     """
 
     TimeoutClient = 300  # seconds to wait for response before removing client, default is 5 minutes
+    MaxIdle = 60  # seconds to keep idle connection alive before closing
+    MaxHost = 4  # max concurrent connections per (scheme, host, port)
 
     def __init__(self):
-        """Initialize clienter with an empty list of client tuples.
+        """Initialize clienter with empty connection pools.
 
         Attributes:
-            clients (list[tuple]): Active client tuples, each containing a
-                ``ClientDoer`` instance, an hio HTTP ``Client`` instance,
-                and a ``datetime`` timestamp.
+            clients (dict): Active Exchange instances in order made
+            pools (dict): lists of Connection keyed by (scheme, host, port)
+            idle (dict): datetime when each idle Connection went idle in
+                order of going idle
             doers (list): Doers managed by this Clienter, initialized with clientDo.
         """
-        self.clients = []
+        self.clients = dict()
+        self.pools = dict()
+        self.idle = dict()
         doers = [doing.doify(self.clientDo)]
         super(Clienter, self).__init__(doers=doers)
 
     def request(self, method, url, body=None, headers=None):
         """
-        Perform an HTTP request using a hio http Client and ClientDoer and returns the Client.
+        Perform an HTTP request over a pooled hio HTTP Client and return the
+        Exchange that receives its responses.
 
         Parameters:
             method (str): HTTP method to use (e.g., "GET", "POST")
@@ -248,15 +352,12 @@ class Clienter(doing.DoDoer):
             headers (dict, optional): Headers to include in the request, defaults to None
 
         Returns:
-            http.clienting.Client: The hio HTTP Client used for the request, or None if an error occurs.
+            Exchange: with .responses for the request, or None if an error occurs.
         """
         purl = parse.urlparse(url)
 
         try:
-            client = http.clienting.Client(scheme=purl.scheme,
-                                           hostname=purl.hostname,
-                                           port=purl.port,
-                                           portOptional=True)
+            conn = self.connect((purl.scheme, purl.hostname, purl.port))
         except Exception as e:
             print(f"error establishing client connection={e}")
             return None
@@ -264,40 +365,170 @@ class Clienter(doing.DoDoer):
         if hasattr(body, "encode"):
             body = body.encode("utf-8")
 
-        client.request(
+        exchange = Exchange(conn=conn)
+        # pooled client reuses latest request values unless given so give all
+        conn.client.request(
             method=method,
             path=f"{purl.path}?{purl.query}",
-            qargs=None,
-            headers=headers,
-            body=body
+            qargs={},
+            headers=headers if headers is not None else {},
+            body=body,
+            exchange=exchange,  # not sent, returned in response request
         )
 
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
-        self.clients.append((client, clientDoer, nowUTC()))
+        conn.pending.append(exchange)
+        self.idle.pop(conn, None)
+        self.clients[exchange] = None
+
+        return exchange
 
-        return client
+    def connect(self, key):
+        """
+        Returns Connection from pool for key to carry next request. Reuses
+        an idle connection if any, else opens a new one if under MaxHost,
+        else picks the connection with the fewest pending requests.
+
+        Parameters:
+            key (tuple): (scheme, host, port)
+        """
+        conns = self.pools.setdefault(key, [])
+        for conn in list(conns):
+            if not conn.pending:
+                if conn.client.connector.cutoff:  # far side closed it
+                    self.evict(conn)
+                    continue
+                return conn
+
+        if len(conns) < self.MaxHost:
+            scheme, hostname, port = key
+            client = http.clienting.Client(scheme=scheme,
+                                           hostname=hostname,
+                                           port=port,
+                                           portOptional=True)
+            conn = Connection(key=key, client=client,
+                              doer=http.clienting.ClientDoer(client=client))
+            client.responses = Router(clienter=self, conn=conn)
+            self.extend([conn.doer])
+            conns.append(conn)
+            return conn
+
+        return min(conns, key=lambda conn: len(conn.pending))
+
+    def settle(self, conn, exchange, response):
+        """
+        Hand response received on conn to exchange that made its request and
+        return conn to idle when it has nothing more pending. Closes conn
+        when far side asks to close it.
+
+        Parameters:
+            conn (Connection): connection that received response
+            exchange (Exchange | None): tagged on request for response
+            response (dict): hio HTTP response
+        """
+        if exchange in conn.pending:
+            conn.pending.remove(exchange)
+            # copy body since respondent reuses its body buffer for the next
+            # response on the same kept alive connection
+            response["body"] = bytearray(response["body"])
+            exchange.responses.append(response)
+
+        if conn.moved:  # redirected so later requests would go to wrong host
+            self.rehome(conn)
+            return
+
+        if not conn.pending:
+            connection = response.get("headers", {}).get("connection", "")
+            if "close" in connection.lower():
+                self.evict(conn)
+            else:
+                self.idle.pop(conn, None)
+                self.idle[conn] = nowUTC()
+
+    def rehome(self, conn):
+        """
+        Close conn and queue its requests not yet sent on other connections
+        of its pool. Its request in flight, if any, gets an errored 503
+        response since it may or may not have been served.
+
+        Parameters:
+            conn (Connection): pooled connection that moved or was cut off
+        """
+        requests = list(conn.client.requests)
+        conn.client.requests.clear()
+        self.evict(conn)
+
+        queued = [request.get("exchange") for request in requests]
+        for exchange in conn.pending:
+            if not any(exchange is other for other in queued):  # in flight
+                exchange.responses.append(dict(version=None,
+                                               status=503,
+                                               reason="Service Unavailable",
+                                               headers=Hict(),
+                                               body=bytearray(),
+                                               data=None,
+                                               request=dict(exchange=exchange),
+                                               errored=True,
+                                               error=f"connection to {conn.key} lost"))
+        conn.pending.clear()
+
+        for request in requests:
+            exchange = request.get("exchange")
+            if exchange not in self.clients:  # removed by caller
+                continue
+            exchange.conn = self.connect(conn.key)
+            exchange.conn.client.requests.append(request)
+            exchange.conn.pending.append(exchange)
+            self.idle.pop(exchange.conn, None)
+
+    def evict(self, conn):
+        """
+        Close conn and remove it and its Doer from its pool.
+
+        Parameters:
+            conn (Connection): pooled connection to close
+        """
+        self.idle.pop(conn, None)
+        conns = self.pools.get(conn.key, [])
+        if conn in conns:
+            conns.remove(conn)
+            if not conns:
+                del self.pools[conn.key]
+            super(Clienter, self).remove([conn.doer])
 
     def remove(self, client):
         """
-        Find a client tuple by hio HTTP Client and remove it and its Doer from the Clienter.
+        Remove Exchange from the Clienter. Its connection stays pooled unless
+        the Exchange is abandoned in flight. Then the connection would wait on
+        a response that may never come so it is closed and its requests not
+        yet sent are rehomed.
 
         Parameters:
-            client (http.clienting.Client): The hio HTTP Client to remove from the Clienter.
+            client (Exchange): The Exchange to remove from the Clienter.
         """
-        doers = [(c, d, dt) for (c, d, dt) in self.clients if c == client]
-        if len(doers) == 0:
+        if client not in self.clients:
             return
 
-        tup = doers[0]
-        self.clients.remove(doers[0])
-        (_, doer, _) = tup
-        super(Clienter, self).remove([doer])
+        del self.clients[client]
+        conn = client.conn
+        if client in conn.pending:  # abandoned, its response is dropped
+            conn.pending.remove(client)
+            queued = [request for request in conn.client.requests
+                      if request.get("exchange") is client]
+            if not queued:  # in flight
+                self.rehome(conn)
+                return
+
+            conn.client.requests.remove(queued[0])  # never send it
+            if not conn.pending:
+                self.idle[conn] = nowUTC()
 
     def clientDo(self, tymth, tock=0.0, **kwa):
-        """ Periodically prune stale clients
+        """ Periodically prune stale exchanges and idle connections
 
-        Process existing clients and prune any that have receieved a response longer than timeout
+        Removes exchanges made longer than TimeoutClient ago and closes
+        connections idle for longer than MaxIdle. Both are kept in time order
+        so only the stale front of each is visited. Rehomes the requests of
+        busy connections whose far side cut them off.
 
         Parameters:
             tymth (function): injected function wrapper closure returned by .tymen() of
@@ -310,16 +541,24 @@ class Clienter(doing.DoDoer):
         yield self.tock
 
         while True:
-            toRemove = []
-            for (client, doer, dt) in self.clients:
-                if client.responses:
-                    now = nowUTC()
-                    if (now - dt) > datetime.timedelta(seconds=self.TimeoutClient):
-                        toRemove.append(client)
-
-                yield self.tock
-
-            for client in toRemove:
+            now = nowUTC()
+            timeout = datetime.timedelta(seconds=self.TimeoutClient)
+            while self.clients:
+                client = next(iter(self.clients))
+                if (now - client.dt) <= timeout:
+                    break
                 self.remove(client)
 
+            timeout = datetime.timedelta(seconds=self.MaxIdle)
+            while self.idle:
+                conn, dt = next(iter(self.idle.items()))
+                if (now - dt) <= timeout:
+                    break
+                self.evict(conn)
+
+            for conns in list(self.pools.values()):
+                for conn in list(conns):
+                    if conn.pending and conn.client.connector.cutoff:
+                        self.rehome(conn)
+
             yield self.tock
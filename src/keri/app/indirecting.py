@@ -21,7 +21,7 @@ from hio.help import decking, ogler
 from ..kering import (Version, Roles, Ilks, Kinds,
                       MissingEntryError)
 from ..recording import TopicsRecord
-from ..core import (Kevery, parsing, routing, serdering,
+from ..core import (Kevery, EscrowPruner, parsing, routing, serdering,
                     Counter, receipt, Codens)
 from ..db import BaserDoer
 from ..end import loadEnds as loadEndingEnds
@@ -30,7 +30,7 @@ from ..peer import Exchanger
 
 from .habbing import GroupHab
 from .directing import Directant
-from .storing import Mailboxer, Respondant
+from .storing import Mailboxer, MailboxCompactor, Respondant
 from .httping import Clienter, createCESRRequest, parseCesrHttpRequest, CESR_CONTENT_TYPE
 from .forwarding import ForwardHandler
 from .agenting import httpClient
@@ -126,7 +126,9 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             kvy=kvy, tvy=tvy, rvy=rvy, exc=exchanger, replies=rep.reps,
                             responses=rep.cues, queries=httpEnd.qrycues)
 
-    doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
+    compactor = MailboxCompactor(mbx=mbx, cf=hby.cf)
+
+    doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, compactor, *oobiery.doers])
     return doers
 
 
@@ -172,7 +174,8 @@ class WitnessStart(doing.DoDoer):
         self.responses = responses if responses is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
 
-        doers = [doing.doify(self.start), doing.doify(self.msgDo), doing.doify(self.escrowDo), doing.doify(self.cueDo)]
+        doers = [doing.doify(self.start), doing.doify(self.msgDo), doing.doify(self.escrowDo), doing.doify(self.cueDo),
+                 EscrowPruner(kevery=self.kvy)]
         super().__init__(doers=doers, **opts)
 
     def start(self, tymth=None, tock=0.0, **kwa):
@@ -1032,39 +1035,103 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Iterable of server sent event chunks of mailbox messages at topics of pre.
+
+    Subscribes to the mailbox hub so messages stored at its topics are pushed
+    as pre-framed SSE events into .pending. When a slow consumer lets
+    .pending grow past MaxPending the topic is marked stale and caught up
+    from the database instead so memory stays bounded. Each chunk is at most
+    about MaxChunk bytes. Idle iteration does no database reads.
+
+    Attributes:
+        mbx (Mailboxer): mailbox storage
+        pre (str): qb64 prefix of mailbox owner
+        topics (dict): next ordinal to send keyed by topic such as '/receipt'
+        retry (int): SSE client retry in ms
+        pending (bytearray): pushed SSE frames not yet sent
+        stale (dict): topics to catch up from database in order as keys
+    """
     TimeoutMBX = 30000000
+    MaxChunk = 65536  # max bytes of SSE frames per chunk
+    MaxPending = 1048576  # max bytes of pushed SSE frames held for consumer
 
     def __init__(self, mbx, pre, topics, retry=5000):
         self.mbx = mbx
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.pending = bytearray()
+        self.stale = dict.fromkeys(topics)  # catch up all topics first
+        self.keys = {pre + topic: topic for topic in topics}
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
+        for key in self.keys:
+            self.mbx.hub.subscribe(key, self)
         return self
 
+    def frame(self, on, topic, msg):
+        """
+        Returns:
+            frame (bytes): SSE event of msg at ordinal on of topic
+        """
+        return b"".join((f"id: {on}\nevent: {topic}\nretry: {self.retry}\ndata: ".encode("utf-8"),
+                         msg, b"\n\n"))
+
+    def wake(self, key, on, msg):
+        """
+        Push msg stored at ordinal on of key onto pending frames unless
+        topic is being caught up from the database or pending is full.
+
+        Parameters:
+            key (str): full topic of pre such as 'pre/receipt'
+            on (int): ordinal of message at topic
+            msg (bytes): serialized message
+        """
+        topic = self.keys[key]
+        if topic in self.stale or on < self.topics[topic]:
+            return
+
+        frame = self.frame(on, topic, msg)
+        if len(self.pending) + len(frame) > self.MaxPending:  # slow consumer
+            self.stale[topic] = None
+            return
+
+        self.pending.extend(frame)
+        self.topics[topic] = on + 1
+
+    def close(self):
+        """Unsubscribe from mailbox hub"""
+        for key in self.keys:
+            self.mbx.hub.unsubscribe(key, self)
+
     def __next__(self):
         if self.end - self.start < self.TimeoutMBX:
             if self.start == self.end:
                 self.end = time.perf_counter()
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
-            data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
-                    data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
-                                          .encode("utf-8")))
-                    data.extend(msg)
-                    data.extend(b'\n\n')
-                    idx = idx + 1
-                    self.start = time.perf_counter()
-
+            data = self.pending[:self.MaxChunk]
+            del self.pending[:self.MaxChunk]
+            while self.stale and len(data) < self.MaxChunk:
+                topic = next(iter(self.stale))
+                idx = self.topics[topic]
+                for fn, _, msg in self.mbx.cloneTopicIter(self.pre + topic, idx):
+                    data.extend(self.frame(fn, topic, msg))
+                    idx = fn + 1  # pruned messages leave gaps in ordinals
+                    if len(data) >= self.MaxChunk:
+                        break
+                else:
+                    del self.stale[topic]  # caught up so pushed from now on
                 self.topics[topic] = idx
+
+            if data:
+                self.start = time.perf_counter()
             self.end = time.perf_counter()
             return data
 
+        self.close()
         raise StopIteration
 
 
@@ -1281,21 +1348,21 @@ class QueryEnd:
 
             sn = req.get_param_as_int("sn")
             vrsn = self.hab.kevers[pre].serder.pvrsn if pre in self.hab.kevers else Version
-            if sn is not None: ## query for event with seq-num >= sn
-                dig = self.hab.db.kels.getLast(keys=pre, on=sn)
-                if dig is None:
-                    raise falcon.HTTPBadRequest(description=f"non-existant event at seq-num {sn}")
-                for dig in self.hab.db.kels.getAllIter(keys=pre, on=sn):
-                    try:
-                        dig = dig.encode("utf-8")
-                        msg = self.hab.db.cloneEvtMsg(pre=pre, fn=0, dig=dig, version=vrsn)
-                    except Exception:
-                        continue  # skip this event
-                    evnts.extend(msg)
-            else:
-                for msg in self.hab.db.clonePreIter(pre=pre, version=vrsn):
-                    evnts.extend(msg)
-
+            with self.hab.db.reading():  # consistent snapshot of KEL
+                if sn is not None: ## query for event with seq-num >= sn
+                    dig = self.hab.db.kels.getLast(keys=pre, on=sn)
+                    if dig is None:
+                        raise falcon.HTTPBadRequest(description=f"non-existant event at seq-num {sn}")
+                    for dig in self.hab.db.kels.getAllIter(keys=pre, on=sn):
+                        try:
+                            dig = dig.encode("utf-8")
+                            msg = self.hab.db.cloneEvtMsg(pre=pre, fn=0, dig=dig, version=vrsn)
+                        except Exception:
+                            continue  # skip this event
+                        evnts.extend(msg)
+                else:
+                    for msg in self.hab.db.clonePreIter(pre=pre, version=vrsn):
+                        evnts.extend(msg)
 
             rep.set_header('Content-Type', CESR_CONTENT_TYPE)
             rep.status = falcon.HTTP_200
@@ -1309,15 +1376,16 @@ class QueryEnd:
                 raise falcon.HTTPBadRequest(description="Either 'reg' or 'vcid' query param is required for TEL query")
 
             evnts = bytearray()
-            if regk is not None:
-                cloner = self.reger.clonePreIter(pre=regk)
-                for msg in cloner:
-                    evnts.extend(msg)
-
-            if vcid is not None:
-                cloner = self.reger.clonePreIter(pre=vcid)
-                for msg in cloner:
-                    evnts.extend(msg)
+            with self.reger.reading():  # consistent snapshot of TELs
+                if regk is not None:
+                    cloner = self.reger.clonePreIter(pre=regk)
+                    for msg in cloner:
+                        evnts.extend(msg)
+
+                if vcid is not None:
+                    cloner = self.reger.clonePreIter(pre=vcid)
+                    for msg in cloner:
+                        evnts.extend(msg)
 
             rep.set_header('Content-Type', CESR_CONTENT_TYPE)
             rep.status = falcon.HTTP_200
@@ -3,6 +3,7 @@
 keri.app.notifying module
 
 """
+import base64
 import os
 from collections.abc import Iterable
 from typing import Union, Type
@@ -207,6 +208,13 @@ class Noter(LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Attributes:
+        notes (DicterSuber): notices keyed by (datetime, rid)
+        nidx (Suber): datetime of notice keyed by rid
+        ncigs (CesrSuber): signature of notice keyed by rid
+        ncnts (Suber): count of read and unread notices keyed by 'read' and
+            'unread'. Updated in the same transaction as the notices.
+
     """
     TailDirPath = os.path.join("keri", "not")
     AltTailDirPath = os.path.join(".keri", "not")
@@ -224,6 +232,7 @@ class Noter(LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.ncnts = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -238,9 +247,37 @@ class Noter(LMDBer):
         self.notes = DicterSuber(db=self, subkey='nots.', sep='/', klas=Notice)
         self.nidx = Suber(db=self, subkey='nidx.')
         self.ncigs = CesrSuber(db=self, subkey='ncigs.', klas=Cigar)
+        self.ncnts = Suber(db=self, subkey='ncnts.')
+
+        if not self.readonly and self.ncnts.get(keys=("unread",)) is None:  # created before counts
+            self.recount()
 
         return self.env
 
+    def recount(self):
+        """
+        Recount read and unread notes with one scan of all notes
+        """
+        cnts = {"read": 0, "unread": 0}
+        with self.batch():
+            for _, note in self.notes.getTopItemIter():
+                cnts["read" if note.read else "unread"] += 1
+            for key, cnt in cnts.items():
+                self.ncnts.pin(keys=(key,), val=str(cnt))
+
+    def _count(self, read, delta):
+        """
+        Adjust count of read or unread notes by delta. Call inside .batch
+        so count changes commit with the notes they count.
+
+        Parameters:
+            read (bool): True means adjust read count, False unread count
+            delta (int): change in count
+        """
+        key = "read" if read else "unread"
+        cnt = int(self.ncnts.get(keys=(key,)) or 0) + delta
+        self.ncnts.pin(keys=(key,), val=str(max(cnt, 0)))
+
     def add(self, note, cigar):
         """
         Adds note to database, keyed by the datetime and said of the note.
@@ -252,12 +289,14 @@ class Noter(LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is not None:
-            return False
+        with self.batch():
+            if self.nidx.get(keys=(rid,)) is not None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self._count(note.read, 1)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -270,12 +309,17 @@ class Noter(LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
-            return False
+        with self.batch():
+            if (odt := self.nidx.get(keys=(rid,))) is None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            if (old := self.notes.get(keys=(odt, rid))) is not None:
+                self._count(old.read, -1)
+            self._count(note.read, 1)
+
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def get(self, rid):
         """
@@ -307,31 +351,43 @@ class Noter(LMDBer):
         Returns:
             bool:  True if deleted
         """
-        res = self.get(rid)
-        if res is None:
-            return False
+        with self.batch():
+            res = self.get(rid)
+            if res is None:
+                return False
 
-        note, _ = res
-        dt = note.datetime
-        rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+            note, _ = res
+            dt = note.datetime
+            rid = note.rid
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            self._count(note.read, -1)
+            return self.notes.rem(keys=(dt, rid))
 
-    def getNoteCnt(self):
+    def getNoteCnt(self, read=None):
         """
-        Return count over the all Notes
+        Return count over the all Notes or of read or unread notes
+
+        Parameters:
+            read (bool | None): True means count of read notes, False means
+                count of unread notes, None means count of all notes
 
         Returns:
-            int: count of all items
+            int: count of items
 
         """
-        return self.notes.cntAll()
+        if read is None:
+            return self.notes.cntAll()
+        return int(self.ncnts.get(keys=("read" if read else "unread",)) or 0)
 
     def getNotes(self, start=0, end=25):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
 
+        Skips the notes before start by cursor steps without deserializing
+        them and reads all notes and cigars in one read transaction. Prefer
+        .getNotePage for paging deep into large lists of notes.
+
         Parameters:
             start (int): number of item to start
             end (int): number of last item to return
@@ -341,22 +397,68 @@ class Noter(LMDBer):
             start = start.isoformat()
 
         notes = []
-        it = self.notes.getTopItemIter(keys=())
+        with self.reading(), self._begin(db=self.notes.sdb) as txn:
+            cursor = txn.cursor()
+            if not cursor.first():
+                return notes
+
+            # Run off the items before start
+            for _ in range(start):
+                if not cursor.next():
+                    return notes
+
+            for _, val in cursor.iternext():
+                note = Notice(raw=bytes(val))
+                cig = self.ncigs.get(keys=(note.rid,))
+                notes.append((note, cig))
+                if (not end == -1) and len(notes) == (end - start) + 1:
+                    break
 
-        # Run off the items before start
-        for _ in range(start):
-            try:
-                next(it)
-            except StopIteration:
-                break
+        return notes
 
-        for ((_, _), note) in it:
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if (not end == -1) and len(notes) == (end - start) + 1:
-                break
+    def getNotePage(self, cursor="", limit=25):
+        """
+        Returns page of notes after cursor in (datetime, rid) order and the
+        cursor of the next page. Seeks directly to the cursor position so
+        cost of a page is independent of how deep it is in the list. Notes
+        and cigars are read in one read transaction.
 
-        return notes
+        Parameters:
+            cursor (str): opaque cursor returned with previous page.
+                Empty means first page
+            limit (int): maximum number of notes in page
+
+        Returns:
+            tuple: (notes, cursor) where notes is list of (note, cigar) tuples
+                and cursor is opaque cursor of next page or empty str when
+                there are no more notes
+
+        Raises:
+            ValueError: when cursor is not a valid cursor
+        """
+        try:
+            after = base64.urlsafe_b64decode(cursor.encode()) if cursor else b""
+        except (ValueError, TypeError) as ex:
+            raise ValueError(f"Invalid notes cursor={cursor}") from ex
+
+        notes = []
+        key = b""
+        with self.reading(), self._begin(db=self.notes.sdb) as txn:
+            cur = txn.cursor()
+            if not cur.set_range(after):
+                return notes, ""
+
+            for ckey, val in cur.iternext():
+                ckey = bytes(ckey)
+                if ckey == after:  # last note of previous page
+                    continue
+                if len(notes) == limit:
+                    return notes, base64.urlsafe_b64encode(key).decode()
+                note = Notice(raw=bytes(val))
+                notes.append((note, self.ncigs.get(keys=(note.rid,))))
+                key = ckey
+
+        return notes, ""
 
 
 class Notifier:
@@ -473,15 +575,19 @@ class Notifier:
 
         return False
 
-    def getNoteCnt(self):
+    def getNoteCnt(self, read=None):
         """
-        Return count over the all Notes
+        Return count over the all Notes or of read or unread notes
+
+        Parameters:
+            read (bool | None): True means count of read notes, False means
+                count of unread notes, None means count of all notes
 
         Returns:
-            int: count of all items
+            int: count of items
 
         """
-        return self.noter.getNoteCnt()
+        return self.noter.getNoteCnt(read=read)
 
     def getNotes(self, start=0, end=24):
         """
@@ -493,6 +599,32 @@ class Notifier:
 
         """
         notesigs = self.noter.getNotes(start, end)
+        return self._verified(notesigs)
+
+    def getNotePage(self, cursor="", limit=25):
+        """
+        Returns page of notes after cursor and the cursor of the next page
+
+        Parameters:
+            cursor (str): opaque cursor returned with previous page.
+                Empty means first page
+            limit (int): maximum number of notes in page
+
+        Returns:
+            tuple: (notes, cursor) where notes is list of Notice and cursor is
+                opaque cursor of next page or empty str when no more notes
+
+        """
+        notesigs, cursor = self.noter.getNotePage(cursor=cursor, limit=limit)
+        return self._verified(notesigs), cursor
+
+    def _verified(self, notesigs):
+        """
+        Returns list of notes of (note, cigar) tuples after verifying cigars
+
+        Raises:
+            ValidationError: when note stored without valid signature
+        """
         notes = []
         for note, cig in notesigs:
             if not self.hby.signator.verify(ser=note.raw, cigar=cig):
@@ -4,6 +4,8 @@ keri.app.storing module
 
 """
 
+import weakref
+
 from hio.base import doing
 from hio.help import decking, ogler
 from ordered_set import OrderedSet as oset
@@ -11,15 +13,76 @@ from ordered_set import OrderedSet as oset
 from .forwarding import Poster
 
 from ..core import SerderKERI, MtrDex, Diger, Prefixer
-from ..db import LMDBer, OnSuber, Suber
+from ..db import LMDBer, OnSuber, Suber, Komer, koming
+from ..help import helping
+from ..kering import ConfigurationError
+from ..recording import MailboxPolicyRecord, MailboxStatsRecord
 
 logger = ogler.getLogger()
 
 
+class MailboxHub:
+    """
+    MailboxHub wakes the mailbox streams subscribed to a topic when a message
+    is stored at that topic so idle streams never rescan their topics.
+    Streams are held weakly so abandoned streams unsubscribe themselves.
+
+    Attributes:
+        subs (dict): WeakSet of subscribed streams keyed by topic str such as
+            'pre/receipt'. Each stream has a .wake(topic, on, msg) method
+    """
+
+    def __init__(self):
+        self.subs = dict()
+
+    def subscribe(self, topic, stream):
+        """
+        Subscribe stream to messages stored at topic
+
+        Parameters:
+            topic (str): full topic such as 'pre/receipt'
+            stream (any): has .wake(topic, on, msg) method
+        """
+        self.subs.setdefault(topic, weakref.WeakSet()).add(stream)
+
+    def unsubscribe(self, topic, stream):
+        """
+        Unsubscribe stream from messages stored at topic
+
+        Parameters:
+            topic (str): full topic such as 'pre/receipt'
+            stream (any): subscribed stream
+        """
+        if (streams := self.subs.get(topic)) is not None:
+            streams.discard(stream)
+            if not streams:
+                del self.subs[topic]
+
+    def notify(self, topic, on, msg):
+        """
+        Wake each stream subscribed to topic with the stored message
+
+        Parameters:
+            topic (str | bytes): full topic such as 'pre/receipt'
+            on (int): ordinal of message at topic
+            msg (bytes): serialized message
+        """
+        if not self.subs:
+            return
+        if isinstance(topic, bytes):
+            topic = topic.decode()
+        for stream in list(self.subs.get(topic, ())):
+            stream.wake(topic, on, msg)
+
+
 class Mailboxer(LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Messages are pruned from topics by .compact per the retention policy of
+    each topic in .pols. Message bodies are reference counted in .refs so a
+    body is removed from .msgs once no topic index entry refers to it.
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
@@ -44,9 +107,25 @@ class Mailboxer(LMDBer):
         and the value is the serialized messag itself.
         Multiple messages can share the same topic but with a different ordinal.
 
+        Bookkeeping for retention is in .tdts, .refs, .stts and .pols.
+        Each .tdts entry has the same key as its .tpcs entry and its val is
+        the time in ms since epoch the message was stored at topic.
+        Each .refs key is a msg digest and its val the count of .tpcs
+        entries that refer to the message.
+        Each .stts key is a topic and its val the MailboxStatsRecord of topic.
+        Each .pols key is a topic, topic name or '~' and its val the
+        MailboxPolicyRecord applied to matching topics.
+
+        Streams subscribe to topics in .hub to be woken by .storeMsg.
+
         """
+        self.hub = MailboxHub()
         self.tpcs = None
         self.msgs = None
+        self.tdts = None
+        self.refs = None
+        self.stts = None
+        self.pols = None
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -59,17 +138,83 @@ class Mailboxer(LMDBer):
         super(Mailboxer, self).reopen(**kwa)
         self.tpcs = OnSuber(db=self, subkey='tpcs.')
         self.msgs = Suber(db=self, subkey='msgs.')  # key states
+        self.tdts = OnSuber(db=self, subkey='tdts.')
+        self.refs = Suber(db=self, subkey='refs.')
+        self.stts = Komer(db=self, subkey='stts.', klas=MailboxStatsRecord,
+                          kind=koming.Packed)
+        self.pols = Komer(db=self, subkey='pols.', klas=MailboxPolicyRecord,
+                          kind=koming.Packed)
+
+        if (not self.readonly and next(self.stts.getTopItemIter(), None) is None
+                and next(self.tpcs.getAllItemIter(), None) is not None):
+            self.recount()  # created before stats
 
         return self.env
 
+    def recount(self, now=None):
+        """
+        Rebuild message reference counts and topic stats with one scan of the
+        topic index. Index entries without a stored time are stamped now.
+
+        Parameters:
+            now (int | None): time in ms since epoch. None means current time
+        """
+        now = now if now is not None else helping.epochMs(helping.nowIso8601())
+        refs = {}
+        stats = {}
+        with self.batch():
+            for keys, on, dig in self.tpcs.getAllItemIter():
+                topic = self.tpcs.sep.join(keys)
+                refs[dig] = refs.get(dig, 0) + 1
+                msg = self.msgs.get(keys=dig)
+                sts = stats.setdefault(topic, MailboxStatsRecord())
+                sts.cnt += 1
+                sts.size += len(msg.encode()) if msg is not None else 0
+                sts.nxt = on + 1
+                if self.tdts.get(keys=topic, on=on) is None:
+                    self.tdts.put(keys=topic, on=on, val=str(now))
+
+            self.refs.trim()
+            self.stts.trim()
+            for dig, cnt in refs.items():
+                self.refs.pin(keys=dig, val=str(cnt))
+            for topic, sts in stats.items():
+                self.stts.pin(keys=topic, val=sts)
+
     def delTopic(self, key, on=0):
-        """Removes topic index from .tpcs without deleting message from .msgs
+        """Removes topic index from .tpcs and removes message from .msgs
+        once no other topic index refers to it.
 
         Returns:
             result (boo): True if full key consisting of key and serialized on
                 exists in database so removed. False otherwise (not removed).
         """
-        return self.tpcs.rem(keys=key, on=on)
+        with self.batch():
+            if (dig := self.tpcs.get(keys=key, on=on)) is None:
+                return False
+            msg = self.msgs.get(keys=dig)
+            self._unindex(key, on, dig, len(msg.encode()) if msg is not None else 0)
+            return True
+
+    def _unindex(self, topic, on, dig, size):
+        """
+        Remove topic index entry at on for message with digest dig of size
+        bytes, decrement its reference count and update topic stats. Removes
+        message body when no references remain. Call inside .batch.
+        """
+        self.tpcs.rem(keys=topic, on=on)
+        self.tdts.rem(keys=topic, on=on)
+        cnt = int(self.refs.get(keys=dig) or 0) - 1
+        if cnt > 0:
+            self.refs.pin(keys=dig, val=str(cnt))
+        else:
+            self.refs.rem(keys=dig)
+            self.msgs.rem(keys=dig)
+
+        if (sts := self.stts.get(keys=topic)) is not None:
+            sts.cnt = max(sts.cnt - 1, 0)
+            sts.size = max(sts.size - size, 0)
+            self.stts.pin(keys=topic, val=sts)
 
     def appendToTopic(self, topic, val):
         """Appends val to end of db entries with same topic but with on
@@ -106,10 +251,10 @@ class Mailboxer(LMDBer):
         return msgs
 
 
-    def storeMsg(self, topic, msg):
+    def storeMsg(self, topic, msg, now=None):
         """
         Add exn event to mailbox topic and on that is 1 greater than last msg
-        at topic.
+        ever stored at topic.
 
         Returns:
             result (bool): True if msg successfully stored and indexed at topic
@@ -119,14 +264,30 @@ class Mailboxer(LMDBer):
             topic (str | bytes):  topic (Option(bytes|str)): key prefix combined
                 with serialized on to form full actual key.
             msg (bytes): serialized message
+            now (int | None): time stored in ms since epoch. None means
+                current time
 
         """
         if hasattr(msg, "encode"):
             msg = msg.encode("utf-8")
 
+        now = now if now is not None else helping.epochMs(helping.nowIso8601())
         digb = Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        on = self.tpcs.append(keys=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.batch():
+            sts = self.stts.get(keys=topic) or MailboxStatsRecord()
+            on = sts.nxt
+            if not self.tpcs.put(keys=topic, on=on, val=digb):
+                return False
+            self.tdts.pin(keys=topic, on=on, val=str(now))
+            self.refs.pin(keys=digb, val=str(int(self.refs.get(keys=digb) or 0) + 1))
+            self.msgs.put(keys=digb, val=msg)
+            sts.cnt += 1
+            sts.size += len(msg)
+            sts.nxt = on + 1
+            self.stts.pin(keys=topic, val=sts)
+
+        self.hub.notify(topic, on, msg)
+        return True
 
 
     def cloneTopicIter(self, topic, fn=0):
@@ -152,6 +313,153 @@ class Mailboxer(LMDBer):
             if msg := self.msgs.get(keys=dig):
                 yield (on, topic, msg.encode("utf-8"))
 
+    def setPolicy(self, policy, topic="~"):
+        """
+        Set retention policy for topic.
+
+        Parameters:
+            policy (MailboxPolicyRecord): limits to enforce
+            topic (str): full topic such as 'pre/receipt', topic name such as
+                'receipt' or '~' for the default of all topics
+        """
+        self.pols.pin(keys=topic, val=policy)
+
+    def getPolicy(self, topic):
+        """
+        Returns:
+            policy (MailboxPolicyRecord | None): retention policy of topic
+                from full topic, else topic name, else default. None when
+                topic has no policy
+
+        Parameters:
+            topic (str | bytes): full topic such as 'pre/receipt'
+        """
+        if isinstance(topic, bytes):
+            topic = topic.decode()
+        if (policy := self.pols.get(keys=topic)) is not None:
+            return policy
+        if "/" in topic and (policy := self.pols.get(keys=topic.rsplit("/", 1)[1])) is not None:
+            return policy
+        return self.pols.get(keys="~")
+
+    def getTopicStats(self, topic):
+        """
+        Returns:
+            stats (MailboxStatsRecord | None): storage stats of topic. None
+                when nothing ever stored at topic
+
+        Parameters:
+            topic (str | bytes): full topic such as 'pre/receipt'
+        """
+        return self.stts.get(keys=topic)
+
+    def getStatsIter(self):
+        """
+        Returns:
+            items (Iterator[(str, MailboxStatsRecord)]): topic and storage
+                stats of each topic
+        """
+        for keys, sts in self.stts.getTopItemIter():
+            yield (self.stts.sep.join(keys), sts)
+
+    def compact(self, now=None):
+        """
+        Prune oldest messages from each topic until the topic satisfies its
+        retention policy. Messages older than policy age are pruned and then
+        oldest messages until count and size are within policy. Pruning only
+        drops the front of a topic so ordinals of kept messages and the next
+        ordinal are unchanged.
+
+        Returns:
+            pruned (int): number of topic index entries removed
+
+        Parameters:
+            now (int | None): time in ms since epoch. None means current time
+        """
+        now = now if now is not None else helping.epochMs(helping.nowIso8601())
+        pruned = 0
+        for topic, sts in list(self.getStatsIter()):
+            if not sts.cnt or (policy := self.getPolicy(topic)) is None:
+                continue
+
+            cnt, size = sts.cnt, sts.size
+            doomed = []
+            for _, on, dig in self.tpcs.getAllItemIter(keys=topic):
+                msg = self.msgs.get(keys=dig)
+                mize = len(msg.encode()) if msg is not None else 0
+                if not ((policy.cnt and cnt > policy.cnt)
+                        or (policy.size and size > policy.size)
+                        or (policy.age and int(self.tdts.get(keys=topic, on=on) or now) < now - policy.age)):
+                    break
+                doomed.append((on, dig, mize))
+                cnt -= 1
+                size -= mize
+
+            if doomed:
+                with self.batch():
+                    for on, dig, mize in doomed:
+                        self._unindex(topic, on, dig, mize)
+                pruned += len(doomed)
+
+        return pruned
+
+
+class MailboxCompactor(doing.Doer):
+    """
+    MailboxCompactor runs Mailboxer.compact every tock seconds to enforce the
+    retention policies of mailbox topics in the background.
+
+    Policies come from the 'mailbox' section of configuration, for example::
+
+        "mailbox": {
+            "policies": {
+                "~": {"age": 604800000, "size": 16777216},
+                "receipt": {"cnt": 1000}
+            }
+        }
+
+    Each key is a full topic, topic name or '~' and each value the fields of
+    a MailboxPolicyRecord. Configured policies replace stored ones on start.
+    When there is neither a configured nor a stored '~' policy, DefaultPolicy
+    is set as '~' so that every mailbox is bounded.
+
+    Attributes:
+        mbx (Mailboxer): mailbox storage to compact
+        pruned (int): total topic index entries pruned
+    """
+
+    DefaultPolicy = MailboxPolicyRecord(age=7 * 24 * 60 * 60 * 1000,  # one week
+                                        size=16 * 1024 * 1024)  # 16 MiB
+
+    def __init__(self, mbx, cf=None, tock=60.0, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox storage to compact
+            cf (Configer | None): configuration with optional 'mailbox' section
+            tock (float): seconds between compactions
+        """
+        super(MailboxCompactor, self).__init__(tock=tock, **kwa)
+        self.mbx = mbx
+        self.pruned = 0
+
+        config = cf.get() if cf is not None else {}
+        policies = config.get("mailbox", {}).get("policies", {})
+        for topic, fields in policies.items():
+            try:
+                policy = MailboxPolicyRecord(**fields)
+                if min(policy.age, policy.cnt, policy.size) < 0:
+                    raise ValueError("limits must be >= 0")
+            except (TypeError, ValueError) as ex:
+                raise ConfigurationError(f"Invalid mailbox policy for {topic}, {fields}: {ex}")
+            self.mbx.setPolicy(policy, topic=topic)
+
+        if self.mbx.pols.get(keys="~") is None:
+            self.mbx.setPolicy(self.DefaultPolicy)
+
+    def recur(self, tyme):
+        """Compacts mailbox. Never done"""
+        self.pruned += self.mbx.compact()
+        return False
 
 
 class Respondant(doing.DoDoer):
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from hio.base import doing
 from hio.help import decking, ogler
+from ordered_set import OrderedSet as oset
 
 logger = ogler.getLogger()
 
@@ -50,6 +51,11 @@ class Adjudicator:
     Consumers of the Adjudicator's cues are safe to retrieve new key state from one of the Watchers listed in the
     cue of `keyStateUpdated` is received.  All other kins require controller intervention and should be bubbled up.
 
+    The Adjudicator keeps an in memory table of the latest key state reported by each watcher of each watched AID.
+    It observes the database of hab so Kevery updates the table as key state notices from watchers and watched AID
+    changes are saved. Watched AIDs added with .monitor are adjudicated again only when their table entries or
+    their local key state change and a cue is sent only when the result of adjudication changes.
+
     """
 
     def __init__(self, hby, hab, msgs=None, cues=None):
@@ -66,22 +72,37 @@ class Adjudicator:
         self.hab = hab
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.watchers = None  # sets of enabled watchers keyed by watched AID, loaded on first use
+        self.table = dict()  # latest (sn, dig) keyed by watcher keyed by watched AID
+        self.toads = dict()  # thresholds keyed by monitored watched AID
+        self.wakes = oset()  # monitored watched AIDs with changed table entries
+        self.last = dict()  # last cue keyed by monitored watched AID
+        self.hab.db.observers.add(self)
 
     def performAdjudications(self):
-        """ Process loop of existing messages requesting key state adjudication """
+        """ Process loop of existing messages requesting key state adjudication and of monitored watched AIDs
+        whose watcher or local key state changed """
         while self.msgs:
             msg = self.msgs.pull()
 
             watched = msg["oid"]
             toad = msg["toad"] if "toad" in msg else None
 
-            self.adjudicate(watched, toad)
+            if msg.get("monitor"):
+                self.monitor(watched, toad)
+            else:
+                self.adjudicate(watched, toad)
+
+        wakes, self.wakes = self.wakes, oset()
+        for watched in wakes:
+            self.review(watched)
 
     def adjudicate(self, watched, toad=None):
         """ Perform key state adjudication against the `watched` AID and provided threshold
 
         If `toad` is not provided, the full set of watchers must come to consensus before `keyStateUpdate`
-        will be reported.
+        will be reported.  Reloads the latest watcher key states of `watched` from the database and always
+        sends a cue.
 
         Parameters:
             watched (str): qb64 AID to adjudicate for key state duplicity
@@ -89,37 +110,176 @@ class Adjudicator:
 
 
         """
-        watchers = set()
-        for (cid, aid, oid), observed in self.hab.db.obvs.getTopItemIter(keys=(self.hab.pre,)):
-            if observed.enabled and oid == watched:
-                watchers.add(aid)
+        self.load(watched)
+        cue = self.judge(watched, toad)
+        if watched in self.toads:
+            self.last[watched] = cue
+        self.report(cue, toad)
+
+    def monitor(self, watched, toad=None):
+        """ Adjudicate `watched` now and again each time its watcher key state changes
+
+        Parameters:
+            watched (str): qb64 AID to adjudicate for key state duplicity
+            toad (int): threshold of acceptable duplicity amongst available watchers
+
+        """
+        self.toads[watched] = toad
+        self.last.pop(watched, None)
+        self.load(watched)
+        self.review(watched)
+
+    def ignore(self, watched):
+        """ Stop monitoring `watched` and drop its watcher key states from the table
+
+        Parameters:
+            watched (str): qb64 AID to stop adjudicating
+        """
+        self.toads.pop(watched, None)
+        self.last.pop(watched, None)
+        self.table.pop(watched, None)
+        self.wakes.discard(watched)
+
+    def review(self, watched):
+        """ Adjudicate monitored `watched` from the table and send a cue only when the result changed
+
+        Parameters:
+            watched (str): qb64 AID to adjudicate for key state duplicity
+
+        """
+        toad = self.toads[watched]
+        try:
+            cue = self.judge(watched, toad)
+        except ValueError as ex:
+            logger.error(f"Unable to adjudicate {watched}: {ex}")
+            return
+
+        if cue != self.last.get(watched):
+            self.last[watched] = cue
+            self.report(cue, toad)
+
+    def keyStateSaved(self, aid, ksr):
+        """ Update table with key state notice from `aid` saved by Kevery
+
+        Parameters:
+            aid (str): qb64 AID of source of key state notice
+            ksr (KeyStateRecord): saved key state
+        """
+        watched = ksr.i
+        if watched not in self.table or aid not in self.watchersOf(watched):
+            return
+
+        self.table[watched][aid] = (int(ksr.s, 16), ksr.d)
+        if watched in self.toads:
+            self.wakes.add(watched)
+
+    def keyStateUpdated(self, pre):
+        """ Mark monitored `pre` for review after Kever accepted an event into its local KEL
+
+        Parameters:
+            pre (str): qb64 AID whose local key state changed
+        """
+        if pre in self.toads:
+            self.wakes.add(pre)
+
+    def watchedUpdated(self, cid, aid, oid, enabled):
+        """ Update watcher sets with watched AID `oid` added to or cut from watcher `aid` saved by Kevery
+
+        Parameters:
+            cid (str): qb64 AID of controller of watcher
+            aid (str): qb64 AID of watcher
+            oid (str): qb64 watched AID
+            enabled (bool): True means added, False means cut
+        """
+        if cid != self.hab.pre or self.watchers is None:
+            return
+
+        watchers = self.watchers.setdefault(oid, set())
+        if enabled:
+            watchers.add(aid)
+            if oid in self.table:
+                self.loadState(oid, aid)
+        else:
+            watchers.discard(aid)
+            if oid in self.table:
+                self.table[oid].pop(aid, None)
+
+        if oid in self.toads:
+            self.wakes.add(oid)
+
+    def watchersOf(self, watched):
+        """ Returns set of enabled watchers of `watched`. Loads the watchers of all watched AIDs of hab
+        with one scan of the database on first use
+
+        Parameters:
+            watched (str): qb64 watched AID
+        """
+        if self.watchers is None:
+            self.watchers = dict()
+            for (cid, aid, oid), observed in self.hab.db.obvs.getTopItemIter(keys=(self.hab.pre,)):
+                if observed.enabled:
+                    self.watchers.setdefault(oid, set()).add(aid)
+
+        return self.watchers.get(watched, set())
+
+    def load(self, watched):
+        """ Load table entries of `watched` with latest key state of each of its watchers from the database
 
+        Parameters:
+            watched (str): qb64 watched AID
+        """
+        self.table[watched] = dict()
+        for watcher in self.watchersOf(watched):
+            self.loadState(watched, watcher)
+
+    def loadState(self, watched, watcher):
+        """ Load table entry of `watched` for `watcher` from the database
+
+        Parameters:
+            watched (str): qb64 watched AID
+            watcher (str): qb64 AID of watcher
+        """
+        saider = self.hab.db.knas.get(keys=(watched, watcher))
+        if saider is None or (ksn := self.hab.db.ksns.get(keys=(saider.qb64,))) is None:
+            logger.info(f"No key state from watcher {watcher} for {watched}")
+            self.table[watched].pop(watcher, None)
+            return
+
+        self.table[watched][watcher] = (int(ksn.s, 16), ksn.d)
+
+    def judge(self, watched, toad=None):
+        """ Returns cue from adjudication of table entries of `watched` against local key state
+
+        Parameters:
+            watched (str): qb64 AID to adjudicate for key state duplicity
+            toad (int): threshold of acceptable duplicity amongst available watchers
+
+        """
+        watchers = set(self.watchersOf(watched))
         toad = int(toad) if toad else len(watchers)
         if toad > len(watchers):
             raise ValueError(f"Threshold of {toad} is greater than number watchers {len(watchers)}")
 
+        if watched not in self.hab.kevers:
+            raise ValueError(f"Unknown AID {watched} has no local key state")
+
+        kever = self.hab.kevers[watched]
+        mysn, mydig = kever.sner.num, kever.serder.said
         states = []
-        mystate = self.hab.kevers[watched].state()
-        for watcher in watchers:
-            saider = self.hab.db.knas.get(keys=(watched, watcher))
-            if saider is None:
-                logger.info(f"No key state from watcher {watcher} for {watched}")
+        row = self.table.get(watched, {})
+        for watcher in sorted(watchers):
+            if (entry := row.get(watcher)) is None:
                 continue
 
-            ksn = self.hab.db.ksns.get(keys=(saider.qb64,))
-            states.append(diffState(watcher, mystate, ksn))
+            sn, dig = entry
+            states.append(DiffState(watched, watcher, compareState(mysn, mydig, sn, dig), sn, dig))
 
         dups = [state for state in states if state.state == States.duplicitous]
         ahds = [state for state in states if state.state == States.ahead]
         bhds = [state for state in states if state.state == States.behind]
 
         if len(dups) > 0:
-            cue = dict(kin="keyStateDuplicitous", cid=self.hab.pre, oid=watched, wids=watchers, dups=dups)
-            self.cues.append(cue)
-
-            logger.error(f"Duplicity detected for AID {watched}, local key state remains intact.")
-            for state in dups:
-                logger.error(f"\tWatcher {state.wit} at seq No. {state.sn} with digest: {state.dig}")
+            return dict(kin="keyStateDuplicitous", cid=self.hab.pre, oid=watched, wids=watchers, dups=dups)
 
         elif len(ahds) > 0:
             # Only group habs can be behind their watchers
@@ -127,37 +287,59 @@ class Adjudicator:
             # super majority)
             digs = set([state.dig for state in ahds])
             if len(digs) > 1:  # Duplicity across watcher sets
-                cue = dict(kin="keyStateDuplicitous", cid=self.hab.pre, oid=watched, wids=watchers, dups=ahds)
-                self.cues.append(cue)
-
-                logger.error(f"There are multiple duplicitous events on watcher for {watched}")
-                for state in ahds:
-                    logger.error(f"\tWatcher {state.wit} at seq No. {state.sn} with digest: {state.dig}")
+                return dict(kin="keyStateDuplicitous", cid=self.hab.pre, oid=watched, wids=watchers, dups=ahds)
 
             elif len(ahds) >= toad:  # all witnesses that are ahead agree on the event
-                logger.info(f"Threshold ({toad}) satisfying number of watchers ({len(ahds)}) are ahead")
-                for state in ahds:
-                    logger.info(f"\tWatcher {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
-
                 state = random.choice(ahds)
-                cue = dict(kin="keyStateUpdate", cid=self.hab.pre, oid=watched, wids=watchers, sn=state.sn, aheads=ahds)
-                self.cues.append(cue)
+                return dict(kin="keyStateUpdate", cid=self.hab.pre, oid=watched, wids=watchers, sn=state.sn,
+                            aheads=ahds)
+
+            return None  # too few watchers ahead to act on
 
         elif len(bhds) > 0:
-            cue = dict(kin="keyStateLagging", cid=self.hab.pre, oid=watched, wids=watchers, behind=bhds)
-            self.cues.append(cue)
+            return dict(kin="keyStateLagging", cid=self.hab.pre, oid=watched, wids=watchers, behind=bhds)
+
+        return dict(kin="keyStateConsistent", cid=self.hab.pre, oid=watched, wids=watchers, states=states)
+
+    def report(self, cue, toad=None):
+        """ Log adjudication result and send cue if any
+
+        Parameters:
+            cue (dict | None): result of .judge
+            toad (int): threshold of acceptable duplicity amongst available watchers
+        """
+        if cue is None:
+            return
+
+        self.cues.append(cue)
+        kin = cue["kin"]
+        watched = cue["oid"]
+        if kin == "keyStateDuplicitous":
+            dups = cue["dups"]
+            if dups[0].state == States.duplicitous:
+                logger.error(f"Duplicity detected for AID {watched}, local key state remains intact.")
+            else:
+                logger.error(f"There are multiple duplicitous events on watcher for {watched}")
+            for state in dups:
+                logger.error(f"\tWatcher {state.wit} at seq No. {state.sn} with digest: {state.dig}")
+
+        elif kin == "keyStateUpdate":
+            ahds = cue["aheads"]
+            logger.info(f"Threshold ({toad if toad else len(cue['wids'])}) satisfying number of watchers "
+                        f"({len(ahds)}) are ahead")
+            for state in ahds:
+                logger.info(f"\tWatcher {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
 
+        elif kin == "keyStateLagging":
             logger.info("The following watchers are behind the local KEL:")
-            for state in bhds:
+            for state in cue["behind"]:
                 logger.info(f"\tWatcher {state.wit} at seq No. {state.sn} with digest: {state.dig}")
 
             logger.info(f"Recommend the checking those watchers for access to {watched} witnesses")
 
         else:
-            cue = dict(kin="keyStateConsistent", cid=self.hab.pre, oid=watched, wids=watchers, states=states)
-            self.cues.append(cue)
-            logger.info(f"Local key state is consistent with the {len(states)} (out of "
-                        f"{len(watchers)} total) watchers that responded")
+            logger.info(f"Local key state is consistent with the {len(cue['states'])} (out of "
+                        f"{len(cue['wids'])} total) watchers that responded")
 
 
 class AdjudicationDoer(doing.Doer):
@@ -202,20 +384,29 @@ def diffState(wit, preksn, witksn):
     if pre != mypre:
         raise ValueError(f"can't compare key states from different AIDs {mypre}/{pre}")
 
+    return DiffState(pre, wit, compareState(mysn, mydig, sn, dig), sn, dig)
+
+
+def compareState(mysn, mydig, sn, dig):
+    """ Return Stateage state of remote key state at `sn` with `dig` relative to local key state
+
+    Parameters:
+        mysn (int): local sequence number of latest event
+        mydig (str): local digest of latest event
+        sn (int): remote sequence number of latest event
+        dig (str): remote digest of latest event
+
+    """
     # At the same sequence number, check the DIGs
     if mysn == sn:
         if mydig == dig:
-            state = States.even
-        else:
-            state = States.duplicitous
+            return States.even
+        return States.duplicitous
 
     # This witness is behind and will need to be caught up.
     elif mysn > sn:
-        state = States.behind
+        return States.behind
 
     # mysn < witstate.sn - We are behind this witness (multisig or restore situation).
     # Must ensure that controller approves this event or a recovery rotation is needed
-    else:
-        state = States.ahead
-
-    return DiffState(pre, wit, state, sn, dig)
+    return States.ahead
@@ -127,12 +127,12 @@ class JoinDoer(doing.DoDoer):
                         done = yield from self.ipex(exn, pathed)
 
                         if done:
-                            self.notifier.noter.notes.rem(keys=keys)
+                            self.notifier.noter.rem(keys[1])
 
                         else:
                             delete = input(f"\nDelete event [Y|n]? ")
                             if delete in ("Y", "y"):
-                                self.notifier.noter.notes.rem(keys=keys)
+                                self.notifier.noter.rem(keys[1])
                         found = True
             if found:
                 break
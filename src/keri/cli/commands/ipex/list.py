@@ -258,7 +258,7 @@ class ListDoer(doing.DoDoer):
     def deleteNote(self, keys):
         yn = input(f"\n Delete the notification [Y|n]?")
         if yn in ('', 'y', 'Y'):
-            self.notifier.noter.notes.rem(keys=keys)
+            self.notifier.noter.rem(keys[1])
 
 
 def humanResponse(route):
@@ -159,12 +159,12 @@ class JoinDoer(doing.DoDoer):
                     continue
 
             if done:
-                self.notifier.noter.notes.rem(keys=keys)
+                self.notifier.noter.rem(keys[1])
 
             else:
                 delete = input(f"\nDelete event [Y|n]? ")
                 if delete in ("Y", "y"):
-                    self.notifier.noter.notes.rem(keys=keys)
+                    self.notifier.noter.rem(keys[1])
 
             yield self.tock
 
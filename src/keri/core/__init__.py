@@ -9,7 +9,7 @@ from .coring import (sizeify, dumps, loads, MtrDex, SmallVrzDex, LargeVrzDex,
                      LabelDex, PreDex, NonTransDex, PreNonDigDex, Matter,
                      Seqner, Number, Decimer, Dater, Tagger, Ilker, Traitor,
                      Verser, Texter, Bexter, Pather, Labeler, Verfer, Cigar,
-                     Diger, Prefixer, Noncer, Saider, Sadder, Tholder, Dicter,
+                     Diger, Prefixer, Noncer, Saider, Sadder, Tholder, Tally, Dicter,
                      Saids, TraitDex, Versage, Sizage, MapDom, IceMapDom)
 from .counting import (GenDex, ProGen, CtrDex_1_0, CtrDex_2_0, QTDex_1_0,
                        UniDex_1_0, SUDex_1_0, MUDex_1_0, BUDex_1_0, CtrDex_2_0,
@@ -17,16 +17,17 @@ from .counting import (GenDex, ProGen, CtrDex_1_0, CtrDex_2_0, QTDex_1_0,
                        CodeNames, SealDex_2_0, Codens, Codenage, Cizage, Counter)
 from .eventing import (simple, ample, deWitnessCouple, deReceiptCouple,
                        deSourceCouple, deReceiptTriple, deTransReceiptQuadruple,
-                       deTransReceiptQuintuple, verifySigs, validateSigs,
+                       deTransReceiptQuintuple, verifyBatch, verifySigs, validateSigs,
                        state, incept, delcept, rotate, deltate,
                        interact, receipt, query, reply, prod, bare, loadEvent,
-                       exchept, exchange, messagize, Kever, Kevery, LastEstLoc)
+                       exchept, exchange, messagize, Kever, Kevery,
+                       EscrowPruner, LastEstLoc)
 from .indexing import (Indexer, Siger, Xizage, IdrDex, IdxSigDex, IdxCrtSigDex,
                        IdxBthSigDex)
-from .kraming import Kramer, AuthTypes, Pruner
+from .kraming import Kramer, AuthTypes, Pruner, PrefixTrie
 from .mapping import Mapper, EscapeDex, Compactor, Aggor
-from .parsing import Parser
-from .routing import Router, Revery, Route, compile_uri_template
+from .parsing import Parser, Pipeline
+from .routing import Router, Revery, Route, RouteTrie, compile_uri_template
 from .scheming import CacheResolver, JSONSchema, Schemer
 from .serdering import FieldDom, Serdery, Serder, SerderKERI, SerderACDC
 from .signing import (Tiers, Signer, Salter, Cipher, CiXDex,
@@ -4,6 +4,7 @@ keri.core.coring module
 
 """
 import json
+import math
 from collections import namedtuple
 from collections.abc import Sequence, Mapping
 from dataclasses import dataclass, astuple, asdict
@@ -34,7 +35,7 @@ from ..kering import (EmptyMaterialError, RawMaterialError, SoftMaterialError,
 from ..help import (sceil, isNonStringIterable, isNonStringSequence,
                     intToB64, b64ToInt, codeB64ToB2, nabSextets,
                     codeB2ToB64, Reb64, Reatt, Repath,
-                    nowIso8601, fromIso8601)
+                    nowIso8601, fromIso8601, icetuple)
 
 DSS_SIG_MODE = "fips-186-3"
 ECDSA_256r1_SEEDBYTES = 32
@@ -349,7 +350,7 @@ class MatterCodex:
     Decimal_Big_L2: str = '9AAH'  # Decimal B64 string float and int big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(icetuple(self))  # enables inclusion test with "in"
 
 MtrDex = MatterCodex()  # Make instance
 
@@ -369,7 +370,7 @@ class SmallVarRawSizeCodex:
     Lead2: str = '6'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 SmallVrzDex = SmallVarRawSizeCodex()  # Make instance
 
@@ -389,7 +390,7 @@ class LargeVarRawSizeCodex:
     Lead2_Big: str = '9'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 LargeVrzDex = LargeVarRawSizeCodex()  # Make instance
 
@@ -409,7 +410,7 @@ class BextCodex:
     StrB64_Big_L2: str = '9AAA'  # String Base64 Only Big Leader Size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 BexDex = BextCodex()  # Make instance
 
@@ -429,7 +430,7 @@ class TextCodex:
     Bytes_Big_L2: str = '9AAB'  # Byte String big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 TexDex = TextCodex()  # Make instance
 
@@ -449,7 +450,7 @@ class DecimalCodex:
     Decimal_Big_L2: str = '9AAH'  # Decimal B64string float and int big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 DecDex = DecimalCodex()  # Make instance
 
@@ -475,7 +476,7 @@ class DigCodex:
     SHA2_512: str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 DigDex = DigCodex()  # Make instance
 
@@ -502,7 +503,7 @@ class NonceCodex:
     SHA2_512: str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 NonceDex = NonceCodex()  # Make instance
 
@@ -526,7 +527,7 @@ class NumCodex:
     Vast:    str = 'U'  # Vast 17 byte b2 number
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 NumDex = NumCodex()  # Make instance
 
@@ -553,7 +554,7 @@ class TagCodex:
     Tag11: str = 'Z'  # 11 B64 char tag
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 TagDex = TagCodex()  # Make instance
 
@@ -594,7 +595,7 @@ class LabelCodex:
     Bytes_Big_L2: str = '9AAB'  # Byte String big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 LabelDex = LabelCodex()  # Make instance
 
@@ -627,7 +628,7 @@ class PreCodex:
     ECDSA_256r1:   str = "1AAJ"  # ECDSA secp256r1 verification or encryption key, basic derivation
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 PreDex = PreCodex()  # Make instance
 
@@ -645,7 +646,7 @@ class NonTransCodex:
     ECDSA_256r1N: str = "1AAI"  # ECDSA secp256r1 verification key non-transferable, basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 NonTransDex = NonTransCodex()  # Make instance
 
@@ -667,7 +668,7 @@ class PreNonDigCodex:
     ECDSA_256r1:   str = "1AAJ"  # ECDSA secp256r1 verification or encryption key, basic derivation
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 PreNonDigDex = PreNonDigCodex()  # Make instance
 
@@ -730,6 +731,8 @@ class Matter:
         _code (str): value for .code property
         _soft (str): soft value of full code
         _raw (bytes): value for .raw property
+        _memo (list | None): memoized [code, soft, raw, qb64b, qb64, qb2]
+            encodings of ._code, ._soft, ._raw. See ._memoized()
         _rawSize():
         _fullSize():
         _leadSize():
@@ -875,6 +878,7 @@ class Matter:
     Codes = asdict(MtrDex)  # map code name to code
     Names = {val : key for key, val in Codes.items()} # invert map code to code name
     Pad = '_'  # B64 pad char for special codes with xtra size pre-padded soft values
+    _memo = None  # memoized encodings, instance value set lazily by ._memoized
 
     @classmethod
     def _rawSize(cls, code):
@@ -1218,8 +1222,12 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once by ._infil and memoized. See ._memoized()
         """
-        return self._infil()
+        memo = self._memoized()
+        if memo[3] is None:
+            memo[3] = self._infil()
+        return memo[3]
 
 
     @property
@@ -1228,8 +1236,12 @@ class Matter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once from .qb64b and memoized. See ._memoized()
         """
-        return self.qb64b.decode("utf-8")
+        memo = self._memoized()
+        if memo[4] is None:
+            memo[4] = self.qb64b.decode("utf-8")
+        return memo[4]
 
 
     @property
@@ -1237,8 +1249,33 @@ class Matter:
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Computed once by ._binfil and memoized. See ._memoized()
         """
-        return self._binfil()
+        memo = self._memoized()
+        if memo[5] is None:
+            memo[5] = self._binfil()
+        return memo[5]
+
+
+    def _memoized(self):
+        """Memo of encodings for the current ._code, ._soft, and ._raw
+
+        Returns:
+            memo (list): [code, soft, raw, qb64b, qb64, qb2] where any of the
+                encodings is None until first computed.
+
+        The encodings of a primitive are pure functions of its code, soft and
+        raw so are computed lazily once and then reused. The memo is keyed by
+        identity of the ._code, ._soft and ._raw objects so that any rebinding
+        of those (re-extraction or subclass assignment) resets the memo. The
+        memoized values are immutable bytes and str so may be shared safely.
+        """
+        memo = self._memo
+        if (memo is None or memo[0] is not self._code or
+                memo[1] is not self._soft or memo[2] is not self._raw):
+            memo = self._memo = [self._code, self._soft, self._raw,
+                                 None, None, None]
+        return memo
 
 
     @property
@@ -1477,6 +1514,8 @@ class Matter:
         self._code = hard  # hard only str
         self._soft = soft  # soft only str
         self._raw = raw  # ensure bytes for crypto ops, may be empty
+        # seed memo with validated extracted qb64b so not recomputed by ._infil
+        self._memo = [hard, soft, raw, bytes(qb64b), None, None]
 
 
     def _bexfil(self, qb2):
@@ -1564,6 +1603,8 @@ class Matter:
         self._code = hard  # hard only
         self._soft = soft  # soft only may be empty
         self._raw = bytes(raw)  # ensure bytes for crypto ops may be empty
+        # seed memo with validated extracted qb2 so not recomputed by ._binfil
+        self._memo = [hard, soft, self._raw, None, None, bytes(qb2)]
 
 
 class Seqner(Matter):
@@ -4473,6 +4514,8 @@ class Tholder:
     Methods:
         .satisfy returns bool, True means list of verified signature key indices
         satisfies the threshold, False otherwise.
+        .tally returns Tally that incrementally evaluates satisfaction as
+        verified signature key indices are added one at a time.
 
     Static Methods:
         weight (str): converts weight str expression into either int or Fraction
@@ -4490,6 +4533,16 @@ class Tholder:
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
+        ._denom is int common denominator of weights of weighted threshold
+        ._clauses is tuple of compiled clauses of weighted threshold each a
+            pair (bares, nests) where bares is tuple of (mask, weight) of bare
+            weights grouped by weight and nests is tuple of (weight, members)
+            where members is tuple of (mask, weight) of nested weights grouped
+            by weight. Weights are ints scaled by ._denom and each mask has the
+            bits of the key indices with that weight
+        ._spots is tuple indexed by key index of (clause, nest, weight) where
+            nest is offset of nested element in clause or None when bare and
+            weight is scaled int weight of key index
 
 
     """
@@ -4829,6 +4882,54 @@ class Tholder:
         bext = "a".join(["c".join(bc) for bc in ta])
         self._number = None
         self._bexter = Bexter(bext=bext)
+        self._compile(thold=thold)
+
+
+    def _compile(self, thold):
+        """
+        Compile weighted thold into int weights scaled by the common
+        denominator of all weights and bit masks of key indices grouped by
+        weight so that satisfaction is evaluated with int and bit operations.
+
+        Parameters:
+            thold (list): clauses of Fractions or tuples of Fraction and
+                list of Fractions
+        """
+        denom = 1
+        for clause in thold:
+            for e in clause:
+                for w in ((e[0], *e[1]) if isinstance(e, tuple) else (e, )):
+                    denom = math.lcm(denom, Fraction(w).denominator)
+
+        def group(weights, offset):  # (mask, weight) of weights grouped by weight
+            masks = {}
+            for i, w in enumerate(weights):
+                masks[w] = masks.get(w, 0) | (1 << (offset + i))
+            return tuple((mask, w) for w, mask in masks.items())
+
+        clauses = []
+        spots = []
+        for ci, clause in enumerate(thold):
+            bares = []  # (index, weight)
+            nests = []  # (weight, members)
+            for e in clause:
+                if isinstance(e, tuple):
+                    ws = [int(w * denom) for w in e[1]]
+                    members = group(ws, len(spots))
+                    spots.extend((ci, len(nests), w) for w in ws)
+                    nests.append((int(e[0] * denom), members))
+                else:
+                    bares.append((len(spots), int(e * denom)))
+                    spots.append((ci, None, int(e * denom)))
+
+            masks = {}
+            for idx, w in bares:
+                masks[w] = masks.get(w, 0) | (1 << idx)
+            clauses.append((tuple((mask, w) for w, mask in masks.items()), tuple(nests)))
+
+        self._denom = denom
+        self._clauses = tuple(clauses)
+        self._spots = tuple(spots)
 
 
     @staticmethod
@@ -4902,33 +5003,16 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
-            sats = [False] * self.size  # default all satifactions to False
+            mask = 0  # duplicates set same bit
+            size = self.size
             for idx in indices:
-                sats[idx] = True  # set verified signature index to True
-
-            wio = 0  # weight index offset
-            for clause in self.thold:
-                cw = 0  # init clause weight
-                for e in clause:
-                    if isinstance(e, tuple):
-                        vw = 0  # init element value weight
-                        for w in e[1]:   # sum weights of value
-                            if sats[wio]:
-                                vw += w
-                            wio += 1
-                        if vw >= 1:  # element true
-                            cw += e[0]  # add element key weight to clause weight
-                    else:
-                        w = e
-                        if sats[wio]:  # verified signature so weight applies
-                            cw += w
-                        wio += 1
-                if cw < 1:  # each clause must sum to at least 1
+                if idx < 0:  # offset from end of key list
+                    idx += size
+                if not 0 <= idx < size:
                     return False
+                mask |= 1 << idx  # set verified signature index bit
 
-            return True  # all clauses have cw >= 1 including final one, AND true
+            return self._satisfied(mask)
 
         except Exception as ex:
             return False
@@ -4936,6 +5020,126 @@ class Tholder:
         return False
 
 
+    def _satisfied(self, mask):
+        """
+        Returns True if bit mask of verified signature key indices satisfies
+        compiled weighted threshold, False otherwise
+
+        Parameters:
+            mask (int): bit at each verified signature key index is set
+        """
+        denom = self._denom
+        for bares, nests in self._clauses:
+            cw = 0  # init clause weight
+            for m, w in bares:
+                cw += w * (mask & m).bit_count()
+            for kw, members in nests:
+                vw = 0  # init element value weight
+                for m, w in members:
+                    vw += w * (mask & m).bit_count()
+                if vw >= denom:  # element true
+                    cw += kw  # add element key weight to clause weight
+            if cw < denom:  # each clause must sum to at least 1
+                return False
+
+        return True  # all clauses have cw >= 1 including final one, AND true
+
+
+    def tally(self, indices=None):
+        """
+        Returns Tally of this threshold for incrementally adding verified
+        signature key indices
+
+        Parameters:
+            indices (Iterable | None): initial verified signature key indices
+        """
+        return Tally(tholder=self, indices=indices)
+
+
+class Tally:
+    """
+    Tally incrementally evaluates satisfaction of a Tholder as verified
+    signature key indices are added one at a time. Each add updates running
+    clause weights of the compiled threshold so a partially signed message
+    does not need satisfaction recomputed from scratch on each new signature.
+
+    Attributes:
+        tholder (Tholder): threshold being tallied
+        mask (int): bit set at each added key index
+        satisfied (bool): True when added indices satisfy threshold
+
+    Hidden:
+        ._cws (list): scaled int weight of each clause
+        ._vws (list): lists of scaled int weight of each nested element of
+            each clause
+        ._met (int): number of clauses with weight of at least one
+    """
+
+    def __init__(self, tholder, indices=None):
+        """
+        Parameters:
+            tholder (Tholder): threshold to tally
+            indices (Iterable | None): initial verified signature key indices
+        """
+        self.tholder = tholder
+        self.mask = 0
+        self.satisfied = False
+        if tholder.weighted:
+            self._cws = [0] * len(tholder._clauses)
+            self._vws = [[0] * len(nests) for _, nests in tholder._clauses]
+            self._met = 0
+
+        for index in (indices if indices is not None else []):
+            self.add(index)
+
+    @property
+    def count(self):
+        """ Returns number of distinct key indices added """
+        return self.mask.bit_count()
+
+    def add(self, index):
+        """
+        Add verified signature key index. Adding an index again has no
+        effect.
+
+        Returns:
+            satisfied (bool): True when added indices satisfy threshold
+
+        Parameters:
+            index (int): offset into key list of verified signature
+        """
+        tholder = self.tholder
+        if index < 0 or (tholder.weighted and index >= tholder.size):
+            raise ValueError(f"Invalid key index = {index} for threshold "
+                             f"{tholder.sith}.")
+
+        bit = 1 << index
+        if self.mask & bit:
+            return self.satisfied
+        self.mask |= bit
+
+        if not tholder.weighted:
+            self.satisfied = tholder.thold > 0 and self.count >= tholder.thold
+            return self.satisfied
+
+        denom = tholder._denom
+        ci, ni, w = tholder._spots[index]
+        if ni is not None:  # nested weight counts once element weight is one
+            vw = self._vws[ci][ni]
+            self._vws[ci][ni] = vw + w
+            if vw >= denom or vw + w < denom:  # element truth unchanged
+                return self.satisfied
+            w = tholder._clauses[ci][1][ni][0]  # element key weight
+
+        cw = self._cws[ci]
+        self._cws[ci] = cw + w
+        if cw < denom <= cw + w:
+            self._met += 1
+            self.satisfied = self._met == len(self._cws)
+
+        return self.satisfied
+
+
 class Dicter:
     """ Dicter class is base class for objects that can be stored in a Suber
 
@@ -6,11 +6,11 @@ Provides versioning support for Counter classes and codes
 """
 import copy
 
-from dataclasses import dataclass, astuple, asdict
+from dataclasses import dataclass, asdict
 from collections import namedtuple
 
 from ..help import (sceil, intToB64, b64ToInt, codeB64ToB2, codeB2ToB64, Reb64,
-                    nabSextets)
+                    nabSextets, icetuple)
 
 from ..kering import (Colds, Versionage, Vrsn_1_0, Vrsn_2_0, InvalidVersionError,
                       InvalidCodeError, InvalidCodeSizeError, InvalidVarIndexError,
@@ -34,7 +34,7 @@ class GenusCodex(IceMapDom):
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(icetuple(self))  # enables inclusion test with "in"
         # duplicate values above just result in multiple entries in tuple so
         # in inclusion still works
 
@@ -80,7 +80,7 @@ class CounterCodex_1_0(IceMapDom):
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 CtrDex_1_0 = CounterCodex_1_0()
 
@@ -110,7 +110,7 @@ class QuadTripCodex_1_0(IceMapDom):
     BigESSRPayloadGroup: str = '--Z'  # Big ESSR Payload Group Quadlets (not implemented as quadlets)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 QTDex_1_0 = QuadTripCodex_1_0()
 
@@ -134,7 +134,7 @@ class UniversalCodex_1_0(IceMapDom):
     KERIACDCGenusVersion: str = '-_AAA'  # KERI ACDC Stack CESR Protocol Genus Version (Universal)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 UniDex_1_0 = UniversalCodex_1_0()
 
@@ -158,7 +158,7 @@ class SpecialUniversalCodex_1_0(IceMapDom):
     BigAttachmentGroup: str = '--V'  # Message Attachments Only Quadlet (Universal with Override)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 SUDex_1_0 = SpecialUniversalCodex_1_0()
 
@@ -177,7 +177,7 @@ class MessageUniversalCodex_1_0(IceMapDom):
     BigNonNativeBodyGroup: str = '--W'  # Big Message body Non-native enclosed with Texter
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 MUDex_1_0 = MessageUniversalCodex_1_0()
 
@@ -195,7 +195,7 @@ class BodyUniversalCodex_1_0(IceMapDom):
     BigNonNativeBodyGroup: str = '--W'  # Big Message body Non-native enclosed with Texter
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 BUDex_1_0 = BodyUniversalCodex_1_0()
 
@@ -270,7 +270,7 @@ class CounterCodex_2_0(IceMapDom):
     KERIACDCGenusVersion: str = '-_AAA'  # KERI ACDC Stack CESR Protocol Genus Version (Universal)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 CtrDex_2_0 = CounterCodex_2_0()
 
@@ -306,7 +306,7 @@ class UniversalCodex_2_0(IceMapDom):
     KERIACDCGenusVersion: str = '-_AAA'  # KERI ACDC Stack CESR Protocol Genus Version (Universal)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 UniDex_2_0 = UniversalCodex_2_0()
 
@@ -330,7 +330,7 @@ class SpecialUniversalCodex_2_0(IceMapDom):
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 SUDex_2_0 = SpecialUniversalCodex_2_0()
 
@@ -356,7 +356,7 @@ class MessageUniversalCodex_2_0(IceMapDom):
     BigNonNativeBodyGroup: str = '--H'  # Big Message body Non-native enclosed with Texter
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 MUDex_2_0 = MessageUniversalCodex_2_0()
 
@@ -378,7 +378,7 @@ class BodyUniversalCodex_2_0(IceMapDom):
     BigNonNativeBodyGroup: str = '--H'  # Big Message body Non-native enclosed with Texter
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 BUDex_2_0 = BodyUniversalCodex_2_0()
 
@@ -421,7 +421,7 @@ class SealCodex_2_0(IceMapDom):
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(icetuple(self))  # enables value not key inclusion test with "in"
 
 SealDex_2_0 = SealCodex_2_0()
 
@@ -479,6 +479,7 @@ class Counter:
         _code (str): value for .code property
         _raw (bytes): value for .raw property
         _count (int): value for .count property
+        _memo (list | None): memoized encodings. See ._memoized()
 
 
     Versioning:
@@ -717,6 +718,8 @@ class Counter:
         },
     }
 
+    _memo = None  # memoized encodings, instance value set lazily by ._memoized
+
     @classmethod
     def makeGVC(cls, version):
         """Makes genus version code from Versionage version
@@ -1008,8 +1011,12 @@ class Counter:
         Returns:
             Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once by ._infil and memoized. See ._memoized()
         """
-        return self._infil()
+        memo = self._memoized()
+        if memo[3] is None:
+            memo[3] = self._infil()
+        return memo[3]
 
 
     @property
@@ -1018,16 +1025,42 @@ class Counter:
         Returns:
             Fully Qualified Base64 Version, same as .both
         Assumes self.raw and self.code are correctly populated
+        Computed once from .qb64b and memoized. See ._memoized()
         """
-        return self.qb64b.decode("utf-8")
+        memo = self._memoized()
+        if memo[4] is None:
+            memo[4] = self.qb64b.decode("utf-8")
+        return memo[4]
 
 
     @property
     def qb2(self):
         """Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Computed once by ._binfil and memoized. See ._memoized()
+        """
+        memo = self._memoized()
+        if memo[5] is None:
+            memo[5] = self._binfil()
+        return memo[5]
+
+
+    def _memoized(self):
+        """Memo of encodings for the current ._code, ._count, and ._sizes
+
+        Returns:
+            memo (list): [code, count, sizes, qb64b, qb64, qb2] where any
+                of the encodings is None until first computed.
+
+        Same as Matter._memoized but keyed by code, count and version
+        specific sizes table.
         """
-        return self._binfil()
+        memo = self._memo
+        if (memo is None or memo[0] is not self._code or
+                memo[1] is not self._count or memo[2] is not self._sizes):
+            memo = self._memo = [self._code, self._count, self._sizes,
+                                 None, None, None]
+        return memo
 
 
     def countToB64(self, l=None):
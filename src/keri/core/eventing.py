@@ -5,11 +5,16 @@ keri.core.eventing module
 """
 import datetime
 import logging
+import os
+import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from base64 import urlsafe_b64decode as decodeB64
 from urllib.parse import urlsplit
 from math import ceil
 from ordered_set import OrderedSet as oset
+from hio.base import doing
 from hio.help import decking, ogler
 
 
@@ -22,7 +27,7 @@ from ..kering import (MissingEntryError, UntrustedKeyStateSource,
                       QueryNotFoundError, MisfitEventSourceError,
                       MissingDelegableApprovalError, Version, Versionage,
                       TraitDex, Vrsn_1_0, Vrsn_2_0, GVC_1_0, GVC_2_0,
-                      Roles, Schemes, Ilks, versify, Kinds)
+                      Roles, Schemes, Ilks, versify, Kinds, Colds)
 
 from ..help import helping, Reb64
 
@@ -49,6 +54,9 @@ EscrowTimeoutPS = 3600  # seconds for partial signed escrow timeout
 
 MaxIntThold = 2 ** 32 - 1
 
+BatchVerifyWorkers = min(4, os.cpu_count() or 1)  # max worker threads for verifyBatch
+BatchVerifyMin = 16  # min unique verifications in batch before using worker threads
+
 # Location of last establishment key event: sn is int, dig is qb64 digest
 LastEstLoc = namedtuple("LastEstLoc", 's d')
 
@@ -302,7 +310,68 @@ def deTransReceiptQuintuple(data, strip=False):
     return ediger, sprefixer, snumber, sdiger, siger
 
 
-def verifySigs(raw, sigers, verfers):
+_verifyPool = None  # ThreadPoolExecutor for verifyBatch created on first use
+
+
+def _verifyChunk(chunk):
+    """
+    Returns list of bools one per (ser, sig, verfer) triple in chunk.
+    Runs in verifyBatch worker thread. Crypto libs release the GIL.
+    """
+    return [verfer.verify(sig, ser) for ser, sig, verfer in chunk]
+
+
+def verifyBatch(triples, *, workers=None):
+    """
+    Returns list of bools, one per (ser, sig, verfer) triple in triples in the
+    same order, where True means sig verifies on ser with verfer.
+
+    Verifies many signatures at once such as all the controller sigs on an
+    event or all the endorsement sigs in a group. Identical triples, i.e. same
+    key, same sig, and same serialization, are verified only once. When the
+    number of unique triples is at least BatchVerifyMin and more than one
+    worker is allowed then the unique triples are split into chunks verified
+    in parallel by a shared thread pool since the underlying crypto libraries
+    release the GIL. Otherwise verifies sequentially in the calling thread.
+
+    Parameters:
+        triples (Iterable): of (ser, sig, verfer) triples where
+            ser (bytes): signed serialization
+            sig (bytes): raw signature
+            verfer (Verfer): instance of verification key
+        workers (int | None): max worker threads. None means BatchVerifyWorkers
+
+    """
+    global _verifyPool
+
+    triples = list(triples)
+    workers = workers if workers is not None else BatchVerifyWorkers
+
+    # dedupe identical work. key by code since same raw key may differ by suite
+    slots = {}  # unique key to index into uniques
+    uniques = []  # unique triples
+    places = []  # index into uniques for each triple
+    for ser, sig, verfer in triples:
+        key = (verfer.code, verfer.raw, bytes(sig), bytes(ser))
+        if key not in slots:
+            slots[key] = len(uniques)
+            uniques.append((ser, sig, verfer))
+        places.append(slots[key])
+
+    if workers > 1 and len(uniques) >= BatchVerifyMin:
+        if _verifyPool is None:
+            _verifyPool = ThreadPoolExecutor(max_workers=BatchVerifyWorkers,
+                                             thread_name_prefix="keri-verify")
+        size = -(-len(uniques) // workers)  # ceiling division
+        chunks = [uniques[i:i + size] for i in range(0, len(uniques), size)]
+        results = [r for rs in _verifyPool.map(_verifyChunk, chunks) for r in rs]
+    else:
+        results = _verifyChunk(uniques)
+
+    return [results[place] for place in places]
+
+
+def verifySigs(raw, sigers, verfers, trusted=False):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -312,11 +381,16 @@ def verifySigs(raw, sigers, verfers):
 
     Assigns appropriate verfer from verfers to each siger based on siger index
     If no signatures verify then sigers and indices are empty
+    All signatures are verified together as one batch. See verifyBatch.
 
     Parameters:
         raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        trusted (bool): True means sigers come from a trusted source such as
+            a signed snapshot so only indices are checked and the signatures
+            themselves are not verified.
+            False means verify every signature
 
     """
     if sigers is None:
@@ -325,13 +399,16 @@ def verifySigs(raw, sigers, verfers):
     # indices count for threshold will be erroneous. Does not modify in place
     # passed in sigers list, but instead depends on caller to use indices to
     # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
+    usigers = {}
+    for siger in sigers:
+        if siger.qb64 not in usigers:  # copy from raw so no base64 decode
+            usigers[siger.qb64] = Siger(raw=siger.raw, code=siger.code,
+                                        index=siger.index, ondex=siger.ondex)
 
     # verify indexes of attached signatures against verifiers and assign
     # verfer to each usiger
     uvsigers = []
-    for siger in usigers:
+    for siger in usigers.values():
         if siger.index >= len(verfers):
             logger.info(f"Skipped sig: index={siger.index} too large")
             continue
@@ -342,8 +419,12 @@ def verifySigs(raw, sigers, verfers):
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
-    for siger in uvsigers:
-        if siger.verfer.verify(siger.raw, raw):
+    if trusted:
+        results = [True] * len(uvsigers)
+    else:
+        results = verifyBatch([(raw, siger.raw, siger.verfer) for siger in uvsigers])
+    for siger, result in zip(uvsigers, results):
+        if result:
             vindices.append(siger.index)
             vsigers.append(siger)
 
@@ -1529,7 +1610,8 @@ def exchange(*,
 
 def messagize(serder, *, sigers=None, tsgs=None, lsgs=None, wigers=None,
                          cigars=None, rsgs=None, bonds=None, nests=None,
-                         framed=False, nested=False, gvrsn=Version, genusify=False):
+                         framed=False, nested=False, gvrsn=Version, genusify=False,
+                         cold=Colds.txt):
     """Attaches authenticator(s) from sigers (with or without source as seal) and/or
     cigars and/or wigers and/or bonds. A bond is typically a seal reference to
     an event with anchoring seal of message as authenticator. In v2 bonds may
@@ -1578,6 +1660,10 @@ def messagize(serder, *, sigers=None, tsgs=None, lsgs=None, wigers=None,
         genusify (bool): True means prepend genus version code from gvrsn before
                             serder to override default stream genus version
                          False means do nothing
+        cold (str): Colds.txt means return message in qb64 text domain
+                    Colds.bny means return message in qb2 binary domain. Any
+                    non-native body serialization is left as is but native
+                    CESR bodies, groups, and attachments are binary.
 
     Returns::
         msg (bytearray): KERI event with attachments if any
@@ -1902,6 +1988,15 @@ def messagize(serder, *, sigers=None, tsgs=None, lsgs=None, wigers=None,
     else:  # not a supported gvrsn for attachments and nesting
         raise ValueError(f"Unsupported configuration for protocol version={serder.pvrsn}")
 
+    if cold == Colds.bny:  # composable so convert en masse to binary domain
+        gims = bytearray(decodeB64(gims))
+        if nested or serder.kind == Kinds.cesr:  # all of msg is CESR
+            msg = decodeB64(msg)
+        else:  # leave non-native body as is, only attachments are CESR
+            msg = serder.raw + decodeB64(msg[len(serder.raw):])
+    elif cold != Colds.txt:
+        raise ValueError(f"Invalid stream state {cold=}")
+
     gims.extend(msg)
     return gims
 
@@ -1978,7 +2073,8 @@ class Kever:
 
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, delsner=None, delsger=None, firner=None,
-                 dater=None, cues=None, eager=False, local=True, check=False):
+                 dater=None, cues=None, eager=False, local=True, check=False,
+                 trusted=False):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -2019,6 +2115,9 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            trusted (bool): True means event comes from a trusted source such
+                as a signed snapshot so signatures are not reverified.
+                False means verify signatures
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -2061,7 +2160,8 @@ class Kever:
                                                         delsner=delsner,
                                                         delsger=delsger,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        trusted=trusted)
 
         self.delpre = delpre  # may be None
         self.delegated = True if self.delpre else False
@@ -2070,16 +2170,19 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                wits=wits,
-                                first=True if not check else False,
-                                delnum=delsner, diger=delsger,
-                                firner=firner, dater=dater, local=local)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        with self.db.batch():  # log event and key state in one commit
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                    wits=wits,
+                                    first=True if not check else False,
+                                    delnum=delsner, diger=delsger,
+                                    firner=firner, dater=dater, local=local)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fner = Number(num=fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=self.state())
+                for observer in list(self.db.observers):
+                    observer.keyStateUpdated(pre=self.prefixer.qb64)
 
 
     @property
@@ -2411,7 +2514,8 @@ class Kever:
 
 
     def update(self, serder, sigers, wigers=None, delsner=None, delsger=None,
-               firner=None, dater=None, eager=False, local=True, check=False):
+               firner=None, dater=None, eager=False, local=True, check=False,
+               trusted=False):
         """
         Not an inception event. Verify event serder and indexed signatures
         in sigers and update state
@@ -2448,6 +2552,9 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            trusted (bool): True means event comes from a trusted source such
+                as a signed snapshot so signatures are not reverified.
+                False means verify signatures
 
         """
         ked = serder.ked
@@ -2488,38 +2595,42 @@ class Kever:
                                                         delsner=delsner,
                                                         delsger=delsger,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        trusted=trusted)
 
 
 
             # .valSigWigsDel above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    wits=wits,
-                                    first=True if not check else False,
-                                    delnum=delsner, diger=delsger,
-                                    firner=firner, dater=dater, local=local)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.ndigers = serder.ndigers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.batch():  # log event and key state in one commit
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        wits=wits,
+                                        first=True if not check else False,
+                                        delnum=delsner, diger=delsger,
+                                        firner=firner, dater=dater, local=local)
+
+                # nxt and signatures verify so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need whole serder for digest agility compare
+                self.ilk = ilk
+                self.tholder = tholder
+                self.verfers = serder.verfers
+                self.ndigers = serder.ndigers
+                self.ntholder = serder.ntholder
+
+                self.toader = toader
+                self.wits = wits
+                self.cuts = cuts
+                self.adds = adds
+
+                # last establishment event location need this to recognize recovery events
+                self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+                    for observer in list(self.db.observers):
+                        observer.keyStateUpdated(pre=self.prefixer.qb64)
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2555,21 +2666,25 @@ class Kever:
                                                         toader=self.toader,
                                                         wits=self.wits,
                                                         eager=eager,
-                                                        local=local)
+                                                        local=local,
+                                                        trusted=trusted)
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.batch():  # log event and key state in one commit
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
+
+                # validates so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need for digest agility includes .serder.diger
+                self.ilk = ilk
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fner = Number(num=fn)
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+                    for observer in list(self.db.observers):
+                        observer.keyStateUpdated(pre=self.prefixer.qb64)
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2731,7 +2846,7 @@ class Kever:
     def valSigsWigsDel(self, serder, sigers, verfers, tholder,
                                 wigers, toader, wits, *,
                                 delsner=None, delsger=None, eager=False,
-                                local=True):
+                                local=True, trusted=False):
         """
         Returns triple (sigers, wigers, delegator) where:
         sigers is unique validated signature verified members of inputed sigers
@@ -2769,6 +2884,9 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
+            trusted (bool): True means event comes from a trusted source such
+                as a signed snapshot so signatures are not reverified.
+                False means verify signatures
 
         """
         if len(verfers) < tholder.size:
@@ -2792,7 +2910,8 @@ class Kever:
 
 
         # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers,
+                                     verfers=verfers, trusted=trusted)
         # sigers  now have .verfer assigned
 
         # check if minimally signed in order to continue processing
@@ -2831,7 +2950,8 @@ class Kever:
 
         werfers = [Verfer(qb64=wit) for wit in wits]  # get witness public key verifiers
         # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
+        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers,
+                                      verfers=werfers, trusted=trusted)
         # each wiger now has added to it a werfer of its wit in its .verfer property
 
         # escrow if not fully signed vs signing threshold
@@ -3630,66 +3750,73 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote
-        """
-        local = True if local else False
-        fn = None  # None means not a first seen log event so does not return an fn
-        dgkeys = (serder.pre, serder.said)
-        dgkey = dgKey(serder.preb, serder.saidb)
-        nowdater = Dater()  # now timestamp
-        self.db.dtss.put(keys=dgkey, val=nowdater)  # idempotent do not change dts if already
-        if sigers:
-            self.db.sigs.put(keys=dgkey, vals=sigers)  # idempotent
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[Prefixer(qb64=w) for w in wits])
-
-        self.db.evts.put(keys=(serder.pre, serder.said), val=serder)  # idempotent (maybe already excrowed)
-        # update event source
-
-        # delegation for authorized delegated or issued event
-        # when delnum and diger are provided they are only assured to be valid
-        # kever for event if kel is delegated and not locallyOwned
-        # and not locallyWitnessed as the validateDelegation is short circuited
-        # for non delegated kels, local controllers, and local witnesses.
-        # These checks prevent ddos via malicious source seal attachments.
-        # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
-        if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
-            and not self.locallyWitnessed(wits=wits) and delnum and diger):
-            self.db.aess.pin(keys=(serder.preb, serder.saidb), val=(Number(num=delnum.num, code=NumDex.Huge), diger))  # authorizer (delegator/issuer) event seal
-
-        if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkeys, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkeys, val=esr)
 
-        pre = self.prefixer.qb64
-        if first:  # append event dig to first seen database in order
-            fn = self.db.fels.append(keys=serder.preb, val=serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:  # cue to notice BadCloneFN
-                    self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
-                                        fn=fn, firner=firner, dater=dater))
-                logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s, said=%s",
-                            serder.preb, fn, firner.sn, serder.said)
-                logger.debug("Event body=\n%s\n", serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                nowdater = dater
-            self.db.dtss.pin(keys=dgkey, val=nowdater)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Number(sn=fn))
-            logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
-                         pre[:4], pre[-4:], serder.ilk, fn, serder.said,
-                         serder.pre, nowdater.dts)
+        All logs are written in one database batch transaction so are
+        committed together.
+        """
+        with self.db.batch():  # one commit for all logs of event
+            local = True if local else False
+            fn = None  # None means not a first seen log event so does not return an fn
+            dgkeys = (serder.pre, serder.said)
+            dgkey = dgKey(serder.preb, serder.saidb)
+            nowdater = Dater()  # now timestamp
+            self.db.dtss.put(keys=dgkey, val=nowdater)  # idempotent do not change dts if already
+            if sigers:
+                self.db.sigs.put(keys=dgkey, vals=sigers)  # idempotent
+            if wigers:
+                self.db.wigs.put(keys=dgkey, vals=wigers)
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[Prefixer(qb64=w) for w in wits])
+
+            self.db.evts.put(keys=(serder.pre, serder.said), val=serder)  # idempotent (maybe already excrowed)
+            # update event source
+
+            # delegation for authorized delegated or issued event
+            # when delnum and diger are provided they are only assured to be valid
+            # kever for event if kel is delegated and not locallyOwned
+            # and not locallyWitnessed as the validateDelegation is short circuited
+            # for non delegated kels, local controllers, and local witnesses.
+            # These checks prevent ddos via malicious source seal attachments.
+            # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
+            if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
+                and not self.locallyWitnessed(wits=wits) and delnum and diger):
+                self.db.aess.pin(keys=(serder.preb, serder.saidb), val=(Number(num=delnum.num, code=NumDex.Huge), diger))  # authorizer (delegator/issuer) event seal
+
+            if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkeys, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkeys, val=esr)
+
+            pre = self.prefixer.qb64
+            if first:  # append event dig to first seen database in order
+                fn = self.db.fels.append(keys=serder.preb, val=serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:  # cue to notice BadCloneFN
+                        self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
+                                            fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s, said=%s",
+                                serder.preb, fn, firner.sn, serder.said)
+                    logger.debug("Event body=\n%s\n", serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    nowdater = dater
+                self.db.dtss.pin(keys=dgkey, val=nowdater)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Number(sn=fn))
+                logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
+                             pre[:4], pre[-4:], serder.ilk, fn, serder.said,
+                             serder.pre, nowdater.dts)
+                logger.debug("Event Body=\n%s\n", serder.pretty())
+            self.db.kels.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+            self.db.indexSeals(serder)
+            self.db.wakeEscrows(serder.pre, accepted=True)
+            logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
+                        pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
             logger.debug("Event Body=\n%s\n", serder.pretty())
-        self.db.kels.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
-        logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
-                    pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
-        logger.debug("Event Body=\n%s\n", serder.pretty())
+
         return (fn, nowdater.dts)  # (fn int, dts str) if first else (None, dts str)
 
 
@@ -3808,6 +3935,7 @@ class Kever:
 
         snkey = snKey(serder.preb, serder.sn)
         self.db.pses.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        self.db.timeEscrow("pses", serder.pre, serder.sn, serder.said)
         logger.debug("Kever: Escrowed partially signed or delegated event = \n%s\n", serder.pretty())
 
 
@@ -3852,7 +3980,9 @@ class Kever:
 
         logger.trace("Kever state: Escrowed partially witnessed event = %s", serder.said)
         logger.trace("Event Body=\n%s\n", serder.pretty())
-        return self.db.pwes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        result = self.db.pwes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        self.db.timeEscrow("pwes", serder.pre, serder.sn, serder.said)
+        return result
 
 
     def escrowPDEvent(self, serder, *, sigers=None, wigers=None,
@@ -3914,7 +4044,9 @@ class Kever:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         logger.debug(f"Kever: Escrowed partially delegated event=\n%s\n", serder.pretty())
-        return self.db.pdes.add(keys=serder.pre, on=serder.sn, val=serder.said)
+        result = self.db.pdes.add(keys=serder.pre, on=serder.sn, val=serder.said)
+        self.db.timeEscrow("pdes", serder.pre, serder.sn, serder.said)
+        return result
 
 
     def state(self):
@@ -4122,6 +4254,13 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        trusted (bool): True means event stream comes from a trusted source
+                such as a signed snapshot so event signatures are not reverified
+        escrowing (bool): True means currently reprocessing escrowed entries
+                so replayed escrow messages do not wake their escrows again
+        processed (int): count of event messages given to .processEvent other
+                than replayed escrowed events whether accepted, escrowed,
+                duplicate or invalid
 
 
     Properties:
@@ -4140,11 +4279,12 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    EscrowSweepPS = 60.0  # seconds between full walks of every escrow table
 
     def __init__(self, *, cues=None, db=None, rvy=None, exc=None, tvy=None,
                  cf=None, kramer=None, enableKram=False,
                  lax=True, local=False, cloned=False, direct=True,
-                 check=False):
+                 check=False, trusted=False):
         """
         Initialize instance:
 
@@ -4174,6 +4314,9 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            trusted (bool): True means event stream comes from a trusted source
+                such as a signed snapshot so event signatures are not reverified.
+                False means verify event signatures
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
@@ -4195,6 +4338,10 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.trusted = True if trusted else False  # skip event sig verification
+        self.escrowing = False  # True while reprocessing escrows
+        self.processed = 0  # count of event messages processed not from escrow
+        self._swept = None  # monotonic time of last full escrow sweep
 
 
     @property
@@ -4270,6 +4417,9 @@ class Kevery:
         """
         local = local if local is not None else self.local
         local = True if local else False  # force boolean
+        if not self.escrowing:  # new data for pre may unblock its escrows
+            self.processed += 1
+            self.db.wakeEscrows(serder.pre)
 
         # fetch ked ilk  pre, sn, dig to see how to process
         pre = serder.pre
@@ -4305,7 +4455,8 @@ class Kevery:
                               cues=self.cues,
                               eager=eager,
                               local=local,
-                              check=self.check)
+                              check=self.check,
+                              trusted=self.trusted)
                 self.kevers[pre] = kever  # not exception so add to kevers
 
                 # At this point  the inceptive event (icp or dip) given by serder
@@ -4396,7 +4547,8 @@ class Kevery:
                                  delsner=delsner, delsger=delsger,
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
-                                 eager=eager, local=local, check=self.check)
+                                 eager=eager, local=local, check=self.check,
+                                 trusted=self.trusted)
 
                     # At this point the non-inceptive event (rot, drt, or ixn)
                     # given by serder together with its attachments has been
@@ -4489,6 +4641,8 @@ class Kevery:
         """
         local = local if local is not None else self.local
         local = True if local else False  # force boolean
+        if not self.escrowing:  # new data for pre may unblock its escrows
+            self.db.wakeEscrows(serder.pre)
 
         # fetch  pre dig to process
         ked = serder.ked
@@ -4867,6 +5021,8 @@ class Kevery:
         """
         local = local if local is not None else self.local
         local = True if local else False  # force boolean
+        if not self.escrowing:  # new data for pre may unblock its escrows
+            self.db.wakeEscrows(serder.pre)
 
         # fetch  pre dig to process
         ked = serder.ked
@@ -4946,6 +5102,8 @@ class Kevery:
         """
         local = local if local is not None else self.local
         local = True if local else False  # force boolean
+        if not self.escrowing:  # new data for pre may unblock its escrows
+            self.db.wakeEscrows(serder.pre)
 
         # fetch  ldig to process
         ked = serder.ked
@@ -5005,13 +5163,22 @@ class Kevery:
                                           "no keys."
                                           "".format(sdiger.qb64, sprefixer.qb64))
 
-                # vrcsNew test to replace vrcs changed format of subdb
+                # verify all sigers in group up to any bad index as one batch
+                vsigers = []
                 for siger in sigers:  # endorser (non-controller) signatures
+                    if siger.index >= len(sverfers):
+                        break  # raise below after processing prior sigers
+                    siger.verfer = sverfers[siger.index]  # assign verfer
+                    vsigers.append(siger)
+                results = verifyBatch([(serder.raw, siger.raw, siger.verfer)
+                                       for siger in vsigers])
+
+                # vrcsNew test to replace vrcs changed format of subdb
+                for i, siger in enumerate(sigers):  # endorser (non-controller) signatures
                     if siger.index >= len(sverfers):
                         raise ValidationError(f"Index={siger.index} to large for keys.")
 
-                    siger.verfer = sverfers[siger.index]  # assign verfer
-                    if siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                    if results[i]:  # verified sig
                         # good sig so write receipt to database
                         keys = (pre, serder.said, sprefixer.qb64, snumber.onkey, sdiger.qb64)
                         self.db.vrcs.add(keys=keys, val=siger)  # add to ioset at keys
@@ -5461,6 +5628,9 @@ class Kevery:
         # Add source of ksr to the key...  (ksr AID, source aid)
         self.db.knas.pin(keys=(ksr.i, aid), val=saider)  # overwrite
 
+        for observer in list(self.db.observers):
+            observer.keyStateSaved(aid=aid, ksr=ksr)
+
 
     def removeKeyState(self, saider):
         if saider:
@@ -5564,6 +5734,10 @@ class Kevery:
 
         self.db.obvs.pin(keys=keys, val=observed)  # overwrite
 
+        cid, aid, oid = keys
+        for observer in list(self.db.observers):
+            observer.watchedUpdated(cid=cid, aid=aid, oid=oid, enabled=enabled)
+
 
     def processQuery(self, serder, *, source=None, sigers=None, cigars=None, **kwa):
         """Process query mode replay message for collective or single element query.
@@ -5790,6 +5964,7 @@ class Kevery:
         if delsner and delsger:
             self.db.udes.put(keys=dgkey, val=(delsner, delsger))  # idempotent
         self.db.ooes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        self.db.timeEscrow("ooes", serder.pre, serder.sn, serder.said)
         # log escrowed
         logger.debug("Kevery process: escrowed out of order event=\n%s", serder.pretty())
 
@@ -5843,7 +6018,8 @@ class Kevery:
         self.db.dtss.put(keys=dgkey, val=Dater())
         self.db.sigs.put(keys=dgkey, vals=sigers)
         self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.ldes.add(keys=serder.pre, on=serder.sn, val=serder.said)
+        self.db.timeEscrow("ldes", serder.pre, serder.sn, serder.said)
         # log duplicitous
         logger.debug("Kevery process: escrowed likely duplicitous event=\n%s\n", serder.pretty())
 
@@ -6062,20 +6238,46 @@ class Kevery:
                          "receipt of pre= %s sn=%x dig=%s", serder.pre, serder.sn,
                          serder.said)
 
-    def processEscrows(self):
+    def processEscrows(self, sweep=None):
         """
         Iterate throush escrows and process any that may now be finalized
 
+        Escrowed entries are only revisited when something they wait on has
+        arrived as recorded by .db.wakeEscrows. Escrows keyed by the prefix
+        they wait on, out of order, partial witness and partial signature,
+        are walked only for the woken prefixes. Escrows that may wait on
+        other prefixes are walked in full when anything woke. When nothing
+        woke then nothing is walked. Every .EscrowSweepPS seconds all
+        escrows are walked in full to expire stale entries and to catch
+        changes made to the database outside of Kevery.
+
         Parameters:
-        """
+            sweep (bool | None): True means walk all escrows in full.
+                False means only walk woken escrows.
+                None means walk all in full when .EscrowSweepPS has elapsed
+                since the last full walk or there has been none yet.
+        """
+        now = time.monotonic()
+        if sweep is None:
+            sweep = self._swept is None or (now - self._swept) >= self.EscrowSweepPS
+
+        pres, accepted = self.db.takeEscrowWakes()
+        if sweep:
+            self._swept = now
+            pres = None  # walk all prefixes
+        elif not (pres or accepted):
+            return  # nothing new so no escrow can make progress
+
+        self.escrowing = True
         try:
-            self.processEscrowOutOfOrders()
+            self.processEscrowOutOfOrders(pres=pres)
             self.processEscrowUnverWitness()
             self.processEscrowUnverNonTrans()
             self.processEscrowUnverTrans()
             self.processEscrowPartialDels()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
+            self.processEscrowPartialWigs(pres=pres)
+            # partial sigs may wait on a delegator so accepted wakes all
+            self.processEscrowPartialSigs(pres=None if accepted else pres)
             self.processEscrowDuplicitous()
             self.processQueryNotFound()
 
@@ -6085,7 +6287,78 @@ class Kevery:
                 logger.exception("Kevery other escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+        finally:
+            self.escrowing = False
+
+
+    def _escrowItemIter(self, escrow, pres=None):
+        """
+        Returns iterator of (keys, on, val) triples of OnIoDupSuber escrow
+        keyed by prefix and sn.
+
+        Parameters:
+            escrow (OnIoDupSuber): escrow sub db keyed by prefix and on
+            pres (Iterable | None): of qb64 prefixes whose entries to iterate.
+                None means iterate entries for all prefixes
+        """
+        if pres is None:
+            yield from escrow.getAllItemIter(keys=b'')
+            return
+
+        for pre in pres:
+            yield from escrow.getAllItemIter(keys=pre)
+
+
+    def pruneEscrows(self):
+        """
+        Removes stale escrowed events from the out of order, partial
+        signature, partial witness, partial delegation, and likely duplicitous
+        escrows using the .db.etxs escrow time index with the same timeouts as
+        their escrow processors. Only the stale front of the index is read
+        so work scales with the number of stale entries not escrow size.
+        Index entries of events since unescrowed are dropped. Entries whose
+        escrow datetime in .db.dtss was refreshed are reindexed.
+
+        The unverified receipt escrows such as .db.uwes, the query not found
+        escrow .db.qnfs, and the TEL and credential escrows are not indexed
+        since they are not keyed by event prefix, sn, and digest. They keep
+        their stale checks in their escrow processors.
+
+        Returns:
+            count (int): number of stale escrowed events removed
+        """
+        count = 0
+        now = helping.nowUTC()
+        for name, timeout in (("ooes", self.TimeoutOOE),
+                              ("pses", self.TimeoutPSE),
+                              ("pwes", self.TimeoutPWE),
+                              ("pdes", self.TimeoutPWE),  # as .processEscrowDelegables
+                              ("ldes", self.TimeoutLDE)):
+            escrow = getattr(self.db, name)
+            timeout = datetime.timedelta(seconds=timeout)
+            cutoff = helping.toIso8601(now - timeout)
+            stales = []
+            for keys, snh in self.db.etxs.getTopItemIter(keys=(name, "")):
+                if keys[1] >= cutoff:  # datetime ordered so rest not stale
+                    break
+                stales.append((keys, int(snh, 16)))
+
+            for (_, dts, pre, dig), sn in stales:
+                self.db.etxs.rem(keys=(name, dts, pre, dig))
+                if dig not in escrow.get(keys=pre, on=sn):  # already unescrowed
+                    continue
+                dater = self.db.dtss.get(keys=dgKey(pre, dig))
+                if dater is not None and (now - dater.datetime) <= timeout:
+                    self.db.timeEscrow(name, pre, sn, dig)  # refreshed
+                    continue
+                escrow.rem(keys=pre, on=sn, val=dig)
+                count += 1
+                logger.info("Kevery: pruned stale %s escrow at pre=%s sn=%s "
+                            "dig=%s", name, pre, sn, dig)
+
+        return count
+
+    def processEscrowOutOfOrders(self, pres=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -6114,6 +6387,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (Iterable | None): of qb64 prefixes whose escrowed events to
+                process. None means process escrowed events of all prefixes
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6123,7 +6400,7 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
         """
-        for pre, sn, edig in self.db.ooes.getAllItemIter():
+        for pre, sn, edig in self._escrowItemIter(self.db.ooes, pres=pres):
 
             if isinstance(pre, (tuple, list)):
                 pre = pre[0]
@@ -6213,7 +6490,7 @@ class Kevery:
                 logger.debug("Event=\n%s\n", eserder.pretty())
 
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -6238,6 +6515,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (Iterable | None): of qb64 prefixes whose escrowed events to
+                process. None means process escrowed events of all prefixes
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6250,7 +6531,7 @@ class Kevery:
 
         #key = ekey = b''  # both start same. when not same means escrows found
         #while True:  # break when done
-        for pre, sn, edig in self.db.pses.getAllItemIter():
+        for pre, sn, edig in self._escrowItemIter(self.db.pses, pres=pres):
             eserder = None
             try:
                 if isinstance(pre, (tuple, list)):
@@ -6308,8 +6589,18 @@ class Kevery:
                 if (couple := self.db.udes.get(keys=dgkey)):
                     sner, sger = couple
 
+                # skip reverifying escrowed sigs when their indices can not
+                # yet satisfy the signing threshold
+                if eserder.estive:
+                    tholder = eserder.tholder
+                else:
+                    tholder = self.kevers[pre].tholder if pre in self.kevers else None
+                if tholder is not None and not tholder.satisfy([siger.index for siger in sigers]):
+                    raise MissingSignatureError(f"PSE Failure satisfying sith = "
+                                                f"{tholder.sith} on escrowed sigs for "
+                                                f"evt = {edig.decode()}")
+
                 # process event
-                sigers = self.db.sigs.get(keys=(pre, edig))
                 self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
                                   delsner=sner,
                                   delsger=sger,
@@ -6368,7 +6659,7 @@ class Kevery:
                 #break
             #key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -6394,6 +6685,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (Iterable | None): of qb64 prefixes whose escrowed events to
+                process. None means process escrowed events of all prefixes
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6404,7 +6699,7 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
         """
-        for pre, sn, edig in self.db.pwes.getAllItemIter(keys=b''):
+        for pre, sn, edig in self._escrowItemIter(self.db.pwes, pres=pres):
             try:
                 if isinstance(pre, (tuple, list)):
                     pre = pre[0]
@@ -7425,7 +7720,7 @@ class Kevery:
         This allows FIFO processing of events with same prefix and sn but different
         digest.
 
-        Uses  .db.addLde(self, key, val) which is IOVal with dups.
+        Uses  .db.ldes.add(keys=pre, on=sn, val=dig) which is OnIoDupSuber.
 
         Value is dgkey for event stored in .Evt where .Evt has serder.raw of event.
 
@@ -7434,7 +7729,7 @@ class Kevery:
             self.db.dtss.put(keys=dgkey, val=Dater())
             self.db.sigs.put(keys=dgkey, vals=sigers)
             self.db.evts.put(keys=(pre, serder.dig), val=serder)
-            self.db.addLde(snKey(pre, sn), serder.digb)
+            self.db.ldes.add(keys=pre, on=sn, val=serder.said)
             where:
                 serder is SerderKERI instance of  event
                 sigers is list of Siger instance for  event
@@ -7553,6 +7848,40 @@ class Kevery:
         pass
 
 
+class EscrowPruner(doing.Doer):
+    """
+    EscrowPruner Doer removes stale escrowed events of its Kevery every
+    .tock seconds. See Kevery.pruneEscrows
+
+    Attributes:
+        kevery (Kevery): instance whose escrows are pruned
+        pruned (int): total number of stale escrowed events removed
+    """
+
+    def __init__(self, kevery, tock=10.0, **kwa):
+        """
+        Inherited Parameters:
+            tymist (Tymist): instance
+            tock (float): seconds between prunes. Default 10.0
+
+        Parameters:
+            kevery (Kevery): instance whose escrows are pruned
+        """
+        super(EscrowPruner, self).__init__(tock=tock, **kwa)
+        self.kevery = kevery
+        self.pruned = 0
+
+
+    def recur(self, tyme):
+        """Prunes stale escrows. Never done.
+
+        Parameters:
+            tyme (float): current time of associated Tymist
+        """
+        self.pruned += self.kevery.pruneEscrows()
+        return False
+
+
 def loadEvent(db, preb, dig):
     """ Load event details from database
 
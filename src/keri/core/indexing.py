@@ -5,7 +5,7 @@ keri.core.indexing module
 Provides versioning support for Indexer classes and codes
 """
 from collections import namedtuple
-from dataclasses import dataclass, astuple, asdict
+from dataclasses import dataclass, asdict
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 
@@ -15,7 +15,7 @@ from ..kering import (EmptyMaterialError, RawMaterialError, InvalidCodeSizeError
                       UnexpectedCountCodeError, UnexpectedOpCodeError)
 
 from ..help import (sceil, intToB64, b64ToInt,
-                    codeB64ToB2, codeB2ToB64, nabSextets)
+                    codeB64ToB2, codeB2ToB64, nabSextets, icetuple)
 
 
 @dataclass(frozen=True)
@@ -62,7 +62,7 @@ class IndexerCodex:
     TBD4: str = '4z'  # Test of index sig lead 1 big
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(icetuple(self))  # enables inclusion test with "in"
 
 IdrDex = IndexerCodex()
 
@@ -92,7 +92,7 @@ class IndexedSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 IdxSigDex = IndexedSigCodex()  # Make instance
 
@@ -114,7 +114,7 @@ class IndexedCurrentSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 IdxCrtSigDex = IndexedCurrentSigCodex()  # Make instance
 
@@ -137,7 +137,7 @@ class IndexedBothSigCodex:
     Ed448_Big_Sig: str = '3A'  # Ed448 signature appears in both lists.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 IdxBthSigDex = IndexedBothSigCodex()  # Make instance
 
@@ -176,6 +176,7 @@ class Indexer:
         ._raw (bytes): value for .raw property
         ._index (int): value for .index property
         ._ondex (int): value for .ondex property
+        ._memo (list | None): memoized encodings. See ._memoized()
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._binfil is method to compute fully qualified Base2 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
@@ -219,6 +220,7 @@ class Indexer:
 
     Codes = asdict(IdrDex)  # map code name to code
     Names = {val : key for key, val in Codes.items()} # invert map code to code name
+    _memo = None  # memoized encodings, instance value set lazily by ._memoized
 
     @classmethod
     def _rawSize(cls, code):
@@ -378,8 +380,12 @@ class Indexer:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Computed once by ._infil and memoized. See ._memoized()
         """
-        return self._infil()
+        memo = self._memoized()
+        if memo[4] is None:
+            memo[4] = self._infil()
+        return memo[4]
 
     @property
     def qb64(self):
@@ -387,16 +393,41 @@ class Indexer:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Computed once from .qb64b and memoized. See ._memoized()
         """
-        return self.qb64b.decode("utf-8")
+        memo = self._memoized()
+        if memo[5] is None:
+            memo[5] = self.qb64b.decode("utf-8")
+        return memo[5]
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Computed once by ._binfil and memoized. See ._memoized()
         """
-        return self._binfil()
+        memo = self._memoized()
+        if memo[6] is None:
+            memo[6] = self._binfil()
+        return memo[6]
+
+    def _memoized(self):
+        """Memo of encodings for the current ._code, ._index, ._ondex, and ._raw
+
+        Returns:
+            memo (list): [code, index, ondex, raw, qb64b, qb64, qb2] where any
+                of the encodings is None until first computed.
+
+        Same as Matter._memoized but also keyed by index and ondex.
+        """
+        memo = self._memo
+        if (memo is None or memo[0] is not self._code or
+                memo[1] is not self._index or memo[2] is not self._ondex or
+                memo[3] is not self._raw):
+            memo = self._memo = [self._code, self._index, self._ondex,
+                                 self._raw, None, None, None]
+        return memo
 
     def _infil(self):
         """
@@ -633,6 +664,8 @@ class Indexer:
         self._index = index
         self._ondex = ondex
         self._raw = raw  # must be bytes for crpto opts and immutable not bytearray
+        # seed memo with validated extracted qb64b so not recomputed by ._infil
+        self._memo = [hard, index, ondex, raw, bytes(qb64b), None, None]
 
 
 
@@ -738,6 +771,8 @@ class Indexer:
         self._index = index
         self._ondex = ondex
         self._raw = bytes(raw)  # must be bytes for crypto ops and not bytearray mutable
+        # seed memo with validated extracted qb2 so not recomputed by ._binfil
+        self._memo = [hard, index, ondex, self._raw, None, None, bytes(qb2)]
 
 
 class Siger(Indexer):
@@ -12,7 +12,7 @@ from replay attacks. It includes protection from retrograde attacks on the
 receiver's clock.
 """
 from collections import namedtuple, defaultdict
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 
 from ordered_set import OrderedSet as oset
 
@@ -28,11 +28,21 @@ from ..kering import (KramConfigurationError, KramError,
                       MissingSenderKeyStateError, MissingAuthAttachmentError,
                       Ilks, Vrsn_2_0)
 from ..help import helping
+from ..help.helping import epochMs
 from ..recording import CacheTypeRecord, MsgCacheRecord, TxnMsgCacheRecord
 
 
 logger = ogler.getLogger()
 
+def expiryKey(ms):
+    """Returns fixed width hex str of int ms for expiry index keys so that
+    lexical key order is expiry order.
+
+    Parameters:
+        ms (int): expiry in milliseconds since epoch
+    """
+    return f"{ms:016x}"
+
 
 @dataclass(frozen=True)
 class AuthTypeCodex:
@@ -46,7 +56,7 @@ class AuthTypeCodex:
     AttachedSignatureMultiKey: str = 'asmk'  # Attached multi-key signature. Long lag window. Accumulates sigs.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(helping.icetuple(self))
 
 AuthTypes = AuthTypeCodex()
 
@@ -74,6 +84,62 @@ and kever.tholder.
 """
 
 
+class PrefixTrie:
+    """Character trie of prefix strings such as compacted KRAM denials.
+
+    Answers whether any member is a prefix of a given string by walking the
+    string once so cost is O(len(string)) independent of number of members.
+
+    Usage:
+        trie = PrefixTrie(["CAA.rpy./end/role", "CAA.exn."])
+        assert trie.match("CAA.rpy./end/role/add")
+    """
+    End = None  # child key marking that a member ends at this node
+
+    def __init__(self, prefixes=()):
+        """Initialize instance
+
+        Parameters:
+            prefixes (Iterable[str]): prefix strings to add
+        """
+        self._root = {}
+        self._count = 0
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, prefix):
+        """Add prefix string to trie
+
+        Parameters:
+            prefix (str): prefix string member
+        """
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        if self.End not in node:
+            node[self.End] = True
+            self._count += 1
+
+    def match(self, s):
+        """Returns True if any member of trie is a prefix of s, False otherwise
+
+        Parameters:
+            s (str): string to match such as compacted message denial string
+        """
+        node = self._root
+        if self.End in node:
+            return True
+        for char in s:
+            if (node := node.get(char)) is None:
+                return False
+            if self.End in node:
+                return True
+        return False
+
+
 class Kramer:
     """KRAM (KERI Request Authentication Mechanism) processor.
 
@@ -94,6 +160,16 @@ class Kramer:
         enabled (bool): Whether KRAM is enabled
         denials (list): Compacted denial strings for exempted messages
         fullDenials (list): Raw denial configurations
+
+    Hidden:
+        _denialTrie (PrefixTrie): index of .denials for denied message lookup
+        _ctyps (dict): in-memory index of kramCTYP cache-type records keyed by
+            cache-type key expression. Replaced whole by ._indexCtyp whenever
+            cache types change so lookups never touch LMDB.
+        _msgNotBefore (int | None): latest mdt - d in ms of any kramMSGC entry.
+            None means unknown so expiry index may be incomplete.
+        _txnNotBefore (int | None): latest xdt in ms of any kramTMSC entry.
+            None means unknown so expiry index may be incomplete.
     """
     OobiDenials = (
         [[2, 0], Ilks.rpy, "/end/role"],
@@ -119,13 +195,19 @@ class Kramer:
 
         self._fullDenials = fullDenials
         self._denials = self._compactDenials(self._fullDenials)
+        self._denialTrie = PrefixTrie(self._denials)
 
         self._kramCTYPCf = kram.get('caches', {})
         self._populateCtyp(self._kramCTYPCf)
+        self._indexCtyp()
 
         # Staged accept-window increases (see changeConfig, reconcileConfig)
         self._pending = {}
 
+        # Unknown until first full sweep (see _pruneMessages, _pruneExchanges)
+        self._msgNotBefore = None
+        self._txnNotBefore = None
+
     @classmethod
     def _mergeOobiDenials(cls, fullDenials):
         """Add built-in OOBI denial exemptions unless config already covers them.
@@ -203,6 +285,16 @@ class Kramer:
         for key, record in self._validateCtypConfig(ctypCf).items():
             self.db.kramCTYP.pin(key, record)
 
+    def _indexCtyp(self):
+        """Rebuild in-memory cache-type index from the kramCTYP database.
+
+        The new index is built aside and then swapped in with a single
+        assignment so lookups see either the old or the new index in whole.
+        """
+        sep = self.db.kramCTYP.sep
+        self._ctyps = {sep.join(keys): rec for keys, rec
+                       in self.db.kramCTYP.getFullItemIter()}
+
     @staticmethod
     def _compactDenials(fullDenials):
         """Compact raw denials into strings of the form Mmm.iii.route
@@ -267,11 +359,8 @@ class Kramer:
     def _fetchCacheType(self, msgType, route):
         """Fetch the most specific matching cache-type entry.
 
-        Uses Komer.getTopItemIter to scan the message-type branch of the kramCTYP
-        database in a single LMDB cursor pass. The cursor positions at the
-        first key >= msgType and iterates forward through all keys sharing
-        the msgType prefix. Among matches, the most specific key (longest
-        match against the message vector) is selected.
+        Looks up the in-memory cache-type index (see ._indexCtyp) so at most
+        three hash lookups are made and the kramCTYP database is not touched.
 
         Cascade specificity:
             1. msgType.R.route  (type + route, most specific)
@@ -288,23 +377,15 @@ class Kramer:
         Raises:
             KramError: if no matching cache-type entry found
         """
-        bestRec = None
-        exactRoute = f"{msgType}.R.{route}" if route else None
-
-        # Single cursor scan of the msgType branch
-        for keys, rec in self.db.kramCTYP.getTopItemIter(keys=msgType):
-            key = self.db.kramCTYP.sep.join(keys)  # rejoin tuple to string
-            if exactRoute and key == exactRoute:
-                return rec  # exact type+route match, most specific
-            elif key == msgType:
-                bestRec = rec  # type-only match, keep as candidate
+        ctyps = self._ctyps  # local ref so concurrent reindex is atomic
+        if route and (rec := ctyps.get(f"{msgType}.R.{route}")) is not None:
+            return rec  # exact type+route match, most specific
 
-        if bestRec is not None:
-            return bestRec
+        if (rec := ctyps.get(msgType)) is not None:
+            return rec  # type-only match
 
         # Fall back to default catchall
-        rec = self.db.kramCTYP.get("~")
-        if rec is not None:
+        if (rec := ctyps.get("~")) is not None:
             return rec
 
         raise KramError(f"No cache-type entry found for "
@@ -513,12 +594,10 @@ class Kramer:
         return None, False
 
     @staticmethod
-    def _isNewerMdt(newMdtMs, cachedMdtIso):
-        """Return True when incoming mdt is strictly newer than cached mdt."""
-        try:
-            cachedMdtMs = helping.fromIso8601(cachedMdtIso).timestamp() * 1000
-        except Exception:
-            return False
+    def _isNewerMdt(newMdtMs, cachedMdtMs):
+        """Return True when incoming mdt is strictly newer than cached mdt.
+        Both are int milliseconds since epoch.
+        """
         return newMdtMs > cachedMdtMs
 
     def _scrubSameSenderPriorEventTsgs(self, msg, senderId, kever, kwa):
@@ -961,10 +1040,8 @@ class Kramer:
         if kwa is None:
             kwa = {}
         if self.enabled:
-            md = self.denial(serder)  # message denial string
-            for d in self.denials:
-                if md.startswith(d):
-                    return serder
+            if self._denialTrie.match(self.denial(serder)):
+                return serder
             return self.kramit(serder, kwa)
         return serder  # KRAM disabled for all messages return message for further processing
 
@@ -1006,7 +1083,7 @@ class Kramer:
         mdts = msg.stamp
         if not mdts:
             return None  # no datetime, cannot check timeliness
-        mdt = helping.fromIso8601(mdts).timestamp() * 1000  # ms
+        mdt = epochMs(mdts)  # ms
 
         self._normalizeSenderSeals(senderId, kwa)
         self._normalizeSenderTlsgs(senderId, kwa)
@@ -1171,8 +1248,7 @@ class Kramer:
                     pml = cacheTypeRecord.psl
 
                 # Timeliness check (millisecond units)
-                rdt = helping.fromIso8601(
-                    helping.nowIso8601()).timestamp() * 1000  # ms
+                rdt = epochMs(helping.nowIso8601())  # ms
 
                 # We can check timeliness here because we perform this for all auth types and the only difference is
                 # the value of ml based on the auth type.
@@ -1207,9 +1283,9 @@ class Kramer:
 
                     # Create cache and accept
                     mcr = MsgCacheRecord(
-                        mdt=mdts, d=d, ml=ml, pml=pml,
+                        mdt=mdt, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                    self._cacheMsg(key, mcr)
                     return msg
 
                 elif authType == AuthTypes.AttachedSignatureSingleKey:
@@ -1222,9 +1298,9 @@ class Kramer:
 
                     # Create cache and accept
                     mcr = MsgCacheRecord(
-                        mdt=mdts, d=d, ml=ml, pml=pml,
+                        mdt=mdt, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                    self._cacheMsg(key, mcr)
                     return msg
 
                 elif authType == AuthTypes.AttachedSignatureMultiKey:
@@ -1237,9 +1313,9 @@ class Kramer:
 
                     # Create cache entry (at least one sig verified)
                     mcr = MsgCacheRecord(
-                        mdt=mdts, d=d, ml=ml, pml=pml,
+                        mdt=mdt, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                    self._cacheMsg(key, mcr)
 
                     # Check if threshold is immediately satisfied
                     sigIndices = [sig.index for sig in sigResult.sigers]
@@ -1404,7 +1480,7 @@ class Kramer:
                 if authType == AuthTypes.AttachedSealReference or authType == AuthTypes.AttachedSignatureSingleKey:
                     match msgType:
                         case Ilks.xip:
-                            xdts = msg.ked.get('dt', None)
+                            xdt = epochMs(msg.ked.get('dt', None))
                         case Ilks.exn:
                             # x field value to fetch any existing cache entry with a matching AID.XID and copy its xdt
                             # value. When no existing cache entry is found, then drop the event and exit.
@@ -1412,7 +1488,7 @@ class Kramer:
 
                             if existingCache is not None:
                                 keys, cacheRecord = existingCache
-                                xdts = cacheRecord.xdt
+                                xdt = cacheRecord.xdt
                             else:
                                 # No existing cache entry found, drop the event and exit
                                 return None
@@ -1420,9 +1496,7 @@ class Kramer:
                             # Should never be reaching this case
                             raise KramError("Unexpected transactioned message type while kraming.")
 
-                    xdt = helping.fromIso8601(xdts).timestamp() * 1000  # ms
-                    rdt = helping.fromIso8601(
-                        helping.nowIso8601()).timestamp() * 1000  # ms
+                    rdt = epochMs(helping.nowIso8601())  # ms
 
                     # Timeliness window
                     if not (rdt - d - ml) <= mdt <= (rdt + d):
@@ -1461,9 +1535,9 @@ class Kramer:
 
                         # Create txn cache and accept
                         mcr = TxnMsgCacheRecord(
-                            mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
+                            mdt=mdt, xdt=xdt, d=d, ml=ml, pml=pml,
                             xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                        self.db.kramTMSC.pin(key, mcr)
+                        self._cacheTxnMsg(key, mcr)
                         return msg
 
                     elif authType == AuthTypes.AttachedSignatureSingleKey:
@@ -1476,15 +1550,14 @@ class Kramer:
 
                         # Create txn cache and accept
                         mcr = TxnMsgCacheRecord(
-                            mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
+                            mdt=mdt, xdt=xdt, d=d, ml=ml, pml=pml,
                             xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                        self.db.kramTMSC.pin(key, mcr)
+                        self._cacheTxnMsg(key, mcr)
                         return msg
 
                 elif authType == AuthTypes.AttachedSignatureMultiKey:
                     # Per spec: for multi-key, mdt timeliness check comes before xdt resolution
-                    rdt = helping.fromIso8601(
-                        helping.nowIso8601()).timestamp() * 1000  # ms
+                    rdt = epochMs(helping.nowIso8601())  # ms
 
                     if not (rdt - d - ml) <= mdt <= (rdt + d):
                         return None  # outside mdt timeliness window
@@ -1492,14 +1565,14 @@ class Kramer:
                     # Resolve xdt after mdt check
                     match msgType:
                         case Ilks.xip:
-                            xdts = msg.ked.get('dt', None)
+                            xdt = epochMs(msg.ked.get('dt', None))
                         case Ilks.exn:
                             existingCache = next(
                                 self.db.kramTMSC.getTopItemIter((senderId, exId)),
                                 None)
                             if existingCache is not None:
                                 keys, cacheRecord = existingCache
-                                xdts = cacheRecord.xdt
+                                xdt = cacheRecord.xdt
                             else:
                                 return None  # no existing cache, drop
                         case _:
@@ -1507,7 +1580,6 @@ class Kramer:
                                 "Unexpected transactioned message type "
                                 "while kraming.")
 
-                    xdt = helping.fromIso8601(xdts).timestamp() * 1000
                     xl = cacheTypeRecord.xl
 
                     if not (xdt <= mdt <= xdt + xl):
@@ -1522,9 +1594,9 @@ class Kramer:
 
                     # At least one sig verified, create txn cache entry
                     mcr = TxnMsgCacheRecord(
-                        mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
+                        mdt=mdt, xdt=xdt, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramTMSC.pin(key, mcr)
+                    self._cacheTxnMsg(key, mcr)
 
                     # Check if threshold is immediately satisfied
                     sigIndices = [sig.index for sig in sigResult.sigers]
@@ -1764,6 +1836,7 @@ class Kramer:
                 self.db.kramCTYP.rem(ctype)
 
         self._kramCTYPCf = new
+        self._indexCtyp()
 
 
     def reconcileConfig(self):
@@ -1809,6 +1882,7 @@ class Kramer:
         now = helping.fromIso8601(helping.nowIso8601()).timestamp() * 1000
 
         # Iterate through pending
+        reindex = False
         for ctype, pend in list(self._pending.items()):
 
             # Once delta expires, it is safe to change the accept window values
@@ -1825,6 +1899,10 @@ class Kramer:
 
                 # Remove from pending
                 del self._pending[ctype]
+                reindex = True
+
+        if reindex:
+            self._indexCtyp()
 
 
     def _buildCoverageGraph(self, cf):
@@ -2092,70 +2170,191 @@ class Kramer:
                 raise KramError("Coverage hole detected, new configuration is invalid")
 
 
+    def _cacheMsg(self, key, mcr):
+        """Cache message record mcr at key and index its prune expiry.
+
+        Parameters:
+            key (tuple): (AID, MID) message cache key
+            mcr (MsgCacheRecord): message cache record
+        """
+        with self.db.batch():
+            self.db.kramMSGC.pin(key, mcr)
+            self.db.kramMSGX.pin((expiryKey(mcr.mdt + mcr.d + mcr.pml), *key), "")
+        if self._msgNotBefore is not None:
+            self._msgNotBefore = max(self._msgNotBefore, mcr.mdt - mcr.d)
+
+    def _cacheTxnMsg(self, key, mcr):
+        """Cache transactioned message record mcr at key and index its prune
+        expiry.
+
+        Parameters:
+            key (tuple): (AID, XID, MID) transactioned message cache key
+            mcr (TxnMsgCacheRecord): transactioned message cache record
+        """
+        with self.db.batch():
+            self.db.kramTMSC.pin(key, mcr)
+            self.db.kramTMSX.pin((expiryKey(mcr.xdt + mcr.pxl), *key), "")
+        if self._txnNotBefore is not None:
+            self._txnNotBefore = max(self._txnNotBefore, mcr.xdt)
+
+    def _remMsgState(self, aid, mid):
+        """Remove partial multi-key and non-auth attachment state at (aid, mid)"""
+        self.db.kramPMKM.rem(keys=(aid, mid))
+        self.db.kramPMKS.rem(keys=(aid, mid))
+        self.db.kramPMSK.rem(keys=(aid, mid))
+
+        # Remove non Auth Partials
+        self._remNonAuthAttachments((aid, mid))
+
     def _pruneMessages(self, rdt_ms):
         """
         Check message ID and prune expired cache entries and associated state.
-        rdt (Iso8601): receiver time
-        pml (int): prune lag cache value in milliseconds
-        d (int): drift lag cache value in milliseconds
+
+        Range scans the kramMSGX expiry index up to rdt_ms and deletes in one
+        write transaction so cost is proportional to the number of expired
+        entries not the size of the cache. An entry expires once
+        mdt + d + pml < rdt. Falls back to a full sweep when the index may be
+        incomplete, that is, on the first prune or when the receiver clock
+        has gone back before the mdt - d of some cached entry.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any entry pruned
         """
+        if self._msgNotBefore is None or rdt_ms < self._msgNotBefore:
+            return self._sweepMessages(rdt_ms)
+
         # Initialize a flag to track if pruned
         pruned = False
+        top = expiryKey(rdt_ms)
 
-        # Iterate over all message cache entries
-        for (aid, mid), cache in list(self.db.kramMSGC.getTopItemIter()):
-
-            # Convert messsage time from cache to milliseconds Int for comparison
-            mdt_ms = int(helping.fromIso8601(cache.mdt).timestamp() * 1000)
+        with self.db.batch():
+            for (exp, aid, mid), _ in self.db.kramMSGX.getTopItemIter():
+                if exp >= top:  # fixed width hex so lexical order is time order
+                    break
 
-            # Get the drift and prune lag values from the cache record
-            d = cache.d
-            pml = cache.pml
+                self.db.kramMSGX.rem(keys=(exp, aid, mid))
+                cache = self.db.kramMSGC.get(keys=(aid, mid))
+                if (cache is None or
+                        expiryKey(cache.mdt + cache.d + cache.pml) != exp):
+                    continue  # stale index entry, already pruned or recached
 
-            # Apply the comparison from the whitepaper
-            if not rdt_ms - d - pml <= mdt_ms <= rdt_ms + d:
                 self.db.kramMSGC.rem(keys=(aid, mid))
-                self.db.kramPMKM.rem(keys=(aid, mid))
-                self.db.kramPMKS.rem(keys=(aid, mid))
-                self.db.kramPMSK.rem(keys=(aid, mid))
+                self._remMsgState(aid, mid)
+                pruned = True
 
-                # Remove non Auth Partials
-                self._remNonAuthAttachments((aid, mid))
+        return pruned
 
-                pruned = True
+    def _sweepMessages(self, rdt_ms):
+        """
+        Full sweep of message ID cache that prunes expired entries, rebuilds
+        the kramMSGX expiry index for the remaining entries and resets
+        ._msgNotBefore.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any entry pruned
+        """
+        # Initialize a flag to track if pruned
+        pruned = False
+        notBefore = 0
+
+        with self.db.batch():
+            # Iterate over all message cache entries
+            for (aid, mid), cache in self.db.kramMSGC.getTopItemIter():
+                # Get the drift and prune lag values from the cache record
+                d = cache.d
+                pml = cache.pml
+                exp = expiryKey(cache.mdt + d + pml)
+
+                # Apply the comparison from the whitepaper
+                if not rdt_ms - d - pml <= cache.mdt <= rdt_ms + d:
+                    self.db.kramMSGC.rem(keys=(aid, mid))
+                    self.db.kramMSGX.rem(keys=(exp, aid, mid))
+                    self._remMsgState(aid, mid)
+                    pruned = True
+                else:
+                    self.db.kramMSGX.pin(keys=(exp, aid, mid), val="")
+                    notBefore = max(notBefore, cache.mdt - d)
 
+        self._msgNotBefore = notBefore
         return pruned
 
     def _pruneExchanges(self, rdt_ms):
         """
         Check exchanges ID and prune expired cache entries and associated state.
-        rdt (int): receiver time in milliseconds
-        pxl (int): prune lag cache value in milliseconds
+
+        Range scans the kramTMSX expiry index up to rdt_ms and deletes in one
+        write transaction. An entry expires once xdt + pxl < rdt. Falls back
+        to a full sweep when the index may be incomplete, that is, on the
+        first prune or when the receiver clock has gone back before the xdt
+        of some cached entry.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any entry pruned
         """
+        if self._txnNotBefore is None or rdt_ms < self._txnNotBefore:
+            return self._sweepExchanges(rdt_ms)
+
         # Initialize a flag to track if pruned
         pruned = False
+        top = expiryKey(rdt_ms)
 
-        # Iterate over all message cache entries
-        for (aid, xid, mid), cache in list(self.db.kramTMSC.getTopItemIter()):
-
-            # Get the exchange time from the cache
-            xdt_ms = int(helping.fromIso8601(cache.xdt).timestamp() * 1000)
+        with self.db.batch():
+            for (exp, aid, xid, mid), _ in self.db.kramTMSX.getTopItemIter():
+                if exp >= top:  # fixed width hex so lexical order is time order
+                    break
 
-            # Get the prune lag values from the cache record
-            pxl = cache.pxl
+                self.db.kramTMSX.rem(keys=(exp, aid, xid, mid))
+                cache = self.db.kramTMSC.get(keys=(aid, xid, mid))
+                if cache is None or expiryKey(cache.xdt + cache.pxl) != exp:
+                    continue  # stale index entry, already pruned or recached
 
-            # Apply the comparison
-            if not xdt_ms <= rdt_ms <= xdt_ms + pxl:
                 self.db.kramTMSC.rem(keys=(aid, xid, mid))
-                self.db.kramPMKM.rem(keys=(aid, mid))
-                self.db.kramPMKS.rem(keys=(aid, mid))
-                self.db.kramPMSK.rem(keys=(aid, mid))
+                self._remMsgState(aid, mid)
+                pruned = True
 
-                # Remove non Auth Partials
-                self._remNonAuthAttachments((aid, mid))
+        return pruned
 
-                pruned = True
+    def _sweepExchanges(self, rdt_ms):
+        """
+        Full sweep of transactioned message cache that prunes expired entries,
+        rebuilds the kramTMSX expiry index for the remaining entries and
+        resets ._txnNotBefore.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any entry pruned
+        """
+        # Initialize a flag to track if pruned
+        pruned = False
+        notBefore = 0
+
+        with self.db.batch():
+            # Iterate over all transactioned message cache entries
+            for (aid, xid, mid), cache in self.db.kramTMSC.getTopItemIter():
+                exp = expiryKey(cache.xdt + cache.pxl)
+
+                # Apply the comparison
+                if not cache.xdt <= rdt_ms <= cache.xdt + cache.pxl:
+                    self.db.kramTMSC.rem(keys=(aid, xid, mid))
+                    self.db.kramTMSX.rem(keys=(exp, aid, xid, mid))
+                    self._remMsgState(aid, mid)
+                    pruned = True
+                else:
+                    self.db.kramTMSX.pin(keys=(exp, aid, xid, mid), val="")
+                    notBefore = max(notBefore, cache.xdt)
 
+        self._txnNotBefore = notBefore
         return pruned
 
 
@@ -2172,7 +2371,7 @@ class Pruner(doing.Doer):
 
         while True:
             # compute receiver time in ms
-            rdt_ms = int(helping.nowUTC().timestamp() * 1000)
+            rdt_ms = epochMs(helping.nowIso8601())
 
             # check prune both messages and exchanges
             self.kramer._pruneMessages(rdt_ms=rdt_ms)
@@ -8,7 +8,7 @@ from copy import deepcopy
 from collections.abc import Mapping, Iterable
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 import json
 
 import cbor2 as cbor
@@ -19,7 +19,7 @@ from ordered_set import OrderedSet as oset
 from ..kering import (Colds, Kinds, EmptyMaterialError, InvalidValueError,
                       DeserializeError, SerializeError)
 
-from ..help import isNonStringIterable
+from ..help import isNonStringIterable, icetuple
 
 from .counting import  Codens, Counter
 from .coring import (MtrDex, Matter, Labeler, LabelDex, DecDex, Decimer,
@@ -74,7 +74,7 @@ class EscapeCodex:
     Bytes_Big_L2: str = '9AAB'  # Byte String big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 EscapeDex = EscapeCodex()  # Make instance
 
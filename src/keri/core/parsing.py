@@ -6,9 +6,10 @@ message stream parsing support
 """
 import copy
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field, astuple, asdict
 from collections import deque, namedtuple
-from base64 import urlsafe_b64encode as encodeB64
 
 from hio.help import ogler
 
@@ -70,6 +71,158 @@ class MsgParseDom:
 
 
 
+class Pipeline:
+    """Pipeline is staged processor for framed message units split off the
+    front of a stream by Parser when piped. Each unit is a complete
+    BodyWithAttachmentGroup, counter included, whose size is known from its
+    counter so it may be split off without decoding its contents.
+
+    Stage one decodes each unit into a MsgParseDom, inline by default or on a
+    pool of worker threads when workers is more than one. Decoding
+    deserializes and verifies the SAID of the message body and extracts the
+    attached primitives. Decoding is pure Python so worker threads only
+    decode concurrently on free-threaded builds. Under the GIL a pool adds
+    overhead without parallelism so the default is inline. Stage two applies the decoded units one
+    at a time on the calling thread, in stream order, through the Parser's
+    message processor so events of any given prefix are applied in the order
+    received. Signature verification happens when applied since the keys
+    needed to verify one event may be established by an earlier event in the
+    same batch.
+
+    Attributes:
+        workers (int): max number of worker threads in decode stage
+        batch (int): max number of units split off stream per pass
+
+    Hidden:
+        _pool (ThreadPoolExecutor | None): decode stage worker pool
+        _local (threading.local): per worker thread decoding Parser
+    """
+    Workers = 1  # default max worker threads, more only helps free-threaded builds
+    Batch = 64  # default max units per pass
+
+
+    def __init__(self, workers=None, batch=None):
+        """Initialize instance
+
+        Parameters:
+            workers (int | None): max number of worker threads in decode stage.
+                None means use default .Workers. Less than two means decode
+                inline on calling thread
+            batch (int | None): max number of units split off stream per pass
+                None means use default .Batch
+        """
+        self.workers = workers if workers is not None else self.Workers
+        self.batch = max(1, batch if batch is not None else self.Batch)
+        self._pool = None
+        self._local = threading.local()
+
+
+    @property
+    def pool(self):
+        """Returns decode stage worker pool, creating it when first used"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="keri-parse")
+        return self._pool
+
+
+    def close(self):
+        """Shut down decode stage worker pool if any"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+    def split(self, ims, version, limit=None):
+        """Returns list of complete BodyWithAttachmentGroup units split off
+        front of ims. Stops at first thing at front of ims that is not a
+        complete unit such as a message without enclosing group, some other
+        count code, or a group whose contents have not all arrived yet.
+        Leaves that for the Parser to parse in the normal way.
+
+        Parameters:
+            ims (bytearray): incoming message stream, units are stripped
+            version (Versionage): CESR version in context for count codes
+            limit (int | None): max number of units. None means .batch
+        """
+        limit = limit if limit is not None else self.batch
+        sucodes = Counter.SUCodes[version.major][version.minor]
+        codes = (sucodes.BodyWithAttachmentGroup,
+                 sucodes.BigBodyWithAttachmentGroup)
+        units = []
+        while ims and len(units) < limit:
+            try:
+                cold = sniff(ims)
+                if cold == Colds.msg:
+                    break
+                if cold == Colds.txt:
+                    ctr = Counter(qb64b=ims, strip=False, version=version)
+                else:
+                    ctr = Counter(qb2=ims, strip=False, version=version)
+            except Exception:  # leave error for normal parse to report
+                break
+
+            if ctr.code not in codes:
+                break
+            size = ctr.byteSize(cold=cold) + ctr.byteCount(cold=cold)
+            if len(ims) < size:  # not all arrived yet
+                break
+            units.append(ims[:size])
+            del ims[:size]
+
+        return units
+
+
+    def decode(self, unit, version, local):
+        """Returns MsgParseDom decoded from framed unit by worker thread's
+        own Parser since Parser version state is not safe to share
+
+        Parameters:
+            unit (bytearray): complete BodyWithAttachmentGroup
+            version (Versionage): CESR version in context for unit
+            local (bool): True means event source is local (protected)
+        """
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = Parser(version=version)
+        parser.version = version
+        parsator = parser.msgParsator(ims=unit, framed=True, piped=False,
+                                      local=local, version=version)
+        while True:
+            try:
+                next(parsator)
+            except StopIteration as ex:
+                return ex.value
+            raise SizedGroupError(f"Incomplete pipelined group of "
+                                  f"size={len(unit)}")
+
+
+    def stage(self, units, version, local):
+        """Returns list of decode stage futures or results one per unit in
+        stream order. Decodes inline when single unit or single worker.
+
+        Parameters:
+            units (list[bytearray]): complete BodyWithAttachmentGroup units
+            version (Versionage): CESR version in context for units
+            local (bool): True means event source is local (protected)
+        """
+        if len(units) < 2 or self.workers < 2:
+            return [self._inline(unit, version, local) for unit in units]
+        return [self.pool.submit(self.decode, unit, version, local)
+                for unit in units]
+
+
+    def _inline(self, unit, version, local):
+        """Returns completed Future from decode of unit on calling thread"""
+        future = Future()
+        try:
+            future.set_result(self.decode(unit, version, local))
+        except Exception as ex:
+            future.set_exception(ex)
+        return future
+
+
+
 class Parser:
     """Parser is stream parser that processes an incoming message stream.
     Each message in the stream is composed of a message body with a message foot
@@ -89,6 +242,8 @@ class Parser:
         framed (bool): True means stream is packet framed
         piped (bool): True means use pipeline processor to process
                 whenever stream includes pipelineable group count codes.
+        pipeline (Pipeline | None): staged processor used when piped.
+                None means create default when first piped
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
         exc (Exchanger): route EXN message types to this instance
@@ -189,7 +344,7 @@ class Parser:
 
     def __init__(self, ims=None, framed=True, piped=False, kvy=None,
                  tvy=None, exc=None, rvy=None, vry=None, local=False,
-                 version=Vrsn_2_0):
+                 version=Vrsn_2_0, pipeline=None):
         """
         Initialize instance:
 
@@ -208,10 +363,13 @@ class Parser:
                          False means event source is remote (unprotected) for validation
             version (Versionage): instance of version portion of genus version code
                                   for default code table
+            pipeline (Pipeline | None): staged processor used when piped.
+                None means create default when first piped
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
         self.piped = True if piped else False  # use pipeline processor
+        self.pipeline = pipeline
         self.kvy = kvy
         self.tvy = tvy
         self.exc = exc
@@ -861,12 +1019,53 @@ class Parser:
                         # top-level nested generics enclose messages plus attachments
                         framed = True
 
-                        if piped:
-                            pass  # pass extracted ims to pipeline processor
-                            return  # pop stack here instead
-
                         continue  # captures immediate further nested groups
 
+                if piped:  # split complete message groups off front of ims
+                    if self.pipeline is None:
+                        self.pipeline = Pipeline()
+                    units = self.pipeline.split(ims, version=self.version)
+                    if units:  # decode then apply in stream order
+                        futures = self.pipeline.stage(units,
+                                                      version=self.version,
+                                                      local=local)
+                        for future in futures:
+                            try:
+                                exts = future.result()
+                            except Exception as ex:  # unit already split off
+                                # so drop it and resume with next unit
+                                if logger.isEnabledFor(logging.TRACE):
+                                    logger.exception("GroupParsator error during "
+                                                     "pipelined extraction of "
+                                                     "msg+atc : %s", ex)
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.error("GroupParsator error during "
+                                                 "pipelined extraction of "
+                                                 "msg+atc : %s", ex)
+                                continue
+
+                            if not processive:
+                                results.append(exts)
+                                continue
+
+                            try:
+                                result = self.msgProcess(exts=asdict(exts),
+                                                         kvy=kvy,
+                                                         tvy=tvy,
+                                                         exc=exc,
+                                                         rvy=rvy,
+                                                         vry=vry)
+                            except (ValidationError, Exception) as ex:
+                                if logger.isEnabledFor(logging.TRACE):
+                                    logger.exception("GroupParsator error post "
+                                                     "pipelined extraction of "
+                                                     "msg+atc : %s", ex)
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.error("GroupParsator error post "
+                                                 "pipelined extraction of "
+                                                 "msg+atc : %s", ex)
+                        continue  # split more units or parse normally
+
                 # extract substream at current nesting level
                 try:
                     exts = yield from self.msgParsator(ims=ims,
@@ -1068,10 +1267,6 @@ class Parser:
                     framed = True  # since includes attachments so pre-extracted
                     enclosed = True  # attachments enclosed in group
 
-                    if piped:
-                        pass  # pass extracted ims to pipeline processor
-                        return
-
                     # peek for version
                     ctr = yield from self._extractor(ims=ims,
                                                      klas=Counter,
@@ -1115,14 +1310,11 @@ class Parser:
                     fims = ims[:size]  # copy out ctr and its content
                     del ims[:size]  # strip off from ims
 
-                    if cold == Colds.bny:  # tranform to text domain
-                        fims = encodeB64(fims)  # always process event in qb64 text domain
-                        size = (size * 4) // 3
-
                     # fims includes full body with counter but no attachments
                     serder = serdery.reap(ims=fims,
                                           genus=self.genus,
                                           svrsn=self.version,
+                                          cold=cold,
                                           ctr=ctr,
                                           size=size,
                                           fixed=True)
@@ -1139,14 +1331,11 @@ class Parser:
                     mims = ims[:size]  # copy out ctr and its content
                     del ims[:size]  # strip off from ims
 
-                    if cold == Colds.bny:  # tranform to text domain
-                        mims = encodeB64(mims)  # always process event in qb64 text domain
-                        size = (size * 4) // 3
-
                     # mims includes ctr and its content but no attachments
                     serder = serdery.reap(ims=mims,
                                           genus=self.genus,
                                           svrsn=self.version,
+                                          cold=cold,
                                           ctr=ctr,
                                           size=size,
                                           fixed=False)
@@ -1207,10 +1396,6 @@ class Parser:
                     ims = eims  # now just process substream as one counted frame
                     enclosed = True
 
-                    if piped:
-                        pass  # pass extracted ims to pipeline processor
-                        return
-
                     # peek for version change
                     ctr = yield from self._extractor(ims=ims,
                                                      klas=Counter,
@@ -18,6 +18,9 @@ from .eventing import validateSigs
 
 logger = ogler.getLogger()
 
+RouteCacheSize = 1024  # max cached route lookups per Router
+
+
 
 class Router:
     """Reply message router
@@ -25,6 +28,20 @@ class Router:
     Reply message router that accepts registration of route `r` handlers and dispatches
     reply messages to the appropriate handler.
 
+    Registered route templates are indexed by segment in a RouteTrie so the
+    cost of finding the route for a reply is independent of the number of
+    registered routes. Results are cached per route string.
+
+    Attributes:
+        routes (list): registered Route instances in registration order
+
+    Hidden:
+        ._trie (RouteTrie): segment trie of registered route templates
+        ._linear (list): (index, Route) of preregistered routes without template
+            that are matched by regex
+        ._cache (dict): route string keyed (Route, kwargs) of prior lookups
+            up to RouteCacheSize entries
+
     """
 
     defaultResourceFunc = "processReply"
@@ -36,7 +53,26 @@ class Router:
             routes (list): preregistered routes for this router
 
         """
-        self.routes = routes if routes is not None else list()
+        self.routes = list()
+        self._trie = RouteTrie()
+        self._linear = list()
+        self._cache = dict()
+        for route in (routes if routes is not None else []):
+            self._register(route)
+
+    def _register(self, route):
+        """Append route to .routes and index it by its template if any
+
+        Parameters:
+            route (Route): route to register
+        """
+        index = len(self.routes)
+        self.routes.append(route)
+        if route.template is not None:
+            self._trie.insert(route.template, index, route)
+        else:
+            self._linear.append((index, route))
+        self._cache.clear()
 
     def addRoute(self, routeTemplate, resource, suffix=None):
         """Add a route between a route template and a resource
@@ -52,8 +88,9 @@ class Router:
         """
 
         fields, regex = compile_uri_template(routeTemplate)
-        self.routes.append(
-            Route(regex=regex, fields=fields, resource=resource, suffix=suffix)
+        self._register(
+            Route(regex=regex, fields=fields, resource=resource, suffix=suffix,
+                  template=routeTemplate)
         )
 
     def dispatch(self, serder, diger, cigars, tsgs):
@@ -71,7 +108,7 @@ class Router:
         ked = serder.ked
         # Dispatch based on route
         r = ked["r"]
-        route, match = self._find(route=r)
+        route, kwargs = self._find(route=r)
         if route is None:
             raise ValidationError(f"No resource is registered to handle route {r}")
 
@@ -79,7 +116,6 @@ class Router:
         if route.suffix is not None:
             fname += route.suffix
 
-        kwargs = match.groupdict()
         for name in route.fields:
             if name not in kwargs:
                 raise ValidationError(f"parameter {name} not found in route {r}")
@@ -88,24 +124,38 @@ class Router:
         fn(serder=serder, diger=diger, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
 
     def _find(self, route):
-        """Linear seach thru added routes, returning the first one that matchs
+        """Find first registered route that matches route
 
-        Searches through the registered routes until a regex in one of the routes matches
-        the provided route and returns the Route object along with the re.Match object.
+        Looks up the route in the result cache and then in the segment trie.
+        When more than one registered route template matches, the one
+        registered first wins as with a linear search in registration order.
 
         Parameters:
             route (str): the route from the `r` of the reply message
 
         Returns:
             Route: the Route object with the resource that is registered to process this rpy message
-            re.Match:  the regular expression match that contains the grouping of matched parameters.
+            dict:  the matched parameters of the route keyed by field name
 
         """
-        for r in self.routes:
+        if (found := self._cache.get(route)) is not None:
+            return found
+
+        index, found, kwargs = self._trie.find(route)
+        for i, r in self._linear:
+            if found is not None and index < i:
+                break
             if res := r.regex.search(route):
-                return r, res
+                index, found, kwargs = i, r, res.groupdict()
+                break
+
+        if found is None:
+            return None, None
 
-        return None, None
+        if len(self._cache) >= RouteCacheSize:
+            del self._cache[next(iter(self._cache))]  # evict oldest
+        self._cache[route] = (found, kwargs)
+        return found, kwargs
 
     def processRouteNotFound(
         self, *, serder, diger, route, cigars=None, tsgs=None, **kwargs
@@ -606,10 +656,11 @@ class Route:
         .fields(set): field names for matches in regex
         .resource(object): the handler for this route
         .suffix(Optional(str)): a suffix to be applied to the handler method
+        .template(Optional(str)): url template the regex was compiled from
 
     """
 
-    def __init__(self, regex, fields, resource, suffix=None):
+    def __init__(self, regex, fields, resource, suffix=None, template=None):
         """Initialize instance of route
 
         Parameters:
@@ -617,12 +668,120 @@ class Route:
             fields(set): field names for matches in regex
             resource(object): the handler for this route
             suffix(Optional(str)): a suffix to be applied to the handler method
+            template(Optional(str)): url template the regex was compiled from
 
         """
         self.regex = regex
         self.fields = fields
         self.resource = resource
         self.suffix = suffix
+        self.template = template
+
+
+class RouteTrie:
+    """Segment trie of url route templates
+
+    Each node maps the next path segment to child nodes by kind of segment:
+        literal segments such as 'ksn' are keyed in .literals by lowercase
+            segment so matching is case insensitive like compile_uri_template
+        parameter segments such as '{aid}' are keyed in .params by field name
+        mixed segments such as '{said}.json' are kept in .patterns as
+            (regex, child) pairs
+
+    Finding a route walks one level per segment of the route so the cost is
+    independent of the number of registered templates.
+
+    Attributes:
+        literals (dict): lowercase literal segment keyed child RouteTrie
+        params (dict): field name keyed child RouteTrie
+        patterns (list): (re.Pattern, RouteTrie) for mixed segments
+        leaves (list): (index, Route) of templates that end at this node
+    """
+    __slots__ = ("literals", "params", "patterns", "leaves")
+
+    Field = re.compile(r"{([a-zA-Z]\w*)}")
+
+    def __init__(self):
+        self.literals = dict()
+        self.params = dict()
+        self.patterns = list()
+        self.leaves = list()
+
+    @staticmethod
+    def segments(route):
+        """Returns list of path segments of route or None when route is not a
+        path. Trailing slash of template is not significant so the caller
+        strips it from templates but not from routes as they are matched.
+
+        Parameters:
+            route (str): path such as '/ksn/{aid}' or '/ksn/EAbc'
+        """
+        if not route.startswith("/"):
+            return None
+        return route[1:].split("/")
+
+    def insert(self, template, index, route):
+        """Insert route at index of registration for template
+
+        Parameters:
+            template (str): url template such as '/end/role/{action}'
+            index (int): registration order of route, lower wins on ties
+            route (Route): route to insert
+        """
+        compile_uri_template(template)  # validate template
+        if template != "/" and template.endswith("/"):
+            template = template[:-1]
+
+        node = self
+        for segment in self.segments(template):
+            if (m := self.Field.fullmatch(segment)) is not None:
+                node = node.params.setdefault(m.group(1), RouteTrie())
+            elif "{" in segment:
+                _, regex = compile_uri_template("/" + segment)
+                for pattern, child in node.patterns:
+                    if pattern.pattern == regex.pattern:
+                        node = child
+                        break
+                else:
+                    child = RouteTrie()
+                    node.patterns.append((regex, child))
+                    node = child
+            else:
+                node = node.literals.setdefault(segment.lower(), RouteTrie())
+        node.leaves.append((index, route))
+
+    def find(self, route):
+        """Returns (index, Route, kwargs) of first registered template that
+        matches route or (None, None, None) when none match.
+
+        Parameters:
+            route (str): route from `r` field of message
+        """
+        if (segments := self.segments(route)) is None:
+            return None, None, None
+
+        best = (None, None, None)
+        stack = [(self, 0, {})]
+        while stack:
+            node, i, kwargs = stack.pop()
+            if i == len(segments):
+                for index, found in node.leaves:
+                    if best[0] is None or index < best[0]:
+                        best = (index, found, kwargs)
+                continue
+
+            segment = segments[i]
+            if (child := node.literals.get(segment.lower())) is not None:
+                stack.append((child, i + 1, kwargs))
+            if not segment:  # parameters never match empty segment
+                continue
+            for name, child in node.params.items():
+                stack.append((child, i + 1, {**kwargs, name: segment}))
+            for regex, child in node.patterns:
+                if (m := regex.match("/" + segment)) is not None:
+                    stack.append((child, i + 1, {**kwargs, **m.groupdict()}))
+
+        return best
 
 
 def compile_uri_template(template):
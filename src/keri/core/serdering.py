@@ -165,6 +165,7 @@ class Serdery:
                                 so use smell. Default None
             size (None|int): Not None means CESR native message using ctr and
                              size already calculated. All bytes in stream.
+                             When cold is Colds.bny size is in binary domain.
             fixed (bool): when CESR native message.
                                True means top-level fixed field
                                False means top-level field map
@@ -180,6 +181,14 @@ class Serdery:
             # then can populate smellage  "proto pvrsn kind size gvrsn"
             # Serder._inhale then does its .loads given the smellage kind is CESR
 
+            if cold == Colds.bny:  # native body always held in text domain
+                # since its said is computed over its qb64 serialization
+                raw = encodeB64(ims[:size])  # one conversion for whole body
+                if isinstance(ims, bytearray):
+                    del ims[:size]
+                ims = bytearray(raw)
+                size = len(ims)
+
             lsize = 0  # label size in bytes
             if not fixed:  # extract label for version field
                 labeler = Labeler(qb64b=ims[ctr.fullSize:])  # offset past ctr
@@ -1190,7 +1199,7 @@ class Serder:
                     sraw = raw[:ss]  # only copy enough bytes for serder
                     if strip and isinstance(raw, bytearray):
                         del raw[:ss]
-                    sraw = encodeB64(raw)  # loads expects Base64 text domain
+                    sraw = encodeB64(sraw)  # loads expects Base64 text domain
                 elif cold == Colds.txt:
                     ctr = Counter(qb64b=raw)
                     ss = ctr.byteCount(cold=cold) + ctr.byteSize(cold=cold)
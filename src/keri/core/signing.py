@@ -4,8 +4,10 @@ keri.core.signing module
 
 Provides support Signer class
 """
-from dataclasses import dataclass, astuple, asdict
+from dataclasses import dataclass, asdict
 from collections import namedtuple
+from base64 import urlsafe_b64encode as encodeB64
+from base64 import urlsafe_b64decode as decodeB64
 
 import pysodium
 
@@ -14,10 +16,14 @@ from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 from cryptography.hazmat.primitives.asymmetric import ec, utils
 
 from ..kering import (EmptyMaterialError, InvalidCodeError, InvalidSizeError,
-                      InvalidValueError, InvalidTypeError)
+                      InvalidValueError, InvalidTypeError, InvalidVersionError,
+                      KeriError, ShortageError, ColdStartError, Colds,
+                      Vrsn_2_0, SMELLSIZE, sniff, smell)
 
-from .coring import Matter, MtrDex, Verfer, Cigar
-from .indexing import IdrDex, Siger
+from ..help import icetuple
+from .coring import Matter, MtrDex, Verfer, Cigar, Texter, Bexter
+from .indexing import IdrDex, Indexer, Siger
+from .counting import Counter, Codens
 
 
 DSS_SIG_MODE = "fips-186-3"
@@ -501,7 +507,7 @@ class CipherX25519VarStrmCodex:
     X25519_Cipher_Big_L2: str = '9AAC'  # X25519 sealed box cipher bytes of sniffable stream plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXVarStrmDex = CipherX25519VarStrmCodex()  # Make instance
 
@@ -522,7 +528,7 @@ class CipherX25519VarQB64Codex:
     X25519_Cipher_QB64_Big_L2: str = '9AAD'  # X25519 sealed box cipher bytes of QB64 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXVarQB64Dex = CipherX25519VarQB64Codex()  # Make instance
 
@@ -539,7 +545,7 @@ class CipherX25519FixQB64Codex:
     X25519_Cipher_Salt:   str = '1AAH'  # X25519 sealed box 100 char qb64 Cipher of 24 char qb64 Salt
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXFixQB64Dex = CipherX25519FixQB64Codex()  # Make instance
 
@@ -562,7 +568,7 @@ class CipherX25519AllQB64Codex:
     X25519_Cipher_QB64_Big_L2: str = '9AAD'  # X25519 sealed box cipher bytes of QB64 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXAllQB64Dex = CipherX25519AllQB64Codex()  # Make instance
 
@@ -583,7 +589,7 @@ class CipherX25519QB2VarCodex:
     X25519_Cipher_QB2_Big_L2: str = '9AAE'  # X25519 sealed box cipher bytes of QB2 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXVarQB2Dex = CipherX25519QB2VarCodex()  # Make instance
 
@@ -616,7 +622,7 @@ class CipherX25519AllVarCodex:
     X25519_Cipher_QB2_Big_L2: str = '9AAE'  # X25519 sealed box cipher bytes of QB2 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXVarDex = CipherX25519AllVarCodex()  # Make instance
 
@@ -651,7 +657,7 @@ class CipherX25519AllCodex:
     X25519_Cipher_QB2_Big_L2: str = '9AAE'  # X25519 sealed box cipher bytes of QB2 plaintext big lead size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(icetuple(self))
 
 CiXDex = CipherX25519AllCodex()  # Make instance
 
@@ -1057,22 +1063,34 @@ class Streamer:
     """
     Streamer is CESR sniffable stream class
 
+    Transcodes CESR v2 sniffable streams between text qb64 and binary qb2
+    domains by walking count codes and primitives with the Counter, Matter,
+    and Indexer size tables without deserializing any messages. Each top-level
+    frame, that is a count code group or a non-native message body, is
+    validated then transcoded whole since CESR is composable. Non-native
+    message bodies are passed through unchanged. Memory used is bounded by
+    the largest frame not the stream.
 
     Has the following public properties:
 
     Properties:
         stream (bytearray): sniffable CESR stream
-
+        text (bytes): stream transcoded to qb64 text domain
+        binary (bytes): stream transcoded to qb2 binary domain
+        texter (Texter): stream as Texter
+        bexter (Bexter): text domain stream as Bexter
 
     Methods:
-
+        frames(stream) -> generator of validated top-level frames
+        transcode(chunks, cold) -> generator of transcoded frames
 
     Hidden:
         _verify() -> bool
 
-
-
     """
+    # group codes whose contents are indexed signatures
+    Indexed = (Codens.ControllerIdxSigs, Codens.BigControllerIdxSigs,
+               Codens.WitnessIdxSigs, Codens.BigWitnessIdxSigs)
 
     def __init__(self, stream, verify=False):
         """Initialize instance
@@ -1093,6 +1111,9 @@ class Streamer:
 
         self._stream = stream
 
+        if verify and not self._verify():
+            raise InvalidValueError(f"Invalid stream, not sniffable.")
+
 
     def _verify(self):
         """Returns True if .stream is sniffable, False otherwise
@@ -1104,7 +1125,159 @@ class Streamer:
         pipelineable in order to simply parse stream
 
         """
-        return False
+        try:
+            for _ in self.frames(self._stream):
+                pass
+        except (KeriError, ValueError):  # kering errors and b64 errors
+            return False
+        return True
+
+
+    @classmethod
+    def frames(cls, stream, version=Vrsn_2_0):
+        """Returns generator that validates each top-level frame at front of
+        stream and yields (cold, frame) where frame is memoryview of frame.
+        Raises ShortageError if stream ends in partial frame.
+
+        Parameters:
+            stream (bytes | bytearray | memoryview): sniffable CESR stream
+            version (Versionage): default CESR genus version of stream
+        """
+        mv = memoryview(stream)
+        while mv:
+            cold, size, version = cls._frame(mv, version=version)
+            yield cold, mv[:size]
+            mv = mv[size:]
+
+
+    @classmethod
+    def transcode(cls, chunks, cold=Colds.bny, version=Vrsn_2_0):
+        """Returns generator that incrementally transcodes stream provided as
+        iterable of chunks and yields each transcoded frame as bytes in
+        domain given by cold. Only buffers one partial frame at a time.
+        Raises ShortageError when chunks end in partial frame.
+
+        Parameters:
+            chunks (Iterable[bytes | bytearray | memoryview]): stream pieces
+            cold (str): target domain Colds.txt or Colds.bny
+            version (Versionage): default CESR genus version of stream
+        """
+        if cold not in (Colds.txt, Colds.bny):
+            raise InvalidValueError(f"Invalid transcode domain {cold=}.")
+
+        buf = bytearray()
+        for chunk in chunks:
+            buf.extend(chunk)
+            while buf:
+                try:
+                    fold, size, version = cls._frame(memoryview(buf),
+                                                     version=version)
+                except ShortageError:
+                    break  # wait for next chunk
+                yield cls._convert(buf[:size], fold, cold)
+                del buf[:size]
+
+        if buf:
+            raise ShortageError(f"Stream ends in partial frame of "
+                                f"{len(buf)} bytes.")
+
+
+    @staticmethod
+    def _convert(frame, fold, cold):
+        """Returns frame converted from domain fold to domain cold as bytes.
+        Non-native message bodies (fold == Colds.msg) are passed unchanged.
+        """
+        if fold == Colds.msg or fold == cold:
+            return bytes(frame)
+        if cold == Colds.bny:
+            return decodeB64(bytes(frame))
+        return encodeB64(frame)
+
+
+    @classmethod
+    def _frame(cls, mv, version):
+        """Returns (cold, size, version) of validated top-level frame at front
+        of mv where version is the genus version in effect after the frame.
+
+        Parameters:
+            mv (memoryview): stream
+            version (Versionage): genus version in effect before the frame
+        """
+        cold = sniff(mv)
+        if cold == Colds.msg:  # non-native body so smell its size
+            smellage = smell(mv[:SMELLSIZE])
+            if len(mv) < smellage.size:
+                raise ShortageError(f"Need {smellage.size - len(mv)} more bytes.")
+            return cold, smellage.size, version
+
+        if cold not in (Colds.txt, Colds.bny):
+            raise ColdStartError(f"Unsniffable stream start {cold=}.")
+
+        ctr = cls._counter(mv, cold, version)
+        cs = ctr.byteSize(cold=cold)
+        if ctr.name == Codens.KERIACDCGenusVersion:  # switches stream version
+            return cold, cs, cls._genus(ctr)
+
+        size = cs + ctr.byteCount(cold=cold)
+        if len(mv) < size:
+            raise ShortageError(f"Need {size - len(mv)} more bytes.")
+        cls._walk(mv[cs:size], cold, version, indexed=ctr.name in cls.Indexed)
+        return cold, size, version
+
+
+    @classmethod
+    def _walk(cls, mv, cold, version, indexed=False):
+        """Validates that contents of count code group mv is composed of
+        whole nested groups and primitives in domain cold
+
+        Parameters:
+            mv (memoryview): group contents
+            cold (str): Colds.txt or Colds.bny domain of group
+            version (Versionage): genus version in effect for group
+            indexed (bool): True means primitives are Indexer not Matter
+        """
+        while mv:
+            if (mv[0] == 0x2d if cold == Colds.txt else mv[0] >> 2 == 0x3e):
+                ctr = cls._counter(mv, cold, version)  # leading '-' is count code
+                cs = ctr.byteSize(cold=cold)
+                if ctr.name == Codens.KERIACDCGenusVersion:  # rest of group
+                    version = cls._genus(ctr)
+                    mv = mv[cs:]
+                    continue
+                size = cs + ctr.byteCount(cold=cold)
+                if len(mv) < size:
+                    raise ShortageError(f"Group overruns enclosing group.")
+                cls._walk(mv[cs:size], cold, version,
+                          indexed=ctr.name in cls.Indexed)
+            else:
+                if indexed:  # Indexer needs bytes, sig groups are small
+                    prim = bytes(mv)
+                    klas = Indexer
+                else:  # Matter slices memoryview without copying rest
+                    prim = mv
+                    klas = Matter
+                if cold == Colds.txt:
+                    size = len(klas(qb64b=prim).qb64b)
+                else:
+                    size = len(klas(qb2=prim).qb2)
+            mv = mv[size:]
+
+
+    @staticmethod
+    def _counter(mv, cold, version):
+        """Returns Counter at front of mv in domain cold"""
+        if cold == Colds.txt:  # count codes are at most 8 chars or 6 bytes
+            return Counter(qb64b=bytes(mv[:8]), version=version)
+        return Counter(qb2=bytes(mv[:6]), version=version)
+
+
+    @staticmethod
+    def _genus(ctr):
+        """Returns version from genus version counter ctr when sniffable"""
+        version = Counter.b64ToVer(ctr.countToB64(l=3))
+        if version.major < Vrsn_2_0.major:  # v1 count codes not all pipelineable
+            raise InvalidVersionError(f"Unsniffable genus {version=}.")
+        return version
 
 
     @property
@@ -1126,7 +1299,7 @@ class Streamer:
         pipelineable in order to simply parse and expand stream
 
         """
-        return self._stream
+        return b"".join(self.transcode([self._stream], cold=Colds.txt))
 
     @property
     def binary(self):
@@ -1140,19 +1313,19 @@ class Streamer:
         pipelineable in order to simply parse and compact stream
 
         """
-        return self._stream
+        return b"".join(self.transcode([self._stream], cold=Colds.bny))
 
     @property
     def texter(self):
         """stream as Texter instance.
 
-        Texter(text=self.stream)
+        Texter(raw=self.stream)
 
         Returns:
            texter (Texter): Texter primitive of stream suitable wrapping
 
         """
-        return self._stream
+        return Texter(raw=bytes(self._stream))
 
     @property
     def bexter(self):
@@ -1173,4 +1346,7 @@ class Streamer:
            bexter (Bexter): Bexter primitive of stream suitable wrapping
 
         """
-        return self._stream
+        text = self.text
+        if text[:1] == b'A':
+            raise InvalidValueError(f"Invalid stream start for Bexter.")
+        return Bexter(bext=text)
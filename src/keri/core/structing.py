@@ -7,7 +7,7 @@ Creates fixed field data structures
 from typing import NamedTuple
 from collections import namedtuple
 from collections.abc import Mapping
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 
 from ..kering import (Colds, ValidationError,
                       InvalidValueError, EmptyMaterialError)
@@ -168,7 +168,7 @@ class EmptyClanDom(IceMapDom):
     """
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 EClanDom = EmptyClanDom()  # create instance
 
@@ -188,7 +188,7 @@ class EmptyCastDom(IceMapDom):
     """
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 ECastDom = EmptyCastDom()  # create instance
 
@@ -213,7 +213,7 @@ class SealClanDom(IceMapDom):
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 SClanDom = SealClanDom()  # create instance
 
@@ -244,7 +244,7 @@ class SealCastDom(IceMapDom):
                                         d=Castage(Diger))  # SealKind class reference
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 SCastDom = SealCastDom()  # create instance
 
@@ -263,7 +263,7 @@ class BlindStateClanDom(IceMapDom):
     BoundState: type[NamedTuple] = BoundState  # BoundState class reference (d,u,td,ts,bn,bd)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 BSClanDom = BlindStateClanDom()  # create instance
 
@@ -295,7 +295,7 @@ class BlindStateCastDom(IceMapDom):
                                         bd=Castage(Noncer, 'nonce'))  # BoundState instance
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 BSCastDom = BlindStateCastDom()  # create instance
 
@@ -313,7 +313,7 @@ class TypeMediaClanDom(IceMapDom):
     TypeMedia: type[NamedTuple] = TypeMedia  # TypeMedia class reference (d,u,mt,mv)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 TMClanDom = TypeMediaClanDom()  # create instance
 
@@ -340,7 +340,7 @@ class TypeMediaCastDom(IceMapDom):
                                         mv=Castage(Texter, 'text'))  # TypeMedia instance
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 TMCastDom = TypeMediaCastDom()  # create instance
 
@@ -357,7 +357,7 @@ class FirstSeenClanDom(IceMapDom):
     FirstSeen: type[NamedTuple] = FirstSeen  # FirstSeen class reference (f,dt)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 FSClanDom = FirstSeenClanDom()  # create instance
 
@@ -380,7 +380,7 @@ class FirstSeenCastDom(IceMapDom):
                                       dt=Castage(Dater, 'dts'))  # FirstSeen instance
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 FSCastDom = FirstSeenCastDom()  # create instance
 
@@ -411,7 +411,7 @@ class AllClanDom(IceMapDom):
     FirstSeen: type[NamedTuple] = FirstSeen  # FirstSeen class reference (f,dt)
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 AClanDom = AllClanDom()  # create instance
 
@@ -462,7 +462,7 @@ class AllCastDom(IceMapDom):
                                       dt=Castage(Dater, 'dts'))  # FirstSeen instance
 
     def __iter__(self):
-        return iter(astuple(self))  # enables value not key inclusion test with "in"
+        return iter(helping.icetuple(self))  # enables value not key inclusion test with "in"
 
 ACastDom = AllCastDom()  # create instance
 
@@ -6,11 +6,12 @@ keri.db Package
 
 from . import basing, dbing, escrowing, koming, subing, webdbing
 
-from .basing import Baser, BaserDoer, openDB, reopenDB, statedict
+from .basing import Baser, BaserDoer, KeverWarmer, openDB, reopenDB, statedict
 from .dbing import (LMDBer, clearDatabaserDir, openLMDB, onKey,
                     snKey, fnKey, dgKey, dtKey, splitKey, splitOnKey,
                     splitKeyDT, fetchTsgs, suffix, unsuffix,
-                    splitKeyFN, SuffixSize, splitSnKey, MaxSuffix)
+                    splitKeyFN, SuffixSize, splitSnKey, MaxSuffix,
+                    BoundTxn, CursorPoolSize)
 from .webdbing import WebDBer
 from .escrowing import Broker
 from .koming import KomerBase, Komer, IoSetKomer, DupKomer
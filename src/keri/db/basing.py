@@ -3,11 +3,17 @@
 KERI
 keri.db.basing module
 """
+import datetime
+import heapq
 import importlib
+import itertools
 import os
 import shutil
-from collections import namedtuple
+import tempfile
+import weakref
+from collections import namedtuple, OrderedDict
 from contextlib import contextmanager
+import blake3
 import lmdb
 import semver
 from ordered_set import OrderedSet as oset
@@ -17,15 +23,16 @@ from hio.help import ogler
 
 from keri import __version__
 from .dbing import LMDBer, dgKey, openLMDB
+from ..help import helping
 from ..kering import (MissingEntryError, DatabaseError, SerializeError,
                       ConfigurationError, ValidationError, Version,
-                      Vrsn_1_0, Vrsn_2_0)
+                      Vrsn_1_0, Vrsn_2_0, Colds)
 from ..recording import (KeyStateRecord, EventSourceRecord,
                          HabitatRecord, TopicsRecord,
                          OobiRecord, EndpointRecord,
                          LocationRecord, ObservedRecord,
                          CacheTypeRecord, TxnMsgCacheRecord,
-                         MsgCacheRecord, WellKnownAuthN)
+                         MsgCacheRecord, WellKnownAuthN, SnapshotRecord)
 
 
 logger = ogler.getLogger()
@@ -46,9 +53,15 @@ def _strip_prerelease(version_str):
 MIGRATIONS = [
     ("0.6.8", ["hab_data_rename"]),
     ("1.0.0", ["add_key_and_reg_state_schemas"]),
-    ("1.2.0", ["rekey_habs"])
+    ("1.2.0", ["rekey_habs"]),
+    ("2.0.0", ["index_anchor_seals", "compact_records",
+               "kram_int_timestamps"])
 ]
 
+EventCacheSize = 1024  # max hydrated event serders cached by Baser.evts
+SnapshotChunkSize = 65536  # bytes read per chunk by Baser.importKELs
+KeverCacheSize = 65536  # max kevers cached in memory by Baser.kevers
+
 
 # ToDo XXXX maybe
 '''
@@ -72,22 +85,39 @@ class komerdict(dict):
 '''
 
 
-class statedict(dict):
+class statedict(OrderedDict):
     """
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When maxSize is not zero the cache is bounded with least recently used
+    eviction. Kevers of local prefixes and groups of db are pinned and never
+    evicted. Evicted kevers are reloaded from their persisted key state on
+    next access.
+
+    Attributes:
+        db (Baser | None): database of key states for read through
+        maxSize (int): max number of kevers in cache. Zero means unbounded
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups not found in memory
+        evictions (int): count of kevers evicted
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'maxSize', 'hits', 'misses', 'evictions')
 
-    def __init__(self, *pa, **kwa):
-        super(statedict, self).__init__(*pa, **kwa)
+    def __init__(self, *pa, maxSize=0, **kwa):
         self.db = None
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        super(statedict, self).__init__(*pa, **kwa)  # after attrs since sets items
 
     def __getitem__(self, k):
         try:
-            return super(statedict, self).__getitem__(k)
+            kever = super(statedict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
@@ -100,6 +130,18 @@ class statedict(dict):
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.maxSize:
+            self.move_to_end(k)  # most recently used
+        return kever
+
+    def __setitem__(self, k, v):
+        super(statedict, self).__setitem__(k, v)
+        if self.maxSize:
+            self.move_to_end(k)  # most recently used
+            if len(self) > self.maxSize:
+                self.evict()
+
     def __contains__(self, k):
         if not super(statedict, self).__contains__(k):
             try:
@@ -126,6 +168,29 @@ class statedict(dict):
         else:
             return self.__getitem__(k)
 
+    def pinned(self, k):
+        """Returns True if kever at k is pinned in cache as a local prefix
+        or group of .db. False otherwise
+        """
+        return self.db is not None and (k in self.db.prefixes or
+                                        k in self.db.groups)
+
+    def evict(self):
+        """Evicts least recently used kevers that are not pinned until
+        cache size is within .maxSize. Pinned kevers are moved to the most
+        recently used end so each kever is visited at most once.
+        """
+        for _ in range(len(self)):
+            if len(self) <= self.maxSize:
+                break
+            k = next(iter(self))  # least recently used
+            kever = super(statedict, self).__getitem__(k)  # no hit count
+            super(statedict, self).__delitem__(k)
+            if self.pinned(k):
+                super(statedict, self).__setitem__(k, kever)  # back at end
+            else:
+                self.evictions += 1
+
 
 def openDB(*, cls=None, name="test", **kwa):
     """
@@ -173,6 +238,17 @@ class Baser(LMDBer):
         prefixes (OrderedSet): local prefixes corresponding to habitats for
             this db
         groups (OrderedSet): group hab identifier prefixes for this db
+        escrowWakes (OrderedSet): identifier prefixes whose escrowed events or
+            receipts may now make progress because something they wait on
+            arrived since Kevery.processEscrows last consumed the wakes
+        escrowAccepted (bool): True means some event was accepted into a KEL
+            since Kevery.processEscrows last consumed the wakes so escrows
+            that wait on other identifiers, such as delegation, may progress
+        observers (WeakSet): in memory observers, such as watcher key state
+            Adjudicators, notified by Kevery when it saves a key state notice
+            via .keyStateSaved(aid, ksr) and a watched AID via
+            .watchedUpdated(cid, aid, oid, enabled) and by Kever when it
+            accepts an event into a local KEL via .keyStateUpdated(pre)
 
         .evts is named subDB instance of SerderSuber whose values are serialized
             key events
@@ -180,6 +256,7 @@ class Baser(LMDBer):
             dgKey (prefix + digest)
             DB is keyed by identifier prefix plus digest of serialized event
             Only one value per DB key is allowed
+            Hydrated events are kept in a bounded LRU cache of EventCacheSize
 
         .fels is named subDB instance of OnSuber for first seen event logs (FEL)
             as indices mapping first-seen ordinal fn to event digests.
@@ -217,6 +294,16 @@ class Baser(LMDBer):
             (fixed 24-char), used to lookup authorizer's source event in .kels.
             Only one value per DB key is allowed.
 
+        .anxs is named subDB instance of CatCesrIoSetSuber (klas=(Number, Diger))
+            anchored seal index that maps identifier prefix of a KEL plus the
+            digest field 'd' of a seal anchored in one of its events to the
+            sn and said of each such anchoring event. Populated when events
+            are logged so seal lookups do not walk the KEL.
+            subkey 'anxs.'
+            Key: identifier prefix + seal digest
+            Value: (Number, Diger) tuple; Number serialized as Huge
+            More than one value per DB key is allowed (insertion ordered).
+
         .sigs is named subDB instance of CesrIoSetSuber (klas=Siger) for
             fully qualified indexed event signatures from the controller.
             subkey 'sigs.'
@@ -353,6 +440,14 @@ class Baser(LMDBer):
             dupsort=True
             More than one value per DB key is allowed.
 
+        .etxs is named subDB instance of Suber (sep='^') time index of event
+            escrows ooes, pses, pwes, pdes and ldes ordered by escrow datetime so
+            stale escrowed events may be pruned without walking the escrows.
+            subkey 'etxs.'
+            Key: escrow subkey name + UTC escrow datetime + prefix + digest
+            Value: hex sequence number of escrowed event
+            sep='^' since iso8601 datetime includes '.'
+
         .fons is named subDB instance of CesrSuber (klas=Number) mapping
             prefix and digest to fn value (first seen ordinal number) of the
             associated event. Given pre and event digest, retrieve fn here then
@@ -744,6 +839,18 @@ class Baser(LMDBer):
             datetimes, drift, and lag values.
             subkey 'tmsc.'
 
+        .kramMSGX is named subDB instance of Suber for KRAM message cache
+            expiry index. Maps (expiry, AID, MID) to empty value where expiry
+            is fixed width hex of int ms mdt + d + pml after which the kramMSGC
+            entry at (AID, MID) is pruned. Lexical order is expiry order.
+            subkey 'msgx.'
+
+        .kramTMSX is named subDB instance of Suber for KRAM transactioned
+            message cache expiry index. Maps (expiry, AID, XID, MID) to empty
+            value where expiry is fixed width hex of int ms xdt + pxl after
+            which the kramTMSC entry at (AID, XID, MID) is pruned.
+            subkey 'tmsx.'
+
         .kramPMKM is named subDB instance of SerderSuber for KRAM partially signed
             multi-key messages. Maps (AID, MID) key to the associated
             SerderKERI message.
@@ -854,8 +961,10 @@ class Baser(LMDBer):
 
     Properties:
         kevers (statedict): read through cache of kevers of states for KELs in db
+            bounded to KeverCacheSize kevers excluding local prefixes and groups
 
     """
+    MaxNamedDBs = 128
 
     def __init__(self, headDirPath=None, reopen=False, **kwa):
         """
@@ -877,8 +986,12 @@ class Baser(LMDBer):
         """
         self.prefixes = oset()  # should change to hids for hab ids
         self.groups = oset()  # group hab ids
-        self._kevers = statedict()
+        self._kevers = statedict(maxSize=KeverCacheSize)
         self._kevers.db = self  # assign db for read through cache of kevers
+        self.escrowWakes = oset()  # prefixes with escrows that may progress
+        self.escrowAccepted = False  # event accepted since escrows processed
+        self.observers = weakref.WeakSet()  # notified of key state and watched updates
+        self.anxed = set()  # prefixes whose .anxs index was backfilled from KEL
 
         if (mapSize := os.getenv(KERIBaserMapSizeKey)) is not None:
             try:
@@ -921,12 +1034,15 @@ class Baser(LMDBer):
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
 
-        self.evts = subing.SerderSuber(db=self, subkey='evts.')
+        self.evts = subing.SerderSuber(db=self, subkey='evts.',
+                                       cacheSize=EventCacheSize)
         self.fels = subing.OnSuber(db=self, subkey='fels.')
         self.kels = subing.OnIoDupSuber(db=self, subkey='kels.')
         self.dtss = subing.CesrSuber(db=self, subkey='dtss.', klas=coring.Dater)
         self.aess = subing.CatCesrSuber(db=self, subkey='aess.',
                                         klas=(coring.Number, coring.Diger))
+        self.anxs = subing.CatCesrIoSetSuber(db=self, subkey='anxs.',
+                                        klas=(coring.Number, coring.Diger))
         self.sigs = subing.CesrIoSetSuber(db=self, subkey='sigs.',
                                         klas=(indexing.Siger))
         self.wigs = subing.CesrIoSetSuber(db=self, subkey='wigs.', klas=indexing.Siger)
@@ -954,6 +1070,7 @@ class Baser(LMDBer):
         self.dels = subing.OnIoDupSuber(db=self, subkey='dels.')
         self.ldes = subing.OnIoDupSuber(db=self, subkey='ldes.')
         self.qnfs = subing.IoSetSuber(db=self, subkey="qnfs.", dupsort=True)
+        self.etxs = subing.Suber(db=self, subkey='etxs.', sep='^')
 
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=coring.Number)
@@ -976,7 +1093,8 @@ class Baser(LMDBer):
         # TODO: clean
         self.states = koming.Komer(db=self,
                                    klas=KeyStateRecord,
-                                   subkey='stts.')
+                                   subkey='stts.',
+                                   kind=koming.Packed)
 
         self.wits = subing.CesrIoSetSuber(db=self, subkey="wits.", klas=coring.Prefixer)
 
@@ -1026,18 +1144,21 @@ class Baser(LMDBer):
         # service endpoint identifier (eid) auths keyed by controller cid.role.eid
         # data extracted from reply /end/role/add or /end/role/cut
         self.ends = koming.Komer(db=self, subkey='ends.',
-                                 klas=EndpointRecord, )
+                                 klas=EndpointRecord,
+                                 kind=koming.Packed)
 
         # service endpoint locations keyed by eid.scheme  (endpoint identifier)
         # data extracted from reply loc
         self.locs = koming.Komer(db=self,
                                  subkey='locs.',
-                                 klas=LocationRecord, )
+                                 klas=LocationRecord,
+                                 kind=koming.Packed)
         # observed oids by watcher by cid.aid.oid  (endpoint identifier)
         # data extracted from reply loc
         self.obvs = koming.Komer(db=self,
                                  subkey='obvs.',
-                                 klas=ObservedRecord, )
+                                 klas=ObservedRecord,
+                                 kind=koming.Packed)
 
         # index of last retrieved message from witness mailbox
         # TODO: clean
@@ -1254,15 +1375,24 @@ class Baser(LMDBer):
 
         # KRAM cache type — key: expression string, value: drift and lag params
         self.kramCTYP = koming.Komer(db=self, subkey='ctyp.',
-                                 klas=CacheTypeRecord)
+                                 klas=CacheTypeRecord,
+                                 kind=koming.Packed)
 
         # KRAM message cache — key: (AID, MID), value: msg datetime, drift, lags
         self.kramMSGC = koming.Komer(db=self, subkey='msgc.',
-                                 klas=MsgCacheRecord)
+                                 klas=MsgCacheRecord,
+                                 kind=koming.Packed)
 
         # KRAM transactioned message cache — key: (AID, XID, MID), value: datetimes, drift, lags
         self.kramTMSC = koming.Komer(db=self, subkey='tmsc.',
-                                 klas=TxnMsgCacheRecord)
+                                 klas=TxnMsgCacheRecord,
+                                 kind=koming.Packed)
+
+        # KRAM message cache expiry index — key: (expiry, AID, MID), value: empty
+        self.kramMSGX = subing.Suber(db=self, subkey='msgx.')
+
+        # KRAM transactioned message cache expiry index — key: (expiry, AID, XID, MID), value: empty
+        self.kramTMSX = subing.Suber(db=self, subkey='tmsx.')
 
         # KRAM partially signed multi-key message key (AID.MID) mapped to associated message (SerderKERI)
         self.kramPMKM = subing.SerderSuber(db=self, subkey='pmkm.')
@@ -1326,6 +1456,71 @@ class Baser(LMDBer):
         return self.env
 
 
+    @contextmanager
+    def batch(self):
+        """
+        Context manager of a scoped write transaction shared by all sub dbs.
+        See LMDBer.batch. Clears the .evts serder cache when the transaction
+        aborts so that no serder read from uncommitted writes is reused.
+
+        Yields:
+            txn (lmdb.Transaction): shared write transaction
+        """
+        try:
+            with super().batch() as txn:
+                yield txn
+        except Exception:
+            self.evts.clearCache()
+            raise
+
+
+    def wakeEscrows(self, pre, accepted=False):
+        """Wakes escrowed entries for identifier prefix pre so next
+        Kevery.processEscrows revisits them instead of walking whole escrows.
+
+        Parameters:
+            pre (str|bytes): qb64 identifier prefix of escrowed entries to wake
+            accepted (bool): True means an event for pre was accepted into its
+                KEL which may also unblock escrows of other prefixes
+        """
+        self.escrowWakes.add(pre.decode() if hasattr(pre, "decode") else pre)
+        if accepted:
+            self.escrowAccepted = True
+
+
+    def timeEscrow(self, escrow, pre, sn, dig):
+        """Adds escrowed event to .etxs time index using the escrow datetime
+        in .dtss so that stale entries may be found in datetime order.
+        Idempotent.
+
+        Returns:
+            result (bool): True if added to index. False if already indexed
+                or no escrow datetime
+
+        Parameters:
+            escrow (str): subkey name of escrow such as 'ooes'
+            pre (str|bytes): qb64 identifier prefix of escrowed event
+            sn (int): sequence number of escrowed event
+            dig (str|bytes): qb64 digest of escrowed event
+        """
+        pre = pre.decode() if hasattr(pre, "decode") else pre
+        dig = dig.decode() if hasattr(dig, "decode") else dig
+        if (dater := self.dtss.get(keys=dgKey(pre, dig))) is None:
+            return False
+        dts = helping.toIso8601(dater.datetime.astimezone(datetime.timezone.utc))
+        return self.etxs.put(keys=(escrow, dts, pre, dig), val=f"{sn:x}")
+
+
+    def takeEscrowWakes(self):
+        """Returns tuple (pres, accepted) of woken prefixes and accepted flag
+        and resets both so later wakes are collected for the next pass.
+        """
+        pres, accepted = list(self.escrowWakes), self.escrowAccepted
+        self.escrowWakes.clear()
+        self.escrowAccepted = False
+        return (pres, accepted)
+
+
     def reload(self):
         """
         Reload stored prefixes and Kevers from .habs
@@ -1357,6 +1552,38 @@ class Baser(LMDBer):
         for keys in removes:  # remove bare .habs records
             self.habs.rem(keys=keys)
 
+    def warmKeverIter(self, size=None):
+        """
+        Generator that preloads into .kevers the kevers of the size KELs with
+        the most recently updated key states. Scans .states first then loads.
+        Yields after each key state scanned and each kever loaded so that
+        the warm up may be spread over time. See KeverWarmer.
+
+        Returns:
+            count (int): number of kevers loaded
+
+        Parameters:
+            size (int | None): number of kevers to preload. None means
+                .kevers.maxSize
+        """
+        size = size if size is not None else self.kevers.maxSize
+        hottest = []  # min heap of (dt, pre) so least recent is popped
+        for (pre, ), ksr in self.states.getTopItemIter():
+            if size:
+                if len(hottest) < size:
+                    heapq.heappush(hottest, (ksr.dt, pre))
+                else:
+                    heapq.heappushpop(hottest, (ksr.dt, pre))
+            yield
+
+        count = 0
+        for dt, pre in sorted(hottest):  # hottest last so most recently used
+            if pre in self.kevers:  # read through loads if not in memory
+                count += 1
+            yield
+
+        return count
+
     def migrate(self):
         """ Run all migrations required
 
@@ -1699,8 +1926,159 @@ class Baser(LMDBer):
             yield msg
 
 
+    def exportKELs(self, out, pres=None, signer=None, gvrsn=Version):
+        """
+        Streams first seen replay of KELs with attachments as CESR to out one
+        message at a time so memory use is bounded by the largest message not
+        the size of the database. Computes a snapshot manifest of the stream
+        and signs it when signer is provided. See .importKELs
+
+        Returns:
+            result (tuple): (snapshot, cigar) where snapshot is SnapshotRecord
+                manifest of stream and cigar is Cigar signature by signer of
+                snapshot._asjson() or None when signer not provided
+
+        Parameters:
+            out (object): file like sink with write method such as a file
+                opened in binary mode or socket.makefile("wb")
+            pres (Iterable | None): qb64 identifier prefixes of KELs to export.
+                None means export all KELs in database
+            signer (Signer | None): signer of snapshot manifest
+            gvrsn (Versionage): CESR genus version for attachments
+        """
+        from ..core import Diger, DigDex
+
+        if pres is None:
+            msgs = self.cloneAllPreIter(gvrsn=gvrsn)
+            pres = []
+        else:
+            pres = list(pres)
+            msgs = itertools.chain.from_iterable(self.clonePreIter(pre=pre,
+                                                                   gvrsn=gvrsn)
+                                                 for pre in pres)
+
+        hasher = blake3.blake3()
+        count = 0
+        for msg in msgs:
+            out.write(msg)
+            hasher.update(msg)
+            count += 1
+
+        snapshot = SnapshotRecord(d=Diger(raw=hasher.digest(),
+                                          code=DigDex.Blake3_256).qb64,
+                                  n=count,
+                                  pres=pres,
+                                  dt=helping.nowIso8601())
+        cigar = signer.sign(ser=snapshot._asjson()) if signer else None
+        return (snapshot, cigar)
+
+
+    def importKELs(self, ims, snapshot=None, cigar=None, verfer=None,
+                   size=SnapshotChunkSize, gvrsn=Version):
+        """
+        Ingests snapshot stream of KELs as written by .exportKELs read from ims
+        in chunks of size bytes so memory use is bounded by chunk size not the
+        size of the stream. Events keep their cloned first seen ordinals and
+        datetimes.
+
+        When snapshot, cigar, and verfer are all provided then the import is
+        trusted. The cigar must verify the snapshot manifest with verfer and
+        the digest of the stream must match the manifest otherwise raises
+        ValidationError before any event is ingested. The stream is copied to
+        a temporary file while it is hashed and events are ingested from that
+        verified copy, so ims is read only once. Trusted events are not
+        signature verified again. Otherwise every event is fully validated
+        as from any remote source.
+
+        Raises ValidationError when the stream ends with a partial message or
+        when snapshot is provided and the number of event messages parsed from
+        the stream does not match snapshot.n. Events already in the database
+        count since import is idempotent.
+
+        Import is not atomic. Each chunk is committed as it is ingested so a
+        stream that fails a check after ingest leaves the events of its
+        earlier chunks in the database. Since import is idempotent the import
+        may be retried with a corrected stream.
+
+        Parameters:
+            ims (object): file like source with read method
+            snapshot (SnapshotRecord | None): manifest of stream
+            cigar (Cigar | None): signature on snapshot._asjson()
+            verfer (Verfer | None): trusted key of snapshot signer
+            size (int): number of bytes to read from ims per chunk
+            gvrsn (Versionage): CESR genus version of stream
+        """
+        from ..core import Diger, DigDex
+
+        trusted = snapshot is not None and cigar is not None and verfer is not None
+        if trusted:
+            if not verfer.verify(sig=cigar.raw, ser=snapshot._asjson()):
+                raise ValidationError(f"Invalid signature on snapshot "
+                                      f"manifest d={snapshot.d}.")
+            with tempfile.TemporaryFile() as tmp:
+                hasher = blake3.blake3()
+                while chunk := ims.read(size):
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+                digest = Diger(raw=hasher.digest(), code=DigDex.Blake3_256).qb64
+                if digest != snapshot.d:
+                    raise ValidationError(f"Mismatch snapshot stream digest="
+                                          f"{digest} for manifest d={snapshot.d}.")
+                tmp.seek(0)
+                self._ingestKELs(tmp, snapshot=snapshot, trusted=True,
+                                 size=size, gvrsn=gvrsn)
+        else:
+            self._ingestKELs(ims, snapshot=snapshot, trusted=False, size=size,
+                             gvrsn=gvrsn)
+
 
-    def cloneEvtMsg(self, pre, fn, dig, gvrsn=Version, *, version=None):
+    def _ingestKELs(self, ims, snapshot=None, trusted=False,
+                    size=SnapshotChunkSize, gvrsn=Version):
+        """
+        Parses and processes snapshot stream read from ims in chunks of size
+        bytes for .importKELs.
+
+        Parameters:
+            ims (object): file like source with read method
+            snapshot (SnapshotRecord | None): manifest of stream to check
+                count of parsed event messages against
+            trusted (bool): True means ims is verified copy of trusted stream
+            size (int): number of bytes to read from ims per chunk
+            gvrsn (Versionage): CESR genus version of stream
+        """
+        from ..core import parsing
+        from ..core.eventing import Kevery
+
+        kvy = Kevery(db=self, lax=True, local=False, cloned=True, direct=False,
+                     trusted=trusted)
+        psr = parsing.Parser(kvy=kvy, framed=False, version=gvrsn)
+        buf = bytearray()
+        parsator = psr.parsator(ims=buf)
+        while chunk := ims.read(size):
+            buf.extend(chunk)
+            with self.batch():  # one commit per chunk
+                while buf:
+                    left = len(buf)
+                    next(parsator)
+                    if len(buf) == left:  # shortage so need next chunk
+                        break
+            kvy.cues.clear()  # not used so keep memory bounded by chunk
+
+        if buf:  # stream ended inside a message
+            raise ValidationError(f"Truncated snapshot stream with {len(buf)} "
+                                  f"trailing bytes.")
+
+        kvy.processEscrows()  # events whose dependencies came later in stream
+        kvy.cues.clear()
+
+        if snapshot is not None and kvy.processed != snapshot.n:
+            raise ValidationError(f"Mismatch snapshot event count="
+                                  f"{kvy.processed} for manifest n={snapshot.n}.")
+
+
+
+    def cloneEvtMsg(self, pre, fn, dig, gvrsn=Version, *, version=None,
+                    cold=Colds.txt):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
 
@@ -1710,6 +2088,8 @@ class Baser(LMDBer):
             dig (bytes): digest of event
             gvrsn (Versionage): CESR genus version for attachments
             version (Versionage): legacy alias for gvrsn
+            cold (str): Colds.txt means qb64 text domain attachments
+                        Colds.bny means qb2 binary domain attachments
 
         Returns:
             msg (bytearray): message body with attachments
@@ -1719,65 +2099,66 @@ class Baser(LMDBer):
         if version is not None:
             gvrsn = version
 
-        keys = (pre, dig)
-
-        # get serder
-        if not (serder := self.evts.get(keys=keys)):
-            raise MissingEntryError("Missing event for dig={}.".format(dig))
-
-        # get indexed signatures
-        if not (sigers := self.sigs.get(keys=keys)):
-            raise MissingEntryError("Missing sigs for dig={}.".format(dig))
-
-        # get indexed witness signatures if any
-        wigers = self.wigs.get(keys=keys)
-
-        # get nontrans endorsement couples not witnesses
-        # may have been originally key event attachments or receipted endorsements
-        cigars = []
-        if coups := self.rcts.get(keys=keys):
-            for prefixer, cigar in coups:
-                cigar.verfer = prefixer  # assign verfer
-                cigars.append(cigar)
-
-        # get trans receipt/endorsement attachments not controller
-        # vrcsNew get non-controller trans receipt attachments
-        # may have been originally non-controller sigs or receipted endorsements
-        topkeys = (pre, dig)
-        rsets = dict()  # collate  by triple of rpre,rsnh,rdig
-        for quintkeys, siger in self.vrcs.getTopItemIter(keys=topkeys):
-            epre, edig, rpre, rsnh, rdig = quintkeys  # expand quintkeys tuple
-            triple = (rpre, rsnh, rdig)  # create triple of receiptor/endorser
-            if triple not in rsets:
-                rsets[triple] = [siger]
-            else:
-                rsets[triple].append(siger)
-
-        rsgs = []
-        if rsets:  # convert rsets dict to rsgs list of tuples
-            for triple, rigers in rsets.items():
-                rpre, rsnh, rdig = triple
-                rsgs.append((Prefixer(qb64=rpre),
-                             Number(snh=rsnh),
-                             Diger(qb64=rdig),
-                             rigers))
-
-
-        # get authorizer (delegator/issuer) source seal event couple if any
-        bonds = []
-        if couple := self.aess.get(keys=keys):
-            number, diger = couple
-            bonds.append(SealSource(s=number, d=diger))
-
-        # get first seen replay couples
-        if not (dater := self.dtss.get(keys=keys)):
-            raise MissingEntryError("Missing datetime for dig={}.".format(dig))
-
-        bonds.append(FirstSeen(f=Number(num=fn), dt=dater))
-
+        with self.reading():  # one read snapshot for all sub dbs of event
+            keys = (pre, dig)
+
+            # get serder
+            if not (serder := self.evts.get(keys=keys)):
+                raise MissingEntryError("Missing event for dig={}.".format(dig))
+
+            # get indexed signatures
+            if not (sigers := self.sigs.get(keys=keys)):
+                raise MissingEntryError("Missing sigs for dig={}.".format(dig))
+
+            # get indexed witness signatures if any
+            wigers = self.wigs.get(keys=keys)
+
+            # get nontrans endorsement couples not witnesses
+            # may have been originally key event attachments or receipted endorsements
+            cigars = []
+            if coups := self.rcts.get(keys=keys):
+                for prefixer, cigar in coups:
+                    cigar.verfer = prefixer  # assign verfer
+                    cigars.append(cigar)
+
+            # get trans receipt/endorsement attachments not controller
+            # vrcsNew get non-controller trans receipt attachments
+            # may have been originally non-controller sigs or receipted endorsements
+            topkeys = (pre, dig)
+            rsets = dict()  # collate  by triple of rpre,rsnh,rdig
+            for quintkeys, siger in self.vrcs.getTopItemIter(keys=topkeys):
+                epre, edig, rpre, rsnh, rdig = quintkeys  # expand quintkeys tuple
+                triple = (rpre, rsnh, rdig)  # create triple of receiptor/endorser
+                if triple not in rsets:
+                    rsets[triple] = [siger]
+                else:
+                    rsets[triple].append(siger)
+
+            rsgs = []
+            if rsets:  # convert rsets dict to rsgs list of tuples
+                for triple, rigers in rsets.items():
+                    rpre, rsnh, rdig = triple
+                    rsgs.append((Prefixer(qb64=rpre),
+                                 Number(snh=rsnh),
+                                 Diger(qb64=rdig),
+                                 rigers))
+
+
+            # get authorizer (delegator/issuer) source seal event couple if any
+            bonds = []
+            if couple := self.aess.get(keys=keys):
+                number, diger = couple
+                bonds.append(SealSource(s=number, d=diger))
+
+            # get first seen replay couples
+            if not (dater := self.dtss.get(keys=keys)):
+                raise MissingEntryError("Missing datetime for dig={}.".format(dig))
+
+            bonds.append(FirstSeen(f=Number(num=fn), dt=dater))
 
         msg = messagize(serder=serder, sigers=sigers, wigers=wigers,
-                        cigars=cigars, rsgs=rsgs, bonds=bonds, gvrsn=gvrsn)
+                        cigars=cigars, rsgs=rsgs, bonds=bonds, gvrsn=gvrsn,
+                        cold=cold)
         return msg
 
 
@@ -1921,6 +2302,110 @@ class Baser(LMDBer):
             for dmsg in self.clonePreIter(pre=kever.delpre, fn=0, gvrsn=gvrsn):
                 yield dmsg
 
+    def indexSeals(self, serder):
+        """
+        Adds each seal anchored in event serder that has a digest field 'd'
+        to the .anxs anchored seal index of the KEL of serder.pre. Idempotent.
+
+        Parameters:
+            serder (SerderKERI): instance of event logged in KEL
+        """
+        from ..core import coring
+
+        for seal in serder.seals or []:  # or [] for seals 'a' field missing
+            if isinstance(seal, dict) and isinstance(seal.get("d"), str):
+                self.anxs.add(keys=(serder.pre, seal["d"]),
+                              val=(coring.Number(num=serder.sn,
+                                                 code=coring.NumDex.Huge),
+                                   coring.Diger(qb64=serder.said)))
+
+
+    def fetchSealingEvent(self, pre, seal, sn=0, last=False):
+        """
+        Uses the .anxs anchored seal index to find the first event in sn order
+        in KEL of pre that anchors a seal equal to provided seal in dict form
+        and is also fully witnessed. Seal must include digest field 'd'.
+
+        When the index has no match, the KEL of pre is walked once per open of
+        this Baser to backfill its index before looking again. This covers
+        events logged before the index existed whose database was never
+        migrated, such as pre-release databases of the same version.
+
+        Returns:
+            srdr (Serder): instance of the first event with matching seal,
+                None if not found
+
+        Parameters:
+            pre (bytes|str): identifier of the KEL to search
+            seal (dict): dict form of Seal with 'd' field to find in anchored
+                seals list of each event
+            sn (int): beginning sn to search
+            last (bool): True means only last event at each sn so not
+                disputed or superseded events. False means any event in KEL
+        """
+        if hasattr(pre, 'decode'):
+            pre = pre.decode("utf-8")
+
+        # create generic Seal namedtuple class using keys from provided seal dict
+        Seal = namedtuple('Seal', list(seal))  # matching type
+        seal = Seal(**seal)
+
+        if (srdr := self._fetchIndexedSealingEvent(pre, seal, Seal, sn, last)):
+            return srdr
+
+        if pre in self.anxed:  # index already complete for KEL of pre
+            return None
+
+        self.reindexSeals(pre)
+        return self._fetchIndexedSealingEvent(pre, seal, Seal, sn, last)
+
+    def reindexSeals(self, pre):
+        """
+        Backfills the .anxs anchored seal index from every event in the KEL of
+        pre and records pre in .anxed so the KEL is walked only once.
+
+        Parameters:
+            pre (str): identifier of the KEL to index
+        """
+        for serder in self.getEvtPreIter(pre=pre):
+            self.indexSeals(serder)
+        self.anxed.add(pre)
+
+    def _fetchIndexedSealingEvent(self, pre, seal, Seal, sn, last):
+        """
+        Returns the first fully witnessed event found via the .anxs index that
+        anchors seal, None otherwise. See .fetchSealingEvent.
+
+        Parameters:
+            pre (str): identifier of the KEL to search
+            seal (namedtuple): instance of Seal to match
+            Seal (type): generic namedtuple class of seal
+            sn (int): beginning sn to search
+            last (bool): True means only last event at each sn
+        """
+        anchors = [(number.num, diger.qb64) for number, diger
+                   in self.anxs.get(keys=(pre, seal.d))]
+        anchors.sort(key=lambda anchor: anchor[0])  # stable keeps insertion order
+        for esn, said in anchors:
+            if esn < sn:
+                continue
+            if last:
+                if self.kels.getLast(keys=pre, on=esn) != said:
+                    continue  # disputed or superseded
+            elif said not in self.kels.get(keys=pre, on=esn):
+                continue  # no longer in KEL
+
+            if not (srdr := self.evts.get(keys=(pre, said))):
+                continue  # skip missing event
+
+            for eseal in srdr.seals or []:
+                if tuple(eseal) == Seal._fields:  # same type of seal
+                    eseal = Seal(**eseal)  # convert to namedtuple
+                    if seal == eseal and self.fullyWitnessed(srdr):
+                        return srdr
+        return None
+
+
     def fetchAllSealingEventByEventSeal(self, pre, seal, sn=0):
         """
         Search through a KEL for the event that contains a specific anchored
@@ -1931,6 +2416,8 @@ class Baser(LMDBer):
 
             None if not found
 
+        Uses .anxs anchored seal index. See .fetchSealingEvent.
+
         Parameters:
             pre (bytes|str): identifier of the KEL to search
             seal (dict): dict form of Seal of any type SealEvent to find in anchored
@@ -1943,15 +2430,7 @@ class Baser(LMDBer):
         if tuple(seal) != SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = SealEvent(**seal)  #convert to namedtuple
-
-        for srdr in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == SealEvent._fields:
-                    eseal = SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
-        return None
+        return self.fetchSealingEvent(pre=pre, seal=seal, sn=sn)
 
     # use alias here until can change everywhere for  backwards compatibility
     findAnchoringSealEvent = fetchAllSealingEventByEventSeal  # alias
@@ -1965,6 +2444,8 @@ class Baser(LMDBer):
         Searches only last events in KEL of pre so does not include disputed
         and/or superseded events.
 
+        Uses .anxs anchored seal index. See .fetchSealingEvent.
+
         Returns:
             srdr (Serder): instance of the first event with the matching
                 anchoring SealEvent seal,
@@ -1982,15 +2463,7 @@ class Baser(LMDBer):
         if tuple(seal) != SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = SealEvent(**seal)  #convert to namedtuple
-
-        for srdr in self.getEvtLastPreIter(pre=pre, sn=sn):  # no disputed or superseded
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == SealEvent._fields:
-                    eseal = SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
-        return None
+        return self.fetchSealingEvent(pre=pre, seal=seal, sn=sn, last=True)
 
 
 
@@ -2004,6 +2477,9 @@ class Baser(LMDBer):
 
             None if not found
 
+        Uses .anxs anchored seal index when seal has a digest field 'd'.
+        Otherwise walks the KEL.
+
         Parameters:
             pre (bytes|str): identifier of the KEL to search
             seal (dict): dict form of Seal of any type to find in anchored
@@ -2011,8 +2487,12 @@ class Baser(LMDBer):
             sn (int): beginning sn to search
 
         """
+        if isinstance(seal.get("d"), str):
+            return self.fetchSealingEvent(pre=pre, seal=seal, sn=sn, last=True)
+
         # create generic Seal namedtuple class using keys from provided seal dict
         Seal = namedtuple('Seal', list(seal))  # matching type
+        seal = Seal(**seal)  # convert to namedtuple
 
         for srdr in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
             for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
@@ -2224,3 +2704,46 @@ class BaserDoer(doing.Doer):
     def exit(self):
         """"""
         self.baser.close(clear=self.baser.temp)
+
+
+class KeverWarmer(doing.Doer):
+    """
+    KeverWarmer preloads the kever cache of a Baser at startup with the
+    kevers of its most recently updated KELs in the background. Does up to
+    chunk steps of Baser.warmKeverIter per run so startup is not blocked.
+
+    Attributes:
+        db (Baser): database whose .kevers to warm
+        size (int | None): number of kevers to preload. None means cache size
+        chunk (int): max key states scanned or kevers loaded per run
+        loaded (int | None): number of kevers loaded once done
+    """
+
+    def __init__(self, db, size=None, chunk=1000, tock=0.0, **kwa):
+        """
+        Parameters:
+            db (Baser): database whose .kevers to warm
+            size (int | None): number of kevers to preload
+            chunk (int): max key states scanned or kevers loaded per run
+            tock (float): seconds between runs
+        """
+        super(KeverWarmer, self).__init__(tock=tock, **kwa)
+        self.db = db
+        self.size = size
+        self.chunk = chunk
+        self.loaded = None
+        self._warmer = None
+
+    def enter(self, *, temp=None):
+        """"""
+        self._warmer = self.db.warmKeverIter(size=self.size)
+
+    def recur(self, tyme):
+        """Returns True when done warming"""
+        for _ in range(self.chunk):
+            try:
+                next(self._warmer)
+            except StopIteration as ex:
+                self.loaded = ex.value
+                return True
+        return False
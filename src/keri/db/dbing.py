@@ -65,6 +65,7 @@ ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
 SuffixSize = 32  # does not include trailing separator
 MaxSuffix = int("f"*(SuffixSize), 16)
+CursorPoolSize = 4  # max idle cursors kept per named sub db by LMDBer.reading
 
 
 def fetchTsgs(db, diger, snh=None):
@@ -332,6 +333,72 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class BoundTxn:
+    """
+    BoundTxn binds a shared lmdb transaction to one named sub db so that
+    LMDBer methods written for a per call transaction opened with
+    env.begin(db=db) operate unchanged inside an LMDBer.batch write
+    transaction or an LMDBer.reading read transaction. Used as context
+    manager for the scope of one LMDBer method call. When given a cursor pool,
+    cursors on db are taken from the pool and returned to it on exit.
+
+    Attributes:
+        txn (lmdb.Transaction): shared transaction
+        db (lmdb._Database | None): named sub db used as default for operations
+        pool (dict | None): idle cursors keyed by sub db shared across calls.
+            None means do not pool cursors
+        cursors (list): cursors on db checked out in this scope
+    """
+
+    def __init__(self, txn, db=None, pool=None):
+        self.txn = txn
+        self.db = db
+        self.pool = pool
+        self.cursors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.pool is not None:  # return cursors to pool for reuse
+            idle = self.pool.setdefault(self.db, [])
+            while self.cursors and len(idle) < CursorPoolSize:
+                idle.append(self.cursors.pop())
+        self.cursors = []
+        return False
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default, db=db if db is not None else self.db)
+
+    def put(self, key, value, dupdata=True, overwrite=True, append=False, db=None):
+        return self.txn.put(key, value, dupdata=dupdata, overwrite=overwrite,
+                            append=append, db=db if db is not None else self.db)
+
+    def replace(self, key, value, db=None):
+        return self.txn.replace(key, value, db=db if db is not None else self.db)
+
+    def pop(self, key, db=None):
+        return self.txn.pop(key, db=db if db is not None else self.db)
+
+    def delete(self, key, value=b'', db=None):
+        return self.txn.delete(key, value, db=db if db is not None else self.db)
+
+    def cursor(self, db=None):
+        if self.pool is None or (db is not None and db is not self.db):
+            return self.txn.cursor(db=db if db is not None else self.db)
+
+        if idle := self.pool.get(self.db):
+            cursor = idle.pop()
+            cursor.first()  # reposition so iteration starts as if new
+        else:
+            cursor = self.txn.cursor(db=self.db)
+        self.cursors.append(cursor)
+        return cursor
+
+    def stat(self, db=None):
+        return self.txn.stat(db if db is not None else self.db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -354,6 +421,13 @@ class LMDBer(filing.Filer):
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
 
+    Hidden:
+        _batch (lmdb.Transaction | None): active write transaction of .batch
+            shared by all database operations while active
+        _reading (lmdb.Transaction | None): active read transaction of .reading
+            shared by all read operations while active
+        _cursors (dict): idle cursors of ._reading keyed by named sub db
+
     Properties:
 
     File/Directory Creation Mode Notes:
@@ -421,6 +495,9 @@ class LMDBer(filing.Filer):
 
         self.env = None
         self._version = None
+        self._batch = None
+        self._reading = None
+        self._cursors = {}
         self.readonly = True if readonly else False
         super(LMDBer, self).__init__(**kwa)
 
@@ -524,6 +601,97 @@ class LMDBer(filing.Filer):
         return super(LMDBer, self).close(clear=clear)
 
 
+    @contextmanager
+    def batch(self):
+        """
+        Context manager of a scoped write transaction shared by every database
+        operation on this LMDBer and its sub dbs (Subers, Komers, escrow
+        helpers) until the context exits. All writes in the scope commit
+        together as one LMDB commit on normal exit or are aborted together
+        when an exception escapes the scope. Reads in the scope see the
+        uncommitted writes. Nested batch contexts reuse the outermost
+        transaction so only the outermost commits.
+
+        Usage:
+            with db.batch():
+                db.evts.put(...)
+                db.sigs.put(...)
+
+        Yields:
+            txn (lmdb.Transaction): shared write transaction
+        """
+        if self._batch is not None:  # nested so reuse outer transaction
+            yield self._batch
+            return
+
+        with self.env.begin(write=True, buffers=True) as txn:
+            self._batch = txn
+            try:
+                yield txn
+            finally:
+                self._batch = None
+
+
+    @contextmanager
+    def reading(self):
+        """
+        Context manager of a scoped read snapshot. Every read operation on
+        this LMDBer and its sub dbs (Subers, Komers) until the context exits
+        shares one read transaction and reuses a small pool of cursors per
+        named sub db instead of beginning its own transaction and cursor.
+        All reads in the scope see the same consistent view of the database.
+        Writes in the scope commit in their own transactions as usual and are
+        not seen by reads in the scope. Iterators must be consumed inside the
+        scope. Nested in .batch or .reading reuses the active transaction.
+
+        Usage:
+            with db.reading():
+                serder = db.evts.get(...)
+                sigers = db.sigs.get(...)
+
+        Yields:
+            txn (lmdb.Transaction): shared transaction
+        """
+        if self._batch is not None or self._reading is not None:
+            yield self._batch if self._batch is not None else self._reading
+            return
+
+        with self.env.begin(buffers=True) as txn:
+            self._reading = txn
+            try:
+                yield txn
+            finally:
+                self._reading = None
+                self._cursors = {}
+
+
+    @property
+    def batching(self):
+        """
+        Returns:
+            batching (bool): True when a .batch transaction is active
+        """
+        return self._batch is not None
+
+
+    def _begin(self, db=None, write=False):
+        """
+        Returns context manager of transaction with buffers on named sub db, db.
+        Uses the active .batch transaction bound to db when batching or for
+        reads the active .reading transaction bound to db with pooled cursors.
+        Otherwise begins a new transaction that commits when its context exits.
+
+        Parameters:
+            db (lmdb._Database | None): named sub db. None means main db
+            write (bool): True means write transaction. False means read only
+        """
+        if self._batch is not None:
+            return BoundTxn(self._batch, db)
+        if self._reading is not None and not write:
+            return BoundTxn(self._reading, db, pool=self._cursors)
+        return self.env.begin(db=db, write=write, buffers=True)
+
+
     def getVer(self):
         """ Returns the value of the the semver formatted version in the __version__ key in this database
 
@@ -573,7 +741,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
@@ -606,7 +774,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             count = 0
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to entry at key >= key if any
@@ -625,7 +793,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with either dupsort=True or False
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:  # iter(cursor) same as cursor.iternext()
@@ -661,7 +829,7 @@ class LMDBer(filing.Filer):
         Because cursor.iternext() advances cursor after returning item its safe
         to delete the item within the iteration loop.
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -687,7 +855,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -710,7 +878,7 @@ class LMDBer(filing.Filer):
         """
         if not key:
             return False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -730,7 +898,7 @@ class LMDBer(filing.Filer):
         """
         if not key:
             return False
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -753,7 +921,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -786,7 +954,7 @@ class LMDBer(filing.Filer):
         if val is None or not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             onkey = onKey(key, on, sep=sep)
             try:
                 return (txn.put(onkey, val, overwrite=False))
@@ -816,7 +984,7 @@ class LMDBer(filing.Filer):
         if val is None or not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return (txn.put(onkey, val))
@@ -850,7 +1018,7 @@ class LMDBer(filing.Filer):
         if not key or val is None:
             raise ValueError(f"Bad append parameter: {key=} or {val=}")
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             onkey = onKey(key, MaxON, sep=sep)
             on = 0  # unless other cases match then zeroth entry at key
             cursor = txn.cursor()
@@ -905,7 +1073,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 if val := txn.get(onkey):
@@ -937,7 +1105,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return(txn.get(onkey))
@@ -963,7 +1131,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return (txn.delete(onkey))  # when empty deletes whole db
@@ -996,7 +1164,7 @@ class LMDBer(filing.Filer):
             return self.remTop(db=db, top=b'')
 
         # del all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -1035,7 +1203,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate count
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -1107,7 +1275,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -1157,7 +1325,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             if not key or not vals:  # empty key or empty vals or vals None
                 return result
@@ -1209,7 +1377,7 @@ class LMDBer(filing.Filer):
             return result  # do not delete
 
         self.remIoSet(db=db, key=key, sep=sep)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset(vals)  # make set
 
             for i, val in enumerate(vals):
@@ -1238,7 +1406,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             if not key or val is None:  # empty key or val is missing
                 return False
             vals = oset()
@@ -1282,7 +1450,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             if not key:  # empty key
                 return  # raises StopIterationError
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
@@ -1314,7 +1482,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             last = ()
             if not key:
                 return last
@@ -1350,7 +1518,7 @@ class LMDBer(filing.Filer):
         if not key:
             return result
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1404,7 +1572,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1434,7 +1602,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             count = 0
             if not key:  # empty key
                 return count
@@ -1499,7 +1667,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not key:  # start at first key if any
                 if not cursor.first():
@@ -1665,7 +1833,7 @@ class LMDBer(filing.Filer):
         if not key or not vals or not helping.isNonStringIterable(vals):
             raise ValueError(f"Bad append parameter: {key=} or {vals=}")
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             onkey = onKey(key, on=MaxON, sep=sep)  # start at max and walk back
             iokey = suffix(onkey, ion=MaxON, sep=sep)
             on = 0  # unless other cases match then zeroth entry at key
@@ -1871,7 +2039,7 @@ class LMDBer(filing.Filer):
             return self.remTop(db=db, top=b'')
 
         # del all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -1937,7 +2105,7 @@ class LMDBer(filing.Filer):
             return self.cntAll(db)
 
         # count all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             count = 0
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -2024,7 +2192,7 @@ class LMDBer(filing.Filer):
             yield from self.getOnTopIoSetItemIter(db=db, top=b'', sep=sep)
             return
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             onkey = onKey(key, on, sep=sep)  # starting on
             iokey = suffix(onkey, ion=0, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -2076,7 +2244,7 @@ class LMDBer(filing.Filer):
                 yield (key, on, val)
             return
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()  # create cursor to walk
             # iterate all on >= on at key
             if not key:  # start at first key if any
@@ -2137,7 +2305,7 @@ class LMDBer(filing.Filer):
         transparently suffixed and unsuffixed
         Assumes DB opened with dupsort=False
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # position cursor at last entry of set of last key
                 return  # empty database so raise StopIteration
@@ -2203,7 +2371,7 @@ class LMDBer(filing.Filer):
         transparently suffixed and unsuffixed
         Assumes DB opened with dupsort=False
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
 
             if key:  # not empty so attempt to position at starting key not last
@@ -2286,7 +2454,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -2322,7 +2490,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._begin(db=db, write=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -2345,7 +2513,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -2370,7 +2538,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -2394,7 +2562,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -2418,7 +2586,7 @@ class LMDBer(filing.Filer):
         if not key:
             return 0
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2444,7 +2612,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -2487,7 +2655,7 @@ class LMDBer(filing.Filer):
         if not key or not vals or key[:1] == b'.':
             return result
         dups = set(self.getIoDupVals(db, key))  # get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -2560,7 +2728,7 @@ class LMDBer(filing.Filer):
             key (bytes): within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             vals = []  # list
             if not key:
                 return vals
@@ -2607,7 +2775,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             if not key:  # empty key
                 return  # raise StopIterationError
 
@@ -2653,7 +2821,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -2694,7 +2862,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -2735,7 +2903,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -2775,7 +2943,7 @@ class LMDBer(filing.Filer):
         """
         if not key:
             return 0
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2872,7 +3040,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getOnIoDupVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             onkey = onKey(key, on, sep=sep)
@@ -2987,7 +3155,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to retrieve
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             vals = []
             if not key: # empty key so no dups
@@ -3135,7 +3303,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -3302,7 +3470,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # pre-position cursor at last dup of last key
                 return  # empty database so raise StopIteration
@@ -4,6 +4,7 @@ KERI
 keri.db.koming module
 
 """
+import dataclasses
 import json
 from dataclasses import dataclass
 from collections.abc import Iterable
@@ -18,6 +19,43 @@ from ..help import helping
 
 logger = ogler.getLogger()
 
+Packed = "PACK"  # compact schema ordered msgpack record serialization kind
+
+
+def pack(val):
+    """
+    Returns compact packed form of dataclass record val as list of its field
+    values in schema field order with nested records also packed. Records with
+    a custom `_ser` method pack as the dict given by dictify.
+
+    Parameters:
+        val (dataclass | Any): record or field value to pack
+    """
+    if dataclasses.is_dataclass(val) and not isinstance(val, type):
+        if callable(getattr(val, "_ser", None)):
+            return helping.dictify(val)
+        return [pack(getattr(val, f.name)) for f in dataclasses.fields(val)]
+    return val
+
+
+def unpack(klas, val):
+    """
+    Returns instance of dataclass klas from packed list val as produced by pack.
+    Fields missing from the end of val get their defaults so fields may be
+    appended to a schema without migrating stored records.
+
+    Parameters:
+        klas (type[dataclass] | Any): class of record or type of field
+        val (list | dict | Any): packed record or field value
+    """
+    if dataclasses.is_dataclass(klas):
+        if isinstance(val, dict):
+            return helping.datify(klas, val)
+        if isinstance(val, list):
+            return klas(**{f.name: unpack(f.type, v) for f, v
+                           in zip(dataclasses.fields(klas), val)})
+    return val
+
 
 class KomerBase:
     """
@@ -33,6 +71,7 @@ class KomerBase:
         sdb (lmdb._Database): instance of named sub db lmdb for this Komer
         schema (Type[dataclass]): class reference of dataclass subclass
         kind (str): serialization/deserialization type from coring.Serials
+            or Packed for compact schema ordered records
         serializer (types.MethodType): serializer method
         deserializer (types.MethodType): deserializer method
         sep (str): separator for combining keys tuple of strs into key bytes
@@ -52,6 +91,7 @@ class KomerBase:
             klas (type[dataclass]):  reference to Class definition for dataclass sub class
             subkey (str):  LMDB sub database key
             kind (str): serialization/deserialization type
+                        Packed means msgpack array of fields in schema order
             dupsort (bool): True means enable duplicates at each key
                                False (default) means do not enable duplicates at
                                each key
@@ -134,6 +174,8 @@ class KomerBase:
             return self.__serializeMGPK
         elif kind == Kinds.cbor:
             return self.__serializeCBOR
+        elif kind == Packed:
+            return self.__serializePACK
         else:
             return self.__serializeJSON
 
@@ -149,6 +191,8 @@ class KomerBase:
             return self.__deserializeMGPK
         elif kind == Kinds.cbor:
             return self.__deserializeCBOR
+        elif kind == Packed:
+            return self.__deserializePACK
         else:
             return self.__deserializeJSON
 
@@ -180,6 +224,18 @@ class KomerBase:
         return val
 
 
+    def __deserializePACK(self, val):
+        if val is not None:
+            val = bytes(val)
+            if val[:1] == b'{':  # json record not yet migrated to packed
+                return self.__deserializeJSON(val)
+            val = unpack(self.klas, msgpack.loads(val))
+            if not isinstance(val, self.klas):
+                raise ValueError("Invalid schema type={} of value={}, expected {}."
+                                 "".format(type(val), val, self.klas))
+        return val
+
+
     def __serializeJSON(self, val):
         if val is not None:
             if not isinstance(val, self.klas):
@@ -209,6 +265,15 @@ class KomerBase:
         return val
 
 
+    def __serializePACK(self, val):
+        if val is not None:
+            if not isinstance(val, self.klas):
+                raise ValueError("Invalid schema type={} of value={}, expected {}."
+                                 "".format(type(val), val, self.klas))
+            val = msgpack.dumps(pack(val))
+        return val
+
+
     def trim(self, keys: str|bytes|memoryview|Iterable=b"", *, topive=False):
         """Removes all entries whose keys startswith keys. Enables removal of whole
         branches of db key space. To ensure that proper separation of a branch
@@ -0,0 +1,33 @@
+from keri import help
+
+logger = help.ogler.getLogger()
+
+# names of Baser Komer tables stored with the koming.Packed record kind
+TABLES = ("states", "ends", "locs", "obvs", "kramCTYP", "kramMSGC", "kramTMSC")
+
+
+def migrate(db):
+    """ Rewrite JSON records of compact Komer tables as packed records
+
+    This migration performs the following:
+    - hby.db -> "stts.", "ends.", "locs.", "obvs.", "ctyp.", "msgc.", "tmsc."
+        Value: JSON serialized record rewritten as msgpack array of its fields
+        in schema order (koming.Packed). Keys are unchanged.
+
+    Records already packed are skipped so idempotent and may be rerun safely.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    for name in TABLES:
+        komer = getattr(db, name)
+        count = 0
+        with db.batch():
+            for key, val in db.getTopItemIter(db=komer.sdb):
+                if bytes(val)[:1] != b'{':  # already packed
+                    continue
+                record = komer._des(val)  # legacy json fallback
+                db.setVal(db=komer.sdb, key=key, val=komer._ser(record))
+                count += 1
+
+        logger.info("Migration: packed %s records of %s", count, name)
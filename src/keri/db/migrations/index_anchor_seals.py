@@ -0,0 +1,28 @@
+from keri import help
+
+logger = help.ogler.getLogger()
+
+
+def migrate(db):
+    """ Backfill the .anxs anchored seal index from the existing KELs
+
+    This migration performs the following:
+    - hby.db -> "anxs." populated for every event in every KEL in hby.db "kels."
+        Key: identifier prefix + digest field 'd' of each anchored seal
+        Value: (Number, Diger) of sn and said of anchoring event
+
+    Idempotent so may be rerun safely.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    count = 0
+    for (pre, ), sn, dig in db.kels.getAllItemIter():
+        if (serder := db.evts.get(keys=(pre, dig))) is None:
+            logger.error("Migration: missing event for pre=%s sn=%s dig=%s",
+                         pre, sn, dig)
+            continue
+        db.indexSeals(serder)
+        count += 1
+
+    logger.info("Migration: indexed anchored seals of %s events", count)
@@ -0,0 +1,36 @@
+from keri import help
+
+logger = help.ogler.getLogger()
+
+
+def migrate(db):
+    """ Rewrite KRAM message cache datetimes from ISO-8601 to int milliseconds
+
+    This migration performs the following:
+    - hby.db -> "msgc." MsgCacheRecord mdt
+    - hby.db -> "tmsc." TxnMsgCacheRecord mdt and xdt
+        Value: ISO-8601 datetime str field rewritten as int milliseconds
+        since epoch. Keys are unchanged.
+
+    The records convert legacy ISO-8601 fields to int milliseconds on load,
+    so every record is pinned back to persist the converted form.
+
+    The "msgx." and "tmsx." expiry indices are rebuilt by the first full
+    prune sweep of Kramer so are not populated here.
+
+    Idempotent so may be rerun safely.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    count = 0
+    with db.batch():
+        for keys, mcr in db.kramMSGC.getTopItemIter():
+            db.kramMSGC.pin(keys, mcr)
+            count += 1
+
+        for keys, mcr in db.kramTMSC.getTopItemIter():
+            db.kramTMSC.pin(keys, mcr)
+            count += 1
+
+    logger.info("Migration: rewrote %s KRAM cache record datetimes", count)
@@ -97,6 +97,7 @@ etc.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type, Union
+from collections import OrderedDict
 from collections.abc import Iterable
 
 from hio.help import ogler
@@ -2064,9 +2065,26 @@ class SerderSuber(SerderSuberBase, Suber):
     Sub class of SerderSuberBase, Suber where data is serialized Serder Subclass
     instance given by .klas
     Automatically serializes and deserializes using .klas Serder methods
+
+    Optionally keeps a bounded least recently used (LRU) cache of the hydrated
+    Serder instances returned by .get keyed by db key so that repeated reads
+    of the same entry do not deserialize it again. The cache is invalidated
+    at a key by .pin and .rem and for a whole branch by .trim. Serder
+    instances are treated as immutable so a cached instance may be shared by
+    multiple readers.
+
+    Attributes:
+        cacheSize (int): max number of hydrated Serders kept in cache.
+                         0 means cache disabled
+        cacheHits (int): number of .get calls served from cache
+        cacheMisses (int): number of .get calls that read and hydrated from db
+
+    Hidden:
+        _serders (OrderedDict): LRU cache of Serder instances keyed by db key
+                                bytes in least to most recently used order
     """
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, cacheSize: int=0, **kwa):
         """
         Inherited Parameters:
             db (LMDBer): base db
@@ -2079,8 +2097,112 @@ class SerderSuber(SerderSuberBase, Suber):
             verify (bool): True means reverify when ._des from db when applicable
                            False means do not reverify. Default False
             klas (Type[serdering.Serder]): Class reference to subclass of Serder
+
+        Parameters:
+            cacheSize (int): max number of hydrated Serders to cache.
+                             0 (default) means do not cache
         """
         super(SerderSuber, self).__init__(*pa, **kwa)
+        self.cacheSize = max(0, cacheSize)
+        self.cacheHits = 0
+        self.cacheMisses = 0
+        self._serders = OrderedDict()
+
+
+    def put(self, keys: Union[str, Iterable], val: serdering.Serder):
+        """Puts val at key made from keys. Does not overwrite
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+            val (serdering.Serder): instance of .klas
+
+        Returns:
+            result (bool): True If successful, False otherwise, such as key
+                              already in database.
+        """
+        key = bytes(self._tokey(keys))  # hashable even when bytearray
+        result = self.db.putVal(db=self.sdb, key=key, val=self._ser(val))
+        if result:  # nothing was at key so any cached entry is stale
+            self._serders.pop(key, None)
+        return result
+
+
+    def pin(self, keys: Union[str, Iterable], val: serdering.Serder):
+        """Pins (sets) val at key made from keys. Overwrites.
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+            val (serdering.Serder): instance of .klas
+
+        Returns:
+            result (bool): True If successful. False otherwise.
+        """
+        key = bytes(self._tokey(keys))  # hashable even when bytearray
+        self._serders.pop(key, None)
+        return self.db.setVal(db=self.sdb, key=key, val=self._ser(val))
+
+
+    def get(self, keys: Union[str, Iterable]):
+        """Gets Serder at keys. Returns cached instance when available.
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+
+        Returns:
+            serder (serdering.Serder): instance of .klas
+            None if no entry at keys
+        """
+        key = bytes(self._tokey(keys))  # hashable even when bytearray
+        if (serder := self._serders.get(key)) is not None:
+            self._serders.move_to_end(key)  # most recently used
+            self.cacheHits += 1
+            return serder
+
+        val = self.db.getVal(db=self.sdb, key=key)
+        if val is None:
+            return None
+
+        serder = self._des(val)
+        if self.cacheSize:
+            self.cacheMisses += 1
+            self._serders[key] = serder
+            if len(self._serders) > self.cacheSize:
+                self._serders.popitem(last=False)  # evict least recently used
+        return serder
+
+
+    def rem(self, keys: Union[str, Iterable]):
+        """Removes entry at keys. This safe if keys empty or missing then
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+
+        Returns:
+            result (bool): True if key exists so delete successful.
+                          False if key empty or missing from db
+        """
+        key = bytes(self._tokey(keys))  # hashable even when bytearray
+        self._serders.pop(key, None)
+        return self.db.remVal(db=self.sdb, key=key)
+
+
+    def trim(self, keys: str|bytes|memoryview|Iterable=b"", *, topive=False):
+        """Removes all entries in top branch of db given by keys and
+        invalidates their cached Serders. See SuberBase.trim
+        """
+        top = self._tokey(keys, topive=topive)
+        for key in [key for key in self._serders if key.startswith(top)]:
+            del self._serders[key]
+        return self.db.remTop(db=self.sdb, top=top)
+
+    remTop = trim  # alias for convenience
+
+
+    def clearCache(self):
+        """Empties the cache of hydrated Serders such as after external
+        writes to the same sub db that bypass this instance.
+        """
+        self._serders.clear()
 
 
 class SerderIoSetSuber(SerderSuberBase, IoSetSuber):
@@ -62,6 +62,28 @@ def dictify(val: dataclasses.dataclass):
     return dataclasses.asdict(val)
 
 
+def icetuple(val: dataclasses.dataclass):
+    """
+    Returns tuple of field values of frozen dataclass instance val as would
+    dataclasses.astuple(val) but computed once per instance and then cached
+    on the instance itself as ._icetuple.
+
+    Codexes are module level frozen dataclass instances whose __iter__ enables
+    value inclusion tests with "in". Since astuple recursively deep copies
+    every field on each call, an "in" test on a codex in a hot path such as
+    stream parsing is otherwise surprisingly expensive.
+
+    Parameters:
+         val (dataclasses.dataclass): frozen dataclass instance i.e. immutable
+    """
+    try:
+        return val.__dict__["_icetuple"]
+    except KeyError:
+        values = dataclasses.astuple(val)
+        object.__setattr__(val, "_icetuple", values)  # bypass frozen
+        return values
+
+
 def datify(cls, d):
     """
     Returns instance of dataclass cls converted from dict d. If the dataclass
@@ -269,6 +291,18 @@ def fromIso8601(dts):
     return (datetime.datetime.fromisoformat(dts))
 
 
+Epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def epochMs(dts):
+    """
+    Returns int milliseconds since Unix epoch of RFC-3339 profile of ISO 8601
+    format str or bytes dts.
+    Uses integer timedelta division so no floating point rounding error.
+    """
+    return (fromIso8601(dts) - Epoch) // datetime.timedelta(milliseconds=1)
+
+
 
 # Base64 utilities
 BASE64_PAD = b'='
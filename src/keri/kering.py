@@ -4,7 +4,7 @@ Generic Constants and Classes
 """
 import re
 from collections import namedtuple
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 
 from .help import helping
 
@@ -275,7 +275,7 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(helping.icetuple(self))
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -397,7 +397,7 @@ class TraitCodex:
     DelegateIsDelegator: str = 'DID'  # Treat delegate AIDs same as their delegator. Inception only
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(helping.icetuple(self))
 
 
 TraitDex = TraitCodex()  # Make instance
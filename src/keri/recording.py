@@ -471,23 +471,28 @@ class MsgCacheRecord:
     """Message cache entry for KRAM timeliness caching.
 
     Keyed by (AID, MID) in msgc database. Values are static once created
-    until pruned and deleted.
+    until pruned and deleted. Legacy records with ISO-8601 mdt are converted
+    to int ms on load.
 
     Attributes:
-        mdt (str): message datetime stamp ISO-8601 from msg dt field
+        mdt (int): message datetime in ms since epoch from msg dt field
         d (int): drift in ms from cache-type at creation time
         ml (int): message lag in ms (sl or ll from cache-type)
         pml (int): prune message lag in ms (psl or pll from cache-type)
         xl (int): exchange lag in ms from cache-type
         pxl (int): prune exchange lag in ms from cache-type
     """
-    mdt: str = ''
+    mdt: int = 0
     d: int = 0
     ml: int = 0
     pml: int = 0
     xl: int = 0
     pxl: int = 0
 
+    def __post_init__(self):
+        if isinstance(self.mdt, str):  # legacy ISO-8601 record
+            self.mdt = helping.epochMs(self.mdt)
+
     def __iter__(self):
         return iter(asdict(self))
 
@@ -498,24 +503,32 @@ class TxnMsgCacheRecord:
 
     Keyed by (AID, XID, MID) in tmsc database. Values are static once created
     until pruned and deleted. For the starting xip message, xdt == mdt.
+    Legacy records with ISO-8601 mdt or xdt are converted to int ms on load.
 
     Attributes:
-        mdt (str): message datetime stamp ISO-8601 from msg dt field
-        xdt (str): exchange transaction start datetime ISO-8601 from xip dt field
+        mdt (int): message datetime in ms since epoch from msg dt field
+        xdt (int): exchange transaction start datetime in ms since epoch
+            from xip dt field
         d (int): drift in ms from cache-type at creation time
         ml (int): message lag in ms (sl or ll from cache-type)
         pml (int): prune message lag in ms (psl or pll from cache-type)
         xl (int): exchange lag in ms from cache-type
         pxl (int): prune exchange lag in ms from cache-type
     """
-    mdt: str = ''
-    xdt: str = ''
+    mdt: int = 0
+    xdt: int = 0
     d: int = 0
     ml: int = 0
     pml: int = 0
     xl: int = 0
     pxl: int = 0
 
+    def __post_init__(self):
+        if isinstance(self.mdt, str):  # legacy ISO-8601 record
+            self.mdt = helping.epochMs(self.mdt)
+        if isinstance(self.xdt, str):
+            self.xdt = helping.epochMs(self.xdt)
+
     def __iter__(self):
         return iter(asdict(self))
 
@@ -530,3 +543,65 @@ class WellKnownAuthN:
 
     url: str  # full .well-known OOBI URL resolved
     dt: str  # iso8601 date/time of success resolution
+
+
+@dataclass
+class SnapshotRecord(RawRecord):
+    """
+    Manifest of a bulk KEL snapshot stream written by Baser.exportKELs and
+    read by Baser.importKELs. The signature of the snapshot owner is made
+    over the json serialization of the record given by ._asjson()
+
+    Attributes:
+        d (str): qb64 Blake3_256 digest of the snapshot stream bytes
+        n (int): number of event messages in the snapshot stream
+        pres (list[str]): qb64 identifier prefixes of exported KELs.
+            Empty means all KELs in database
+        dt (str): iso8601 datetime of export
+    """
+    d: str = ''  # qb64 digest of snapshot stream
+    n: int = 0  # count of event messages in stream
+    pres: list = field(default_factory=list)  # exported prefixes, empty is all
+    dt: str = ''  # iso8601 datetime of export
+
+
+@dataclass
+class MailboxPolicyRecord:
+    """Retention policy for mailbox topics enforced by Mailboxer.compact.
+
+    Keyed in Mailboxer.pols by full topic such as 'pre/receipt', by topic
+    name such as 'receipt' for that name under every prefix, or by '~' for
+    the default of all topics. Zero means no limit of that kind.
+
+    Attributes:
+        age (int): max age in ms of messages at topic
+        cnt (int): max count of messages at topic
+        size (int): max total bytes of messages at topic
+    """
+    age: int = 0
+    cnt: int = 0
+    size: int = 0
+
+    def __iter__(self):
+        return iter(asdict(self))
+
+
+@dataclass
+class MailboxStatsRecord:
+    """Storage stats of a mailbox topic kept by Mailboxer.
+
+    Keyed by topic in Mailboxer.stts. Updated in the same transaction as the
+    topic index entries they count.
+
+    Attributes:
+        cnt (int): count of messages indexed at topic
+        size (int): total bytes of messages indexed at topic
+        nxt (int): next ordinal at topic. Never reused once pruned so client
+            supplied indices stay valid
+    """
+    cnt: int = 0
+    size: int = 0
+    nxt: int = 0
+
+    def __iter__(self):
+        return iter(asdict(self))
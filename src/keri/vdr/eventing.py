@@ -1192,32 +1192,33 @@ class Tever:
         Returns:
             status (Serder): transaction event state notification message
         """
-        digs = []
-        for _, _, dig in self.reger.tels.getAllItemIter(keys=vci.encode("utf-8")):
-            digs.append(dig)
+        with self.reger.reading():  # consistent snapshot of TEL
+            digs = []
+            for _, _, dig in self.reger.tels.getAllItemIter(keys=vci.encode("utf-8")):
+                digs.append(dig)
 
-        if len(digs) == 0:
-            return None
+            if len(digs) == 0:
+                return None
 
-        vcsn = len(digs) - 1
-        vcdig = digs[-1].encode("utf-8")
+            vcsn = len(digs) - 1
+            vcdig = digs[-1].encode("utf-8")
 
-        dgkey = dgKey(vci, vcdig)  # get message
-        raw = self.reger.tvts.get(keys=dgkey)
-        serder = SerderKERI(raw=raw.encode("utf-8"))
+            dgkey = dgKey(vci, vcdig)  # get message
+            raw = self.reger.tvts.get(keys=dgkey)
+            serder = SerderKERI(raw=raw.encode("utf-8"))
 
-        if self.noBackers:
-            vcilk = Ilks.iss if len(digs) == 1 else Ilks.rev
-            ra = dict()
-        else:
-            vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
-            ra = serder.ked["ra"]
+            if self.noBackers:
+                vcilk = Ilks.iss if len(digs) == 1 else Ilks.rev
+                ra = dict()
+            else:
+                vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
+                ra = serder.ked["ra"]
 
-        dgkey = dgKey(vci, vcdig)
-        couple = self.reger.ancs.get(keys=dgkey)
-        if couple is None:
-            raise MissingEntryError(f"Missing anchor couple at key={dgkey!r}.")
-        number, diger = couple
+            dgkey = dgKey(vci, vcdig)
+            couple = self.reger.ancs.get(keys=dgkey)
+            if couple is None:
+                raise MissingEntryError(f"Missing anchor couple at key={dgkey!r}.")
+            number, diger = couple
         seqner = Seqner(sn=number.num)
         saider = Saider(qb64=diger.qb64)
 
@@ -11,6 +11,7 @@ from hio.base import doing, tyming
 
 from keri.kering import Schemes, Vrsn_1_0, Vrsn_2_0, Kinds
 from keri.core import Counter, Codens, Salter, SerderKERI, Siger
+from keri.core.kraming import epochMs
 from keri.app import (Receiptor, WitnessReceiptor, WitnessPublisher, WitnessInquisitor,
                       runController, openHby, setupWitness)
 from keri.app import agenting
@@ -297,6 +298,113 @@ class ReceiptDoer(doing.DoDoer):
         return True
 
 
+def test_witness_receiptor_batch(seeder, witnessPorter):
+    with openHby(name="wan4", salt=Salter(raw=b'wann-the-witness').qb64, version=TEST_VERSION) as wanHby, \
+            openHby(name="wil4", salt=Salter(raw=b'will-the-witness').qb64, version=TEST_VERSION) as wilHby, \
+            openHby(name="pal4", salt=Salter(raw=b'0123456789abcdef').qb64, version=TEST_VERSION) as palHby:
+
+        witnessPorts, witnessUrls = witnessPorter("wan", "wil")
+        wanDoers = setupWitness(alias="wan", hby=wanHby,
+                                tcpPort=witnessPorts["wan"]["tcp"],
+                                httpPort=witnessPorts["wan"]["http"], **KWA)
+        wilDoers = setupWitness(alias="wil", hby=wilHby,
+                                tcpPort=witnessPorts["wil"]["tcp"],
+                                httpPort=witnessPorts["wil"]["http"], **KWA)
+
+        wanHab = wanHby.habByName(name="wan")
+        wilHab = wilHby.habByName(name="wil")
+        seeder.seedWitEnds(palHby.db, witHabs=[wanHab, wilHab],
+                           protocols=[Schemes.tcp], witnessUrls=witnessUrls, **KWA)
+
+        wits = [wanHab.pre, wilHab.pre]
+        habs = [palHby.makeHab(name=f"pal{i}", wits=wits, transferable=True, **KWA) for i in range(3)]
+
+        witDoer = WitnessReceiptor(hby=palHby)
+        for hab in habs:  # all staged in the same round
+            witDoer.msgs.append(dict(pre=hab.pre))
+
+        doist = doing.Doist(limit=5.0, tock=0.03125, doers=wanDoers + wilDoers + [witDoer])
+        doist.enter()
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+        def receipted():
+            return all(len(witHab.db.wigs.get(keys=(hab.kever.serder.preb, hab.kever.serder.saidb))) == 2
+                       for hab in habs for witHab in (wanHab, wilHab))
+
+        while not (len(witDoer.cues) == len(habs) and receipted()) and not tymer.expired:
+            doist.recur()
+            time.sleep(doist.tock)
+
+        assert [cue["pre"] for cue in witDoer.cues] == [hab.pre for hab in habs]
+        assert not witDoer.pending
+        assert len(witDoer.witers) == len(wits)  # one messenger per witness for every event
+
+        for hab in habs:
+            ser = hab.kever.serder
+            for witHab in (wanHab, wilHab):
+                assert len(witHab.db.wigs.get(keys=(ser.preb, ser.saidb))) == 2
+                assert witDoer.holds(witHab.pre, hab.pre, 0)
+
+        assert witDoer.met == {(wanHab.pre, wilHab.pre), (wilHab.pre, wanHab.pre)}
+        # responses are trimmed while delivery is still tracked
+        assert all(not witer.sent and witer.idle for witer in witDoer.witers.values())
+
+        # only the delegation chain sent with the event is learned
+        delpre = wilHab.pre  # stands in for a delegator
+        entry = dict(ser=habs[1].kever.serder, sn=0, wits=wits, chain=[(delpre, 3)], phase="receipt")
+        witDoer.learn(entry)
+        assert witDoer.holds(wanHab.pre, delpre, 3)
+        assert not witDoer.holds(wanHab.pre, delpre, 4)
+        entry["chain"] = []
+        witDoer.held.clear()
+        witDoer.learn(entry)
+        assert list(witDoer.held) == [(wanHab.pre, habs[1].pre), (wilHab.pre, habs[1].pre)]
+        for hab in habs:
+            witDoer.learn(dict(ser=hab.kever.serder, sn=0, wits=wits, chain=[], phase="deliver"))
+
+        # interaction already known to be held through sn 0 so only the event itself is sent
+        hab = habs[0]
+        hab.interact(**CUE_KWA)
+        witDoer.cues.clear()
+        witDoer.msgs.append(dict(pre=hab.pre, sn=1))
+        outs = dict()
+        entry = witDoer.stage(witDoer.msgs.popleft(), outs)
+        assert entry["phase"] == "receipt"
+        msg = hab.msgOwnEvent(sn=1, framed=True)
+        for witer, auth, out in outs.values():
+            assert auth is None
+            assert bytes(out) == bytes(msg)
+
+        # auth codes travel with each stream not with the messenger
+        witers = dict(witDoer.witers)
+        outs = dict()
+        witDoer.stage(dict(pre=hab.pre, sn=1, auths={wanHab.pre: "123456#now"}), outs)
+        assert witDoer.witers == witers
+        assert sorted((witer.wit, auth) for witer, auth, _ in outs.values()) == sorted(
+            [(wanHab.pre, "123456#now"), (wilHab.pre, None)])
+        witDoer.flush(outs)
+        assert witers[wanHab.pre].msgs[-1] == (outs[(id(witers[wanHab.pre]), "123456#now")][2], "123456#now")
+        witers[wanHab.pre].msgs.clear()
+        witers[wilHab.pre].msgs.clear()
+
+        # changed endpoint rebuilds messenger keeping its unsent messages
+        witers[wanHab.pre].msgs.append(bytearray(msg))
+        witDoer.urls[wanHab.pre] = {}  # as if made for an endpoint since replaced
+        witer = witDoer.witer(hab, wanHab.pre)
+        assert witer is not witers[wanHab.pre]
+        assert list(witer.msgs) == [bytearray(msg)]
+        assert witers[wanHab.pre] not in witDoer.doers
+        witer.msgs.clear()
+
+        # unused idle messengers are dropped
+        witDoer.MaxIdle = 0.0
+        while witDoer.witers and not tymer.expired:
+            doist.recur()
+            time.sleep(doist.tock)
+        assert not witDoer.witers and not witDoer.urls and not witDoer.idled
+
+        doist.exit()
+
+
 def test_witness_sender(seeder, witnessPorter):
     with openHby(name="wan2", salt=Salter(raw=b'wann-the-witness').qb64, version=TEST_VERSION) as wanHby, \
             openHby(name="wil2", salt=Salter(raw=b'will-the-witness').qb64, version=TEST_VERSION) as wilHby, \
@@ -541,7 +649,7 @@ def test_witness_inquisitor_v2(mockHelpingNowUTC, seeder):
         for keys, cache in kram_entries:
             senders.append(keys[0])
             assert keys[0] in expected_senders
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.d == 1000
 
         assert len(senders) == len(expected_senders)
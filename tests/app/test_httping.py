@@ -7,12 +7,15 @@ tests.peer.httping module
 import falcon
 import pytest
 from falcon.testing import helpers
+from hio.base import doing
+from hio.core import http
 
 from keri.app import (openHab, parseCesrHttpRequest,
                       createCESRRequest, streamCESRRequests,
-                      CESR_CONTENT_TYPE)
+                      CESR_CONTENT_TYPE, Clienter)
 from keri.kering import Ilks, Vrsn_1_0, Vrsn_2_0, Kinds
 from keri.core import Kevery, Parser, SerderKERI
+from keri.core.kraming import epochMs
 from keri.vdr import Regery, Tevery, Verifier
 
 from tests.common import KWA
@@ -177,7 +180,7 @@ def test_create_cesr_request_v2(mockHelpingNowUTC):
         Parser(version=Vrsn_2_0).parse(ims=ims, kvy=kvy, tvy=tvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
         topics = {"/receipt": 0}
@@ -211,7 +214,7 @@ def test_create_cesr_request_v2(mockHelpingNowUTC):
         Parser(version=Vrsn_2_0).parse(ims=ims, kvy=kvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
 
@@ -351,7 +354,7 @@ def test_stream_cesr_request_v2(mockHelpingNowUTC):
         Parser(version=Vrsn_2_0).parse(ims=ims, kvy=kvy, tvy=tvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
         topics = {"/receipt": 0}
@@ -388,7 +391,7 @@ def test_stream_cesr_request_v2(mockHelpingNowUTC):
         Parser(version=Vrsn_2_0).parse(ims=ims, kvy=kvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
         msgs = hab.query(pre=hab.pre, src=wit, route="logs", query=dict(s=0),
@@ -442,9 +445,208 @@ def test_stream_cesr_request_v2(mockHelpingNowUTC):
         Parser(version=Vrsn_2_0).parse(ims=ims, kvy=kvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
 
+def test_clienter_pool(unused_tcp_port_factory):
+    """Test Clienter pools keep-alive connections per host"""
+    port = unused_tcp_port_factory()
+
+    class EchoEnd:
+        def on_get(self, req, rep):
+            rep.text = req.get_param("n")
+
+    app = falcon.App()
+    app.add_route("/echo", EchoEnd())
+    server = http.Server(port=port, app=app)
+    serverDoer = http.ServerDoer(server=server)
+
+    clienter = Clienter()
+    url = f"http://127.0.0.1:{port}/echo"
+    key = ("http", "127.0.0.1", port)
+
+    doist = doing.Doist(limit=5.0, tock=0.03125, real=True)
+    deeds = doist.enter(doers=[serverDoer, clienter])
+
+    def run(exchanges):
+        while not all(exchange.responses for exchange in exchanges):
+            assert doist.tyme < doist.limit
+            doist.recur(deeds=deeds)
+
+    # fan out beyond per host limit queues behind in flight requests
+    exchanges = [clienter.request("GET", f"{url}?n={i}") for i in range(6)]
+    conns = clienter.pools[key]
+    assert len(conns) == Clienter.MaxHost
+    assert [len(conn.pending) for conn in conns] == [2, 2, 1, 1]
+    assert list(clienter.clients) == exchanges
+    run(exchanges)
+    for i, exchange in enumerate(exchanges):
+        rep = exchange.respond()
+        assert rep.status == 200
+        assert rep.body == f"{i}".encode()
+        assert exchange.respond() is None
+        clienter.remove(exchange)
+    assert not clienter.clients
+    assert set(clienter.idle) == set(conns)  # all kept alive
+
+    # later requests reuse kept alive connections in order
+    first = clienter.request("GET", f"{url}?n=a")
+    second = clienter.request("GET", f"{url}?n=b")
+    assert first.conn in conns
+    assert second.conn in conns
+    assert second.conn is not first.conn  # first no longer idle
+    run([first, second])
+    assert first.respond().body == b"a"
+    assert second.respond().body == b"b"
+    assert len(clienter.pools[key]) == Clienter.MaxHost
+
+    # stale exchanges and idle connections are pruned
+    clienter.TimeoutClient = 0
+    clienter.MaxIdle = 0
+    doist.recur(deeds=deeds)
+    doist.recur(deeds=deeds)
+    assert not clienter.clients
+    assert not clienter.idle
+    assert not clienter.pools
+
+    doist.exit(deeds=deeds)
+
+    """Done Test"""
+
+
+def test_clienter_rehome(unused_tcp_port_factory):
+    """Test Clienter rehomes requests of redirected or cut off connections"""
+    port = unused_tcp_port_factory()
+    otherPort = unused_tcp_port_factory()
+
+    class EchoEnd:
+        def __init__(self, name):
+            self.name = name
+
+        def on_get(self, req, rep):
+            rep.text = f"{self.name}{req.get_param('n')}"
+
+    class JumpEnd:
+        def on_get(self, req, rep):
+            raise falcon.HTTPFound(f"http://127.0.0.1:{otherPort}/echo?n=x")
+
+    app = falcon.App()
+    app.add_route("/echo", EchoEnd("a"))
+    app.add_route("/jump", JumpEnd())
+    otherApp = falcon.App()
+    otherApp.add_route("/echo", EchoEnd("b"))
+    serverDoer = http.ServerDoer(server=http.Server(port=port, app=app))
+    otherDoer = http.ServerDoer(server=http.Server(port=otherPort, app=otherApp))
+
+    clienter = Clienter()
+    clienter.MaxHost = 1  # queue every request on one connection
+    url = f"http://127.0.0.1:{port}"
+    key = ("http", "127.0.0.1", port)
+
+    doist = doing.Doist(limit=5.0, tock=0.03125, real=True)
+    deeds = doist.enter(doers=[serverDoer, otherDoer, clienter])
+
+    def run(exchanges):
+        while not all(exchange.responses for exchange in exchanges):
+            assert doist.tyme < doist.limit
+            doist.recur(deeds=deeds)
+
+    # redirect to other host evicts connection and requeues request behind it
+    jump = clienter.request("GET", f"{url}/jump")
+    echo = clienter.request("GET", f"{url}/echo?n=1")
+    conn = jump.conn
+    assert echo.conn is conn
+    run([jump, echo])
+    assert jump.respond().body == b"bx"
+    assert conn.moved
+    assert echo.conn is not conn
+    assert echo.respond().body == b"a1"
+    assert clienter.pools[key] == [echo.conn]
+    assert not echo.conn.moved
+
+    later = clienter.request("GET", f"{url}/echo?n=2")
+    assert later.conn is echo.conn
+    run([later])
+    assert later.respond().body == b"a2"
+
+    # connection cut off in flight fails sent request and requeues the rest
+    first = clienter.request("GET", f"{url}/echo?n=3")
+    second = clienter.request("GET", f"{url}/echo?n=4")
+    conn = first.conn
+    assert second.conn is conn
+    while not conn.client.waited:
+        assert doist.tyme < doist.limit
+        doist.recur(deeds=deeds)
+    conn.client.connector.cutoff = True
+    run([first, second])
+    rep = first.respond()
+    assert rep.status == 503 and rep.errored
+    assert second.conn is not conn
+    assert second.respond().body == b"a4"
+    assert conn not in clienter.pools[key]
+
+    doist.exit(deeds=deeds)
+
+    """Done Test"""
+
+
+def test_clienter_abandon(unused_tcp_port_factory):
+    """Test Clienter closes connection whose request in flight is removed"""
+    from hio.core import tcp
+
+    port = unused_tcp_port_factory()
+    server = tcp.Server(port=port)  # accepts and reads but never answers
+    serverDoer = tcp.ServerDoer(server=server)
+
+    clienter = Clienter()
+    clienter.MaxHost = 1  # queue every request on one connection
+    url = f"http://127.0.0.1:{port}"
+    key = ("http", "127.0.0.1", port)
+
+    doist = doing.Doist(limit=5.0, tock=0.03125, real=True)
+    deeds = doist.enter(doers=[serverDoer, clienter])
+
+    # removing queued request keeps connection waiting on request in flight
+    hung = clienter.request("GET", f"{url}/hang?n=1")
+    queued = clienter.request("GET", f"{url}/hang?n=2")
+    conn = hung.conn
+    assert queued.conn is conn
+    while not conn.client.waited:
+        assert doist.tyme < doist.limit
+        doist.recur(deeds=deeds)
+    assert len(conn.client.requests) == 1
+    clienter.remove(queued)
+    assert not conn.client.requests
+    assert list(conn.pending) == [hung]
+    assert conn not in clienter.idle
+
+    # removing request in flight closes connection so later requests not stuck
+    later = clienter.request("GET", f"{url}/hang?n=3")
+    assert later.conn is conn
+    clienter.remove(hung)
+    assert conn not in clienter.pools[key]
+    assert conn not in clienter.idle
+    assert later.conn is not conn
+    assert list(later.conn.pending) == [later]
+    assert not later.responses
+
+    # timed out request in flight is removed the same way
+    conn = later.conn
+    while not conn.client.waited:
+        assert doist.tyme < doist.limit
+        doist.recur(deeds=deeds)
+    clienter.TimeoutClient = 0.0
+    while later in clienter.clients:
+        assert doist.tyme < doist.limit
+        doist.recur(deeds=deeds)
+    assert key not in clienter.pools
+    assert not clienter.idle
+
+    doist.exit(deeds=deeds)
+
+    """Done Test"""
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -18,6 +18,7 @@ from hio.help import decking
 
 from keri.kering import Schemes, Vrsn_1_0, Vrsn_2_0, Kinds, Ilks, Roles
 from keri.core import SerderKERI, Salter, Kevery, Parser
+from keri.core.kraming import epochMs
 from keri.db import basing
 from keri.app import (MailboxIterable, QryRpyMailboxIterable,
                       QueryEnd, Mailboxer, Receiptor,
@@ -115,6 +116,60 @@ def test_mailbox_multiple_iter():
         next(mbi)
 
 
+def test_mailbox_push_iter():
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    mbx = Mailboxer(temp=True)
+    for i in range(3):
+        mbx.storeMsg(topic=f"{pre}/receipt", msg=f"old {i}".encode("utf-8"))
+
+    mb = MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/multisig": 0}, retry=1000)
+    mb.MaxChunk = 40
+    mbi = iter(mb)
+    assert set(mbx.hub.subs[f"{pre}/receipt"]) == {mb}
+    assert next(mbi) == b'retry: 1000\n\n'
+
+    # backlog caught up from database in chunks of about MaxChunk bytes
+    assert next(mbi) == b'id: 0\nevent: /receipt\nretry: 1000\ndata: old 0\n\n'
+    assert list(mb.stale) == ["/receipt", "/multisig"]
+    assert next(mbi) == b'id: 1\nevent: /receipt\nretry: 1000\ndata: old 1\n\n'
+    assert next(mbi) == b'id: 2\nevent: /receipt\nretry: 1000\ndata: old 2\n\n'
+    assert next(mbi) == b''
+    assert not mb.stale
+    assert mb.topics == {"/receipt": 3, "/multisig": 0}
+
+    # idle streams do not read database
+    mbx.cloneTopicIter = None
+    assert next(mbi) == b''
+
+    # stored messages are pushed pre-framed
+    mb.MaxChunk = 1000
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=b"new 0")
+    assert mb.pending == b'id: 0\nevent: /multisig\nretry: 1000\ndata: new 0\n\n'
+    assert mb.topics["/multisig"] == 1
+    assert next(mbi) == b'id: 0\nevent: /multisig\nretry: 1000\ndata: new 0\n\n'
+    assert not mb.pending
+    del mbx.cloneTopicIter
+
+    # slow consumer falls back to database catch up once pending is full
+    mb.MaxPending = 100
+    for i in range(4):
+        mbx.storeMsg(topic=f"{pre}/receipt", msg=f"new {i}".encode("utf-8"))
+    assert len(mb.pending) == 94
+    assert list(mb.stale) == ["/receipt"]
+    assert mb.topics["/receipt"] == 5
+    val = next(mbi)
+    assert [int(line[4:]) for line in val.split(b"\n") if line.startswith(b"id: ")] == [3, 4, 5, 6]
+    assert not mb.stale
+    assert mb.topics["/receipt"] == 7
+
+    mb.TimeoutMBX = 0  # Force the iter to timeout
+    with pytest.raises(StopIteration):
+        next(mbi)
+    assert not mbx.hub.subs
+
+    mbx.close(clear=True)
+
+
 def test_qrymailbox_iter():
     with openHab(name="test", transferable=True, temp=True, salt=b'0123456789abcdef', **KWA) as (hby, hab):
         assert hab.pre == 'EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3'
@@ -204,7 +259,7 @@ def test_qrymailbox_iter_v2():
         Parser(version=Vrsn_2_0).parse(ims=bytearray(qry), kvy=kvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, srdr.said))
         assert cache is not None
-        assert cache.mdt == srdr.stamp
+        assert cache.mdt == epochMs(srdr.stamp)
         assert cache.d == 1000
 
         cues = decking.Deck()
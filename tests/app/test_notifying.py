@@ -180,6 +180,52 @@ def test_noter(mockHelpingNowUTC):
 
     cnt = noter.getNoteCnt()
     assert cnt == 13
+    assert noter.getNoteCnt(read=False) == 13
+    assert noter.getNoteCnt(read=True) == 0
+
+    res = noter.getNotes(start=10, end=20)
+    assert [note.attrs['a'] for note, _ in res] == [1, 2, 3]  # 2022 sort last
+
+    # test keyset pagination in (datetime, rid) order
+    full = [note.rid for note, _ in noter.getNotes(end=-1)]
+    assert len(full) == 13
+    rids = []
+    page, cursor = noter.getNotePage(limit=5)
+    while True:
+        assert len(page) <= 5
+        rids.extend(note.rid for note, _ in page)
+        assert all(c.qb64 == cig.qb64 for _, c in page)
+        if not cursor:
+            break
+        page, cursor = noter.getNotePage(cursor=cursor, limit=5)
+    assert rids == full
+
+    page, cursor = noter.getNotePage(limit=13)
+    assert len(page) == 13 and cursor == ""
+
+    # removed note at cursor resumes at next note
+    page, cursor = noter.getNotePage(limit=4)
+    assert noter.rem(page[-1][0].rid) is True
+    page, _ = noter.getNotePage(cursor=cursor, limit=1)
+    assert page[0][0].rid == full[4]
+
+    with pytest.raises(ValueError):
+        noter.getNotePage(cursor="not*base64")
+
+    # read and unread counts maintained incrementally
+    note, _ = noter.getNotes()[0]
+    note.read = True
+    assert noter.update(note, cig) is True
+    assert noter.getNoteCnt(read=True) == 1
+    assert noter.getNoteCnt(read=False) == 11
+    assert noter.rem(note.rid) is True
+    assert noter.getNoteCnt(read=True) == 0
+    assert noter.getNoteCnt(read=False) == 11
+
+    noter.ncnts.trim()  # counts are rebuilt for notes stored before counts
+    noter.recount()
+    assert noter.getNoteCnt(read=False) == 11
+    assert noter.getNoteCnt() == 11
 
 
 def test_notifier(mockHelpingNowUTC):
@@ -10,6 +10,7 @@ from keri.app import (QueryDoer, KeyStateNoticer, LogQuerier,
                       SeqNoQuerier, AnchorQuerier, openHby)
 
 from keri.core import SerderKERI, Parser, Kevery, reply
+from keri.core.kraming import epochMs
 from keri.db import dgKey
 
 from tests.common import CUE_KWA, KWA
@@ -331,7 +332,7 @@ def test_querying_v2():
         Parser(version=Vrsn_2_0).parse(ims=bytearray(qry), kvy=kvy)
         cache = hby1.db.kramMSGC.get(keys=(inqHab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
 
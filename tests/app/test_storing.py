@@ -6,12 +6,14 @@ tests.app.storing
 import os
 
 import lmdb
+import pytest
 
-from keri.app import Mailboxer, openKS
+from keri.app import Mailboxer, MailboxCompactor, openKS, openCF
 from keri import Vrsn_1_0
-from keri.kering import Kinds
-from keri.core import Prefixer, SerderKERI, exchange
+from keri.kering import Kinds, ConfigurationError
+from keri.core import Prefixer, SerderKERI, Diger, MtrDex, exchange
 from keri.db import OnSuber, openLMDB, openDB
+from keri.recording import MailboxPolicyRecord, MailboxStatsRecord
 
 from tests.common import KWA
 
@@ -118,5 +120,102 @@ def test_mailboxing():
 
 
 
+def test_mailbox_retention():
+    """
+    Test Mailboxer retention policies, reference counts and topic stats
+    """
+    with openLMDB(cls=Mailboxer) as mber:
+        pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+        rct = f"{pre}/receipt".encode()
+        cred = f"{pre}/credential".encode()
+        msgs = [f"message {i}".encode() for i in range(10)]
+
+        for i, msg in enumerate(msgs):
+            assert mber.storeMsg(topic=rct, msg=msg, now=1000 + i * 100)
+        mber.storeMsg(topic=cred, msg=msgs[0], now=1000)  # shared body
+
+        assert mber.getTopicStats(rct) == MailboxStatsRecord(cnt=10, size=90, nxt=10)
+        assert mber.getTopicStats(cred) == MailboxStatsRecord(cnt=1, size=9, nxt=1)
+        assert dict(mber.getStatsIter()) == {rct.decode(): mber.getTopicStats(rct),
+                                             cred.decode(): mber.getTopicStats(cred)}
+        assert mber.refs.get(keys=mber.tpcs.get(keys=rct, on=0)) == "2"
+
+        assert mber.compact(now=10000) == 0  # no policy nothing pruned
+
+        mber.setPolicy(MailboxPolicyRecord(cnt=8), topic="receipt")
+        assert mber.getPolicy(rct) == MailboxPolicyRecord(cnt=8)
+        assert mber.getPolicy(cred) is None
+        assert mber.compact(now=10000) == 2
+        assert [on for on, _, _ in mber.cloneTopicIter(rct)] == list(range(2, 10))
+        assert mber.getTopicStats(rct) == MailboxStatsRecord(cnt=8, size=72, nxt=10)
+        dig0 = mber.tpcs.get(keys=cred, on=0)
+        assert mber.msgs.get(keys=dig0) == "message 0"  # still referenced by cred
+        assert mber.refs.get(keys=dig0) == "1"
+        assert mber.msgs.get(keys=Diger(ser=msgs[1], code=MtrDex.Blake3_256).qb64) is None
+
+        mber.setPolicy(MailboxPolicyRecord(age=500), topic=rct.decode())  # full topic wins
+        assert mber.compact(now=1950) == 3  # stored at 1200, 1300 and 1400 are too old
+        assert [on for on, _, _ in mber.cloneTopicIter(rct, fn=4)] == list(range(5, 10))
+
+        mber.setPolicy(MailboxPolicyRecord(size=20))  # default for all topics
+        assert mber.compact(now=1950) == 0  # rct policy has no size limit
+        mber.pols.rem(keys=rct.decode())
+        mber.pols.rem(keys="receipt")
+        assert mber.compact(now=1950) == 3
+        assert mber.getTopicStats(rct) == MailboxStatsRecord(cnt=2, size=18, nxt=10)
+        assert mber.getTopicStats(cred) == MailboxStatsRecord(cnt=1, size=9, nxt=1)
+
+        # ordinals are not reused after topic emptied
+        assert mber.delTopic(rct, on=8)
+        assert not mber.delTopic(rct, on=8)
+        assert mber.delTopic(rct, on=9)
+        assert mber.storeMsg(topic=rct, msg=b"message 10")
+        assert [on for on, _, _ in mber.cloneTopicIter(rct)] == [10]
+
+        assert mber.delTopic(cred, on=0)
+        assert mber.msgs.get(keys=dig0) is None
+        assert mber.refs.get(keys=dig0) is None
+
+        # rebuild stats and references of mailbox stored before retention
+        mber.stts.trim()
+        mber.refs.trim()
+        mber.tdts.trim()
+        mber.recount(now=5000)
+        assert mber.getTopicStats(rct) == MailboxStatsRecord(cnt=1, size=10, nxt=11)
+        assert mber.getTopicStats(cred) is None
+        assert mber.tdts.get(keys=rct, on=10) == "5000"
+        assert mber.refs.get(keys=Diger(ser=b"message 10", code=MtrDex.Blake3_256).qb64) == "1"
+
+        mber.setPolicy(MailboxPolicyRecord(cnt=1))
+        compactor = MailboxCompactor(mbx=mber, tock=1.0)
+        assert mber.getPolicy(rct) == MailboxPolicyRecord(cnt=1)  # stored default kept
+        mber.storeMsg(topic=rct, msg=b"message 11")
+        assert not compactor.recur(tyme=0.0)
+        assert compactor.pruned == 1
+        assert [on for on, _, _ in mber.cloneTopicIter(rct)] == [11]
+
+        # without any default every mailbox is bounded by DefaultPolicy
+        mber.pols.trim()
+        MailboxCompactor(mbx=mber)
+        assert mber.getPolicy(rct) == MailboxCompactor.DefaultPolicy
+        assert MailboxCompactor.DefaultPolicy.age and MailboxCompactor.DefaultPolicy.size
+
+        # configured policies replace stored ones
+        with openCF(name="mbx", base="test", temp=True) as cf:
+            cf.put(dict(mailbox=dict(policies={"~": dict(cnt=5),
+                                               "receipt": dict(age=1000, size=64)})))
+            MailboxCompactor(mbx=mber, cf=cf)
+            assert mber.getPolicy(cred) == MailboxPolicyRecord(cnt=5)
+            assert mber.getPolicy(rct) == MailboxPolicyRecord(age=1000, size=64)
+
+            cf.put(dict(mailbox=dict(policies={"~": dict(cnt=-1)})))
+            with pytest.raises(ConfigurationError):
+                MailboxCompactor(mbx=mber, cf=cf)
+            cf.put(dict(mailbox=dict(policies={"~": dict(count=1)})))
+            with pytest.raises(ConfigurationError):
+                MailboxCompactor(mbx=mber, cf=cf)
+
+
 if __name__ == '__main__':
     test_mailboxing()
+    test_mailbox_retention()
@@ -8,7 +8,7 @@ from dataclasses import asdict
 import pytest
 
 from keri.app import Adjudicator, DiffState, diffState, openHby
-from keri.core import Saider, Salter
+from keri.core import Saider, Salter, Diger, Dater, Kevery
 from keri.recording import KeyStateRecord, ObservedRecord
 
 from tests.common import CUE_KWA, KWA
@@ -165,3 +165,105 @@ def test_adjudicator():
 
         with pytest.raises(ValueError):
             adj.adjudicate(hab.pre, 2)
+
+
+def test_adjudicator_monitor():
+    default_salt = Salter(raw=b'0123456789abcdef').qb64
+    with openHby(name="test", base="test", temp=True, salt=default_salt, version=KWA["version"]) as hby:
+        hab = hby.makeHab("test", **KWA)
+        kvy = Kevery(db=hab.db, lax=True, local=False)
+        wat0 = "BbIg_3-11d3PYxSInLN-Q9_T2axD6kkXd3XRgbGZTm6s"
+        wat1 = "BAyRFMideczFZoapylLIyCjSdhtqVb31wZkRKvPfNqkw"
+        dater = Dater(dts="2021-06-09T17:35:54.169967+00:00")
+
+        def notice(watcher, sn, dig):
+            ksr = KeyStateRecord(**asdict(hab.kever.state()))
+            ksr.s = f"{sn:x}"
+            ksr.d = dig
+            saider = Diger(ser=f"{watcher}{sn}{dig}".encode())
+            kvy.updateKeyState(aid=watcher, ksr=ksr, saider=saider, dater=dater)
+
+        adj = Adjudicator(hby=hby, hab=hab)
+        assert adj in hab.db.observers
+
+        kvy.updateWatched(keys=(hab.pre, wat0, hab.pre), saider=Saider(qb64=hab.pre), enabled=True)
+        notice(wat0, 0, hab.pre)
+        assert adj.watchers is None  # nothing loaded until used
+        assert not adj.table
+
+        adj.msgs.append(dict(oid=hab.pre, toad=1, monitor=True))
+        adj.performAdjudications()
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateConsistent"
+        assert cue["states"] == [DiffState(hab.pre, wat0, "even", 0, hab.pre)]
+        assert adj.table == {hab.pre: {wat0: (0, hab.pre)}}
+
+        # nothing changed so no cue
+        adj.performAdjudications()
+        assert not adj.cues
+
+        # same key state again changes nothing
+        notice(wat0, 0, hab.pre)
+        adj.performAdjudications()
+        assert not adj.cues
+
+        # newly added watcher reports key state, table updated without rescan
+        kvy.updateWatched(keys=(hab.pre, wat1, hab.pre), saider=Saider(qb64=hab.pre), enabled=True)
+        assert adj.watchers[hab.pre] == {wat0, wat1}
+        assert list(adj.wakes) == [hab.pre]
+        adj.performAdjudications()
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateConsistent"
+        assert cue["wids"] == {wat0, wat1}
+        assert len(cue["states"]) == 1
+
+        notice(wat1, 1, wat1)  # wat1 is ahead
+        adj.performAdjudications()
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateUpdate"
+        assert cue["aheads"] == [DiffState(hab.pre, wat1, "ahead", 1, wat1)]
+
+        notice(wat0, 0, wat0)  # wat0 duplicitous
+        adj.performAdjudications()
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateDuplicitous"
+        assert cue["dups"] == [DiffState(hab.pre, wat0, "duplicitous", 0, wat0)]
+
+        # cut watchers so only consistent state remains
+        kvy.updateWatched(keys=(hab.pre, wat0, hab.pre), saider=Saider(qb64=hab.pre), enabled=False)
+        kvy.updateWatched(keys=(hab.pre, wat1, hab.pre), saider=Saider(qb64=hab.pre), enabled=False)
+        adj.performAdjudications()
+        assert not adj.cues  # toad 1 greater than no watchers is logged
+
+        # notices for unmonitored watched AIDs or unknown watchers are ignored
+        notice(wat0, 2, hab.pre)
+        assert not adj.wakes
+
+        # explicit adjudication always cues
+        kvy.updateWatched(keys=(hab.pre, wat0, hab.pre), saider=Saider(qb64=hab.pre), enabled=True)
+        adj.adjudicate(hab.pre, 1)
+        cue = adj.cues.pull()
+        assert cue["kin"] == "keyStateUpdate"
+        adj.performAdjudications()
+        assert not adj.cues  # already reported
+
+        # local key state changes wake monitored AID too
+        notice(wat0, hab.kever.sn, hab.kever.serder.said)
+        adj.performAdjudications()
+        assert adj.cues.pull()["kin"] == "keyStateConsistent"
+        hab.interact()
+        assert list(adj.wakes) == [hab.pre]
+        adj.performAdjudications()
+        assert adj.cues.pull()["kin"] == "keyStateLagging"  # wat0 now behind
+
+        # unknown AID without local key state is logged not raised
+        adj.msgs.append(dict(oid=wat1, monitor=True))
+        adj.performAdjudications()
+        assert not adj.cues
+        adj.ignore(wat1)
+
+        adj.ignore(hab.pre)
+        notice(wat0, 3, hab.pre)
+        adj.performAdjudications()
+        assert not adj.cues
+        assert hab.pre not in adj.table
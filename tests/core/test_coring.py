@@ -5,7 +5,9 @@ tests.core.test_coring module
 """
 from dataclasses import dataclass, asdict, astuple
 import hashlib
+import itertools
 import json
+import random
 from base64 import urlsafe_b64decode as decodeB64
 from base64 import urlsafe_b64encode as encodeB64
 from fractions import Fraction
@@ -28,7 +30,7 @@ from keri.kering import (EmptyMaterialError, RawMaterialError, ShortageError,
 
 from keri.help import sceil, intToB64, codeB64ToB2, DTS_BASE_0, DTS_BASE_1
 
-from keri.core import (Saids, Tholder, Seqner, NumDex, Number, Decimer, DecDex,
+from keri.core import (Saids, Tholder, Tally, Seqner, NumDex, Number, Decimer, DecDex,
                        Dater, Bexter, Texter, TagDex, Tagger, Ilker, Traitor,
                        Labeler, LabelDex, Verser, Versage, Sizage, MtrDex, Matter,
                        Verfer, Cigar, Saider, DigDex, Diger, Prefixer, PreDex,
@@ -2315,6 +2317,48 @@ def test_matter_special():
     """ Done Test """
 
 
+def test_matter_memo():
+    """
+    Test memoized encodings .qb64b .qb64 .qb2 of Matter
+    """
+    raw = b'\xff' * 32
+    code = MtrDex.Ed25519
+    qb64 = 'DP__________________________________________'
+    qb64b = qb64.encode()
+    qb2 = decodeB64(qb64b)
+
+    matter = Matter(raw=raw, code=code)
+    assert matter._memo is None  # not computed until accessed
+    assert matter.qb64b == qb64b
+    assert matter.qb64b is matter.qb64b  # memoized
+    assert matter.qb64 == qb64
+    assert matter.qb64 is matter.qb64
+    assert matter.qb2 == qb2
+    assert matter.qb2 is matter.qb2
+    assert matter._memo == [code, '', raw, qb64b, qb64, qb2]
+
+    # extraction seeds memo with extracted material
+    ims = bytearray(qb64b + b'extra')
+    matter = Matter(qb64b=ims, strip=True)
+    assert ims == bytearray(b'extra')
+    assert matter._memo[3] == qb64b
+    assert isinstance(matter.qb64b, bytes)
+    assert matter.qb64 == qb64
+    assert matter.qb2 == qb2
+
+    matter = Matter(qb2=qb2)
+    assert matter._memo[5] == qb2
+    assert matter.qb64b == qb64b
+
+    # rebinding ._raw resets memo
+    matter = Matter(qb64=qb64)
+    assert matter.qb64 == qb64
+    matter._raw = b'\x00' * 32
+    assert matter.qb64 == 'DAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
+    assert matter.qb2 == decodeB64(matter.qb64b)
+    """ Done Test """
+
+
 def test_seqner():
     """
     Test Seqner sequence number subclass Matter
@@ -7248,6 +7292,87 @@ def test_tholder():
     """ Done Test """
 
 
+def satisfyFractions(thold, size, indices):
+    """Reference weighted satisfaction with Fraction arithmetic"""
+    sats = [False] * size
+    for idx in indices:
+        sats[idx] = True
+    wio = 0
+    for clause in thold:
+        cw = 0
+        for e in clause:
+            if isinstance(e, tuple):
+                vw = 0
+                for w in e[1]:
+                    vw += w if sats[wio] else 0
+                    wio += 1
+                if vw >= 1:
+                    cw += e[0]
+            else:
+                cw += e if sats[wio] else 0
+                wio += 1
+        if cw < 1:
+            return False
+    return True
+
+
+def test_tholder_tally():
+    """
+    Test compiled weighted satisfaction and incremental Tally
+    """
+    siths = [["1/2", "1/2", "1/2"],
+             ["1/3", "1/3", "1/3", "1/4", "1/6"],
+             [["1/2", "1/2", "1/4", "1/4", "1/4"], ["1", "1"]],
+             [[{"1/3": ["1/2", "1/2", "1/2"]}, "1/2", {"1/2": ["1", "1"]}],
+              ["1/2", {"1/2": ["1", "1"]}]],
+             ["0", "1/7", "6/7", "1/5", "4/5"]]
+
+    for sith in siths:
+        tholder = Tholder(sith=sith)
+        size = tholder.size
+        for n in range(size + 1):
+            for indices in itertools.combinations(range(size), n):
+                expect = bool(indices) and satisfyFractions(tholder.thold, size, indices)
+                assert tholder.satisfy(list(indices)) == expect, (sith, indices)
+
+                order = list(indices)
+                random.shuffle(order)
+                tally = tholder.tally()
+                for i, idx in enumerate(order):
+                    result = tally.add(idx)
+                    assert result == satisfyFractions(tholder.thold, size, order[:i + 1])
+                assert tally.satisfied == expect
+                assert tally.count == n
+
+    tholder = Tholder(sith=[["1/2", "1/2", "1/4", "1/4", "1/4"], ["1", "1"]])
+    assert tholder._denom == 4
+    assert tholder._clauses[0] == (((0b00011, 2), (0b11100, 1)), ())
+    assert tholder._clauses[1] == (((0b1100000, 4), ), ())
+    assert tholder.satisfy([0, 0, 1, 5])  # duplicates ignored
+    assert not tholder.satisfy([0, 1, 7])  # index out of range
+    assert tholder.satisfy([0, 1, -2])  # -2 is offset from end like list index
+
+    tally = Tally(tholder=tholder, indices=[0, 1])
+    assert not tally.satisfied
+    assert not tally.add(1)
+    assert tally.add(6)
+    assert tally.add(2)  # stays satisfied
+    assert tally.mask == 0b1000111
+    with pytest.raises(ValueError):
+        tally.add(7)
+    with pytest.raises(ValueError):
+        tally.add(-1)
+
+    tholder = Tholder(sith="2")
+    tally = tholder.tally()
+    assert not tally.add(3)
+    assert not tally.add(3)  # duplicate not counted
+    assert tally.add(0)
+    assert not Tholder(sith="0").tally(indices=[0, 1]).satisfied
+
+    """ Done Test """
+
+
 def test_dicter():
     """Test Dicter base class"""
     from keri.core import Dicter
@@ -7358,6 +7483,7 @@ if __name__ == "__main__":
     test_matter_class()
     test_matter()
     test_matter_special()
+    test_matter_memo()
     test_tagger()
     test_ilker()
     test_traitor()
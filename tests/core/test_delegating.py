@@ -14,7 +14,7 @@ from keri.core import (Number, Seqner, Diger, Kevery,
                        incept, delcept, interact, deltate)
 
 from keri.app import Manager, openKS, openHby, openHab
-from keri.db import snKey, openDB
+from keri.db import Baser, snKey, openDB
 
 logger = ogler.getLogger()
 from tests.common import CUE_KWA, KWA
@@ -924,6 +924,89 @@ def test_fetch_delegating_event():
     """End Test"""
 
 
+def test_delegation_unindexed_anchor(tmp_path):
+    """
+    Test delegation resolves from a database whose delegating event was logged
+    before the .anxs anchored seal index existed and was never migrated.
+    """
+    bobSalt = Salter(raw=b'0123456789abcdef').qb64
+    delSalt = Salter(raw=b'abcdef0123456789').qb64
+    version = Vrsn_1_0
+    headDirPath = str(tmp_path)
+
+    with (openKS(name="bob") as bobKS,
+          openKS(name="del") as delKS):
+
+        bobMgr = Manager(ks=bobKS, salt=bobSalt)
+        delMgr = Manager(ks=delKS, salt=delSalt)
+
+        # Bob inception
+        verfers, digers = bobMgr.incept(stem='bob', temp=True)
+        bobSrdr = incept(keys=[verfer.qb64 for verfer in verfers],
+                         ndigs=[diger.qb64 for diger in digers],
+                         code=MtrDex.Blake3_256,
+                         version=version, kind=Kinds.json)
+        bob = bobSrdr.ked["i"]
+        bobMgr.move(old=verfers[0].qb64, new=bob)
+        sigers = bobMgr.sign(ser=bobSrdr.raw, verfers=verfers)
+        icp = bytearray(bobSrdr.raw)
+        icp.extend(Counter(Codens.ControllerIdxSigs, count=len(sigers),
+                           version=version).qb64b)
+        for siger in sigers:
+            icp.extend(siger.qb64b)
+
+        # Del's delegated inception anchored by Bob's ixn
+        dverfers, digers = delMgr.incept(stem='del', temp=True)
+        delSrdr = delcept(keys=[verfer.qb64 for verfer in dverfers],
+                          delpre=bob,
+                          ndigs=[diger.qb64 for diger in digers],
+                          version=version, kind=Kinds.json)
+        delPre = delSrdr.ked["i"]
+        delMgr.move(old=dverfers[0].qb64, new=delPre)
+
+        seal = SealEvent(i=delPre, s=delSrdr.ked["s"], d=delSrdr.said)
+        bobIxnSrdr = interact(pre=bob, dig=bobSrdr.said, sn=1,
+                              data=[seal._asdict()],
+                              version=version, kind=Kinds.json)
+        sigers = bobMgr.sign(ser=bobIxnSrdr.raw, verfers=verfers)
+        ixn = bytearray(bobIxnSrdr.raw)
+        ixn.extend(Counter(Codens.ControllerIdxSigs, count=len(sigers),
+                           version=version).qb64b)
+        for siger in sigers:
+            ixn.extend(siger.qb64b)
+
+        # log Bob's KEL then drop its index as a database from before .anxs
+        db = Baser(name="legacy", headDirPath=headDirPath, temp=False, reopen=True)
+        parsing.Parser(version=version).parse(ims=icp + ixn, kvy=Kevery(db=db))
+        assert db.kevers[bob].sn == 1
+        db.anxs.trim()
+        db.close()
+
+        db = Baser(name="legacy", headDirPath=headDirPath, temp=False, reopen=True)
+        try:
+            assert db.anxs.get(keys=(bob, delSrdr.said)) == []
+            kvy = Kevery(db=db)
+
+            # dip without source seal couple so delegator's KEL must be searched
+            sigers = delMgr.sign(ser=delSrdr.raw, verfers=dverfers)
+            dip = bytearray(delSrdr.raw)
+            dip.extend(Counter(Codens.ControllerIdxSigs, count=len(sigers),
+                               version=version).qb64b)
+            for siger in sigers:
+                dip.extend(siger.qb64b)
+            parsing.Parser(version=version).parse(ims=dip, kvy=kvy)
+            kvy.processEscrows()
+
+            assert delPre in kvy.kevers
+            assert kvy.kevers[delPre].delegated
+            assert db.fetchLastSealingEventByEventSeal(bob, seal=seal._asdict()).said == bobIxnSrdr.said
+            (number, diger), = db.anxs.get(keys=(bob, delSrdr.said))  # backfilled
+            assert number.num == 1 and diger.qb64 == bobIxnSrdr.said
+            assert bob in db.anxed
+        finally:
+            db.close(clear=True)
+
+
 if __name__ == "__main__":
     test_delegation()
     test_fetch_delegating_event()
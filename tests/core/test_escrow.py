@@ -2052,6 +2052,124 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_escrow_wakes():
+    """
+    Test Kevery.processEscrows only walks escrows woken by new data
+    """
+    signer, nxt = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+    icp = incept(keys=[signer.verfer.qb64],
+                 ndigs=[Diger(ser=nxt.verfer.qb64b).qb64],
+                 code=MtrDex.Blake3_256, **KWA)
+    pre = icp.pre
+    ixn = interact(pre=pre, dig=icp.said, sn=1, **KWA)
+    icpmsg = eventing.messagize(icp, sigers=[signer.sign(icp.raw, index=0)],
+                                gvrsn=Vrsn_1_0)
+    ixnmsg = eventing.messagize(ixn, sigers=[signer.sign(ixn.raw, index=0)],
+                                gvrsn=Vrsn_1_0)
+    psr = parsing.Parser(version=Vrsn_1_0)
+
+    with openDB(name="wes", temp=True) as db:
+        kvy = Kevery(db=db)
+        assert not db.escrowWakes and not db.escrowAccepted
+
+        psr.parse(ims=bytearray(ixnmsg), kvy=kvy)  # out of order
+        assert db.ooes.get(keys=pre, on=1) == [ixn.said]
+        assert list(db.escrowWakes) == [pre]  # arrival woke its escrows
+
+        kvy.processEscrows()  # first pass sweeps all
+        assert kvy._swept is not None
+        assert not db.escrowWakes
+        assert db.ooes.get(keys=pre, on=1) == [ixn.said]  # still out of order
+
+        kvy.TimeoutOOE = 0  # forces escrow to be stale
+        kvy.processEscrows()  # nothing woke and sweep not due so not walked
+        assert db.ooes.get(keys=pre, on=1) == [ixn.said]
+        kvy.processEscrows(sweep=True)  # full walk expires stale escrow
+        assert db.ooes.get(keys=pre, on=1) == []
+
+        kvy.TimeoutOOE = Kevery.TimeoutOOE
+        psr.parse(ims=bytearray(ixnmsg), kvy=kvy)  # escrow again
+        kvy.processEscrows(sweep=False)  # woken pass still out of order
+        assert db.ooes.get(keys=pre, on=1) == [ixn.said]
+        assert not db.escrowWakes  # replays while escrowing do not rewake
+
+        psr.parse(ims=bytearray(icpmsg), kvy=kvy)  # prior event accepted
+        assert db.escrowAccepted and list(db.escrowWakes) == [pre]
+        kvy.processEscrows(sweep=False)  # woken pass unescrows ixn
+        assert db.ooes.get(keys=pre, on=1) == []
+        assert kvy.kevers[pre].sn == 1
+
+    """End Test"""
+
+
+def test_escrow_pruning():
+    """
+    Test Kevery.pruneEscrows and EscrowPruner with escrow time index .etxs
+    """
+    signer, nxt = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+    icp = incept(keys=[signer.verfer.qb64],
+                 ndigs=[Diger(ser=nxt.verfer.qb64b).qb64],
+                 code=MtrDex.Blake3_256, **KWA)
+    pre = icp.pre
+    ixn = interact(pre=pre, dig=icp.said, sn=1, **KWA)
+    icpmsg = eventing.messagize(icp, sigers=[signer.sign(icp.raw, index=0)],
+                                gvrsn=Vrsn_1_0)
+    ixnmsg = eventing.messagize(ixn, sigers=[signer.sign(ixn.raw, index=0)],
+                                gvrsn=Vrsn_1_0)
+    psr = parsing.Parser(version=Vrsn_1_0)
+
+    with openDB(name="pes", temp=True) as db:
+        kvy = Kevery(db=db)
+        pruner = eventing.EscrowPruner(kevery=kvy)
+        assert pruner.tock == 10.0
+
+        psr.parse(ims=bytearray(ixnmsg), kvy=kvy)  # out of order
+        assert db.ooes.get(keys=pre, on=1) == [ixn.said]
+        items = [(keys, snh) for keys, snh in db.etxs.getTopItemIter()]
+        assert len(items) == 1
+        (escrow, dts, ipre, dig), snh = items[0]
+        assert (escrow, ipre, dig, snh) == ("ooes", pre, ixn.said, "1")
+        assert dts == db.dtss.get(keys=dgKey(pre, ixn.said)).dts
+
+        psr.parse(ims=bytearray(ixnmsg), kvy=kvy)  # idempotent
+        assert len([item for item in db.etxs.getTopItemIter()]) == 1
+
+        assert kvy.pruneEscrows() == 0  # not stale
+        assert db.ooes.get(keys=pre, on=1) == [ixn.said]
+
+        kvy.TimeoutOOE = 0  # forces escrow to be stale
+        assert not pruner.recur(tyme=0.0)
+        assert pruner.pruned == 1
+        assert db.ooes.get(keys=pre, on=1) == []
+        assert not [item for item in db.etxs.getTopItemIter()]
+
+        kvy.TimeoutOOE = Kevery.TimeoutOOE
+        psr.parse(ims=bytearray(ixnmsg), kvy=kvy)  # escrow again
+        psr.parse(ims=bytearray(icpmsg), kvy=kvy)
+        kvy.processEscrows()  # unescrows ixn but leaves index entry
+        assert kvy.kevers[pre].sn == 1
+        assert len([item for item in db.etxs.getTopItemIter()]) == 1
+        kvy.TimeoutOOE = 0
+        assert kvy.pruneEscrows() == 0  # drops index entry only
+        assert not [item for item in db.etxs.getTopItemIter()]
+
+        # likely duplicitous escrow uses its own timeout
+        kvy.TimeoutOOE = Kevery.TimeoutOOE
+        dup = interact(pre=pre, dig=icp.said, sn=1, data=[dict(i=pre)], **KWA)
+        dupmsg = eventing.messagize(dup, sigers=[signer.sign(dup.raw, index=0)],
+                                    gvrsn=Vrsn_1_0)
+        psr.parse(ims=bytearray(dupmsg), kvy=kvy)
+        assert db.ldes.get(keys=pre, on=1) == [dup.said]
+        assert [keys[0] for keys, _ in db.etxs.getTopItemIter()] == ["ldes"]
+        assert kvy.pruneEscrows() == 0  # not stale
+        kvy.TimeoutLDE = 0
+        assert kvy.pruneEscrows() == 1
+        assert db.ldes.get(keys=pre, on=1) == []
+        assert not [item for item in db.etxs.getTopItemIter()]
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_partial_signed_escrow()
     test_missing_delegator_escrow()
@@ -2064,3 +2182,5 @@ if __name__ == "__main__":
     test_ooes_missing_db_entries_escrow_cleanup()
     test_unverified_receipt_escrow()
     test_unverified_trans_receipt_escrow()
+    test_escrow_wakes()
+    test_escrow_pruning()
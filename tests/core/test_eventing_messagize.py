@@ -4,13 +4,15 @@ tests.core.test_eventing_messagize module
 
 """
 import os
+from base64 import urlsafe_b64encode as encodeB64
+from base64 import urlsafe_b64decode as decodeB64
 
 import blake3
 import pysodium
 import pytest
 
 from keri import (ValidationError, UnverifiedReceiptError, InvalidCodeError,
-                         Ilks, TraitDex, Vrsn_1_0, Vrsn_2_0, Ilks, Kinds,
+                         Ilks, TraitDex, Vrsn_1_0, Vrsn_2_0, Ilks, Kinds, Colds,
                          versify)
 
 from keri.app import habbing, openKS, Manager
@@ -2820,6 +2822,50 @@ def test_messagize_with_prior_next():
     """ Done Test """
 
 
+def test_messagize_binary():
+    """Test messagize in qb2 binary domain and parsing its binary output
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+
+    configs = [(dict(kind=Kinds.json, pvrsn=Vrsn_1_0), Vrsn_1_0, False),
+               (dict(kind=Kinds.json, pvrsn=Vrsn_2_0), Vrsn_2_0, False),
+               (dict(kind=Kinds.cesr, pvrsn=Vrsn_2_0), Vrsn_2_0, False),
+               (dict(kind=Kinds.cesr, pvrsn=Vrsn_2_0), Vrsn_2_0, True),
+               (dict(kind=Kinds.json, pvrsn=Vrsn_2_0), Vrsn_2_0, True)]
+
+    for kwa, gvrsn, nested in configs:
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64],
+                        code=MtrDex.Blake3_256, version=Vrsn_1_0, **kwa)
+        sigers = [signers[0].sign(serder.raw, index=0)]
+        txt = messagize(serder, sigers=sigers, gvrsn=gvrsn, nested=nested)
+        bny = messagize(serder, sigers=sigers, gvrsn=gvrsn, nested=nested,
+                        cold=Colds.bny)
+        assert isinstance(bny, bytearray)
+        if nested or serder.kind == Kinds.cesr:  # whole msg is binary
+            assert encodeB64(bny) == txt
+            assert len(bny) == len(txt) * 3 // 4
+        else:  # non-native body left as is
+            assert bny.startswith(serder.raw)
+            assert encodeB64(bny[serder.size:]) == txt[serder.size:]
+        assert len(bny) < len(txt)
+
+        for ims in (txt, bny):
+            with openDB(name="bny") as db:
+                kvy = Kevery(db=db)
+                Parser(kvy=kvy, version=gvrsn).parse(ims=bytearray(ims))
+                assert kvy.kevers[serder.pre].serder.said == serder.said
+                assert kvy.kevers[serder.pre].serder.raw == serder.raw
+
+        if serder.kind == Kinds.cesr:  # native body reaped from binary domain
+            raw = bytearray(decodeB64(serder.raw))
+            assert SerderKERI(raw=raw, strip=True).raw == serder.raw
+            assert raw == bytearray()
+
+    with pytest.raises(ValueError):
+        messagize(serder, sigers=sigers, cold=Colds.msg)
+
+    """ Done Test """
 
 
 if __name__ == "__main__":
@@ -2833,3 +2879,4 @@ if __name__ == "__main__":
     test_messagize_v2_native_with_nests()
     test_messagize_v2_json_with_nests()
     test_messagize_with_prior_next()
+    test_messagize_binary()
@@ -26,7 +26,8 @@ from keri.core import (Signer, Counter, Codens, Kever, Parser,
                        deReceiptCouple, deSourceCouple, deReceiptTriple,
                        deTransReceiptQuadruple, deTransReceiptQuintuple,
                        incept, rotate, interact, receipt, query, delcept,
-                       deltate, state, messagize, loadEvent)
+                       deltate, state, messagize, loadEvent,
+                       verifyBatch, verifySigs)
 
 from keri.db import openDB, dgKey, snKey
 from keri.help import helping, ogler
@@ -599,6 +600,44 @@ def test_lastestloc():
     """End Test """
 
 
+def test_verify_batch():
+    """
+    Test verifyBatch and batched verifySigs
+    """
+    signers = [Signer(raw=bytes([i]) * 32, transferable=True) for i in range(3)]
+    verfers = [signer.verfer for signer in signers]
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+    sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+    triples = [(ser, siger.raw, siger.verfer) for siger in sigers]
+    assert verifyBatch(triples) == [True, True, True]
+    # bad sig and duplicates preserve order
+    triples.insert(1, (ser + b'x', sigers[0].raw, sigers[0].verfer))
+    triples.append(triples[0])
+    assert verifyBatch(triples) == [True, False, True, True, True]
+    assert verifyBatch([]) == []
+
+    # threaded path gives same results as sequential
+    sers = [ser + bytes([i]) for i in range(40)]
+    triples = [(s, signers[i % 3].sign(s).raw, verfers[i % 3])
+               for i, s in enumerate(sers)]
+    triples[7] = (sers[8], triples[7][1], triples[7][2])  # wrong ser
+    expect = [i != 7 for i in range(40)]
+    assert verifyBatch(triples, workers=1) == expect
+    assert verifyBatch(triples, workers=4) == expect
+
+    # verifySigs dedupes, skips bad index, and drops bad sigs
+    bad = signers[2].sign(ser + b'x', index=2)
+    big = signers[0].sign(ser, index=5)
+    vsigers, vindices = verifySigs(ser, sigers[:2] + [sigers[0], bad, big], verfers)
+    assert vindices == [0, 1]
+    assert [siger.qb64 for siger in vsigers] == [sigers[0].qb64, sigers[1].qb64]
+    assert vsigers[0].verfer.qb64 == verfers[0].qb64
+    assert verifySigs(ser, None, verfers) == ([], [])
+
+    """End Test """
+
+
 def test_seals_states():
     """
     Test seal and state namedtuples
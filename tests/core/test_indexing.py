@@ -737,6 +737,35 @@ def test_indexer():
     """ Done Test """
 
 
+def test_indexer_memo():
+    """
+    Test memoized encodings .qb64b .qb64 .qb2 of Indexer
+    """
+    qsig64 = ('AACdI8OSQkMJ9r-xigjEByEjIua7LHH3AOJ22PQKqljMhuhcgh9nGRcKnsz5KvKd'
+              '7K_H9-1298F4Id1DxvIoEmCQ')
+    qsig64b = qsig64.encode("utf-8")
+    qsig2 = decodeB64(qsig64b)
+
+    ims = bytearray(qsig64b)
+    indexer = Indexer(qb64b=ims, strip=True)
+    assert not ims
+    assert indexer._memo[4] == qsig64b  # seeded by extraction
+    assert indexer.qb64 == qsig64
+    assert indexer.qb64 is indexer.qb64
+    assert indexer.qb2 == qsig2
+    assert indexer.qb2 is indexer.qb2
+
+    indexer = Indexer(raw=indexer.raw, code=indexer.code, index=5)
+    assert indexer._memo is None
+    qb64 = indexer.qb64
+    assert qb64 != qsig64
+    assert Indexer(qb64=qb64).index == 5
+    indexer._index = 0  # rebinding index resets memo
+    assert indexer.qb64 == qsig64
+    assert indexer.qb2 == qsig2
+    """ Done Test """
+
+
 
 
 def test_siger():
@@ -799,4 +828,5 @@ def test_siger():
 if __name__ == "__main__":
     test_indexer_class()
     test_indexer()
+    test_indexer_memo()
     test_siger()
@@ -5,6 +5,8 @@ Tests for KRAM (KERI Request Authentication Mechanism) integration through
 processMsg on Kevery.
 """
 
+import json
+
 import pytest
 from datetime import timedelta
 
@@ -15,12 +17,13 @@ from keri.kering import (KramConfigurationError, MissingAuthAttachmentError,
                          MissingSenderKeyStateError, ValidationError,
                          Protocols, Kinds, Ilks, Vrsn_1_0, Vrsn_2_0, versify)
 
-from keri.core import (Kramer, SerderKERI, Kevery, Pruner, Salter,
+from keri.core import (Kramer, SerderKERI, Kevery, Pruner, Salter, PrefixTrie,
                        Parser, Seqner, Saider, Prefixer, Diger,
                        Dater, Noncer, Number, Verser, Labeler, Texter,
                        AuthTypes, exchange, exchept, reply, query)
 
 from keri.app import openHby, openCF
+from keri.core.kraming import epochMs, expiryKey
 from keri.db import openDB
 from keri.peer import Exchanger
 from keri.recording import MsgCacheRecord, TxnMsgCacheRecord
@@ -308,6 +311,57 @@ def test_change_config_rejects_invalid_cache_constraints():
             assert kramer._kramCTYPCf == old_cfg["kram"]["caches"]
 
 
+def test_cache_type_and_denial_index():
+    """Kramer answers cache-type and denial lookups from in-memory indices"""
+    trie = PrefixTrie(["CAA.rpy./end/role", "CAA.exn.", "CAA.exn."])
+    assert len(trie) == 2
+    assert trie.match("CAA.rpy./end/role")
+    assert trie.match("CAA.rpy./end/role/add")
+    assert trie.match("CAA.exn./fwd")
+    assert not trie.match("CAA.rpy./end")
+    assert not trie.match("CAA.qry./end/role")
+    assert not trie.match("")
+    assert PrefixTrie([""]).match("anything")
+    assert not PrefixTrie().match("anything")
+
+    cfg = {
+        "kram": {
+            "enabled": True,
+            "denials": [[[2, 0], "exn", ""]],
+            "caches": {
+                "~": [100, 2000, 3000, 4000, 2000, 3000, 4000],
+                "qry": [50, 1000, 3000, 4000, 1000, 3000, 4000],
+                "qry.R.logs": [50, 500, 3000, 4000, 500, 3000, 4000],
+            }
+        }
+    }
+
+    with openCF(name="kram", base="test", temp=True) as cf:
+        cf.put(cfg)
+        with openDB(name="test_cache_type_index", temp=True) as db:
+            kramer = Kramer(db, cf)
+            v2b64 = Verser.verToB64(major=2, minor=0)
+            assert kramer._denialTrie.match(f"{v2b64}.exn./fwd")
+            assert kramer._denialTrie.match(f"{v2b64}.rpy./end/role/add")  # oobi
+            assert not kramer._denialTrie.match(f"{v2b64}.qry.logs")
+
+            assert kramer._fetchCacheType("qry", "logs").sl == 500
+            assert kramer._fetchCacheType("qry", "ksn").sl == 1000
+            assert kramer._fetchCacheType("qry", "").sl == 1000
+            assert kramer._fetchCacheType("rpy", "/end").sl == 2000
+
+            # index is not read from the database per lookup
+            db.kramCTYP.rem("qry.R.logs")
+            assert kramer._fetchCacheType("qry", "logs").sl == 500
+
+            del cfg["kram"]["caches"]["qry.R.logs"]
+            cfg["kram"]["caches"]["qry"] = [50, 800, 3000, 4000, 1000, 3000, 4000]
+            cf.put(cfg)
+            kramer.changeConfig(cf)  # pure decrease applies immediately
+            assert kramer._fetchCacheType("qry", "logs").sl == 800
+            assert set(kramer._ctyps) == {"~", "qry"}
+
+
 _testSigner = Salter(raw=b'0123456789abcdef').signer(transferable=True)
 TEST_PRE = _testSigner.verfer.qb64
 
@@ -559,7 +613,7 @@ def test_parser_routes_v2_query_through_kram(mockHelpingNowUTC):
             assert calls == [("qry", "ksn")]
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, qry.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert len(kvy.cues) > 0
             cue = kvy.cues.popleft()
             assert cue["kin"] == "reply"
@@ -697,7 +751,7 @@ def test_assk(mockHelpingNowUTC):
             # Assert cache created
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, msg.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.d == 1000   # drift from config
             assert cache.ml == 5000  # short lag (assk)
 
@@ -727,7 +781,7 @@ def test_assk(mockHelpingNowUTC):
             # Assert cache created for non-transferable sender
             cache = receiverHby.db.kramMSGC.get(keys=(senderNTHab.pre, msg2.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
 
 
             # Step 4: Test timeliness against stale message
@@ -1139,7 +1193,7 @@ def test_asr(mockHelpingNowUTC):
             # Assert: kramit created cache before downstream error
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, msg.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.ml == 5000  # short lag (asr)
 
             kvy.cues.clear()
@@ -1497,8 +1551,8 @@ def test_transactioned(mockHelpingNowUTC):
             # Assert: kramTMSC entry created, xip's exId is its own SAID
             cache = receiverHby.db.kramTMSC.get(keys=(skHab.pre, xip.said, xip.said))
             assert cache is not None
-            assert cache.mdt == stamp
-            assert cache.xdt == stamp  # xip's xdt == its own dt
+            assert cache.mdt == epochMs(stamp)
+            assert cache.xdt == epochMs(stamp)  # xip's xdt == its own dt
 
 
             # Step 3: exn with exchange ID via processMsg
@@ -1524,8 +1578,8 @@ def test_transactioned(mockHelpingNowUTC):
             # Assert kramTMSC entry created for exn
             cache = receiverHby.db.kramTMSC.get(keys=(skHab.pre, xip.said, exn.said))
             assert cache is not None
-            assert cache.mdt == stamp
-            assert cache.xdt == stamp  # inherited from xip's xdt
+            assert cache.mdt == epochMs(stamp)
+            assert cache.xdt == epochMs(stamp)  # inherited from xip's xdt
 
 
             # Step 4: Missing xip cache
@@ -1561,7 +1615,7 @@ def test_transactioned(mockHelpingNowUTC):
             oldXdt = "2020-12-31T23:50:00.000000+00:00"  # 10 min before mocked now
             oldXipSaid = "E" + "C" * 43  # fabricated xip SAID for this test
             seedRecord = TxnMsgCacheRecord(
-                mdt=oldXdt, xdt=oldXdt, d=1000, ml=5000, pml=5000,
+                mdt=epochMs(oldXdt), xdt=epochMs(oldXdt), d=1000, ml=5000, pml=5000,
                 xl=300000, pxl=300000)
             receiverHby.db.kramTMSC.pin(keys=(skHab.pre, oldXipSaid, oldXipSaid),
                                     val=seedRecord)
@@ -1694,7 +1748,7 @@ def test_transactioned(mockHelpingNowUTC):
 
             cache = receiverHby.db.kramTMSC.get(keys=(skHab.pre, xip8.said, exn8.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
 
 
             # Step 8: exc happy path
@@ -1737,7 +1791,7 @@ def test_transactioned(mockHelpingNowUTC):
 
             cache = receiverHby.db.kramTMSC.get(keys=(skHab.pre, xip8.said, exn8.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
 
     """Done Test"""
 
@@ -3440,7 +3494,7 @@ def test_existing_caches_unchanged_on_config_update(fakeHelpingClock):
             # Assert cache created
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, msg.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.d == 1000   # drift from config
             assert cache.ml == 1000  # short lag (assk)
             assert cache.pml == 1000  # prune short lag (assk)
@@ -3524,7 +3578,7 @@ def test_existing_caches_unchanged_on_config_update(fakeHelpingClock):
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, msg.said))
 
             # Assert the new cache uses the new values
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.d == 1000
             assert cache.ml == 5000
             assert cache.pml == 5000
@@ -4767,7 +4821,7 @@ def test_pruning_messages_single_key(fakeHelpingClock):
             # Cache must exist
             earlyCache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, earlyMsg.said))
             assert earlyCache is not None
-            assert earlyCache.mdt == earlyStamp
+            assert earlyCache.mdt == epochMs(earlyStamp)
             assert earlyCache.d == 1000   # drift = 1s
             assert earlyCache.ml == 5000     # short lag = 5s
             assert earlyCache.pml == 5000    # short prune lag = 5s
@@ -4803,7 +4857,7 @@ def test_pruning_messages_single_key(fakeHelpingClock):
             # Assert later message is cached with its own timestamp
             laterCache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, laterMsg.said))
             assert laterCache is not None
-            assert laterCache.mdt == rdtLater
+            assert laterCache.mdt == epochMs(rdtLater)
 
             # Advance time
             clock.advance(seconds=4)
@@ -4815,11 +4869,11 @@ def test_pruning_messages_single_key(fakeHelpingClock):
             # Both entries must still exist because both messages are still within their respective pruning windows.
             earlyCache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, earlyMsg.said))
             assert earlyCache is not None
-            assert earlyCache.mdt == earlyStamp
+            assert earlyCache.mdt == epochMs(earlyStamp)
 
             laterCache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, laterMsg.said))
             assert laterCache is not None
-            assert laterCache.mdt == rdtLater
+            assert laterCache.mdt == epochMs(rdtLater)
 
             # Step 3: increase the time to trigger pruning for the first messsage but not the second message
             # Increase the time to passed to 6.1s which is just past the 5s drift + 1s prune lag = 6s total
@@ -4991,7 +5045,7 @@ def test_pruning_messages_multi_key(fakeHelpingClock):
             # Assert msgc cache created for partial sigs
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, msg.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.d == 1000   # drift = 1s
             assert cache.ml == 60000     # message long lag = 60s
             assert cache.pml == 60000    # message long prune lag = 60s
@@ -5123,7 +5177,7 @@ def test_pruning_messages_multi_key(fakeHelpingClock):
             # Assert msgc cache created for partial sigs
             cache = receiverHby.db.kramMSGC.get(keys=(senderHab.pre, msg.said))
             assert cache is not None
-            assert cache.mdt == stamp
+            assert cache.mdt == epochMs(stamp)
             assert cache.d == 1000   # drift = 1s
             assert cache.ml == 60000     # message long lag = 60s
             assert cache.pml == 60000    # message long prune lag = 60s
@@ -5240,14 +5294,14 @@ def test_strict_monotonicity_existing_cache(mockHelpingNowUTC):
                 receiverHby.db.kramMSGC.pin(
                     keys=qryKey,
                     val=MsgCacheRecord(
-                        mdt=cachedMdt, d=1000, ml=5000, pml=5000, xl=5000, pxl=5000))
+                        mdt=epochMs(cachedMdt), d=1000, ml=5000, pml=5000, xl=5000, pxl=5000))
                 receiverHby.db.kevers.pop(senderHab.pre, None)
                 assert kramer.kramit(qry, qryKwa) is None
 
             receiverHby.db.kramMSGC.pin(
                 keys=qryKey,
                 val=MsgCacheRecord(
-                    mdt=newerCacheStamp, d=1000, ml=5000, pml=5000, xl=5000, pxl=5000))
+                    mdt=epochMs(newerCacheStamp), d=1000, ml=5000, pml=5000, xl=5000, pxl=5000))
             receiverHby.db.kevers.pop(senderHab.pre, None)
             with pytest.raises(MissingSenderKeyStateError):
                 kramer.kramit(qry, qryKwa)
@@ -5267,7 +5321,7 @@ def test_strict_monotonicity_existing_cache(mockHelpingNowUTC):
                 receiverHby.db.kramTMSC.pin(
                     keys=xipKey,
                     val=TxnMsgCacheRecord(
-                        mdt=cachedMdt, xdt=stamp, d=1000, ml=5000, pml=5000,
+                        mdt=epochMs(cachedMdt), xdt=epochMs(stamp), d=1000, ml=5000, pml=5000,
                         xl=5000, pxl=5000))
                 receiverHby.db.kevers.pop(senderHab.pre, None)
                 assert kramer.kramit(xip, xipKwa) is None
@@ -5275,7 +5329,7 @@ def test_strict_monotonicity_existing_cache(mockHelpingNowUTC):
             receiverHby.db.kramTMSC.pin(
                 keys=xipKey,
                 val=TxnMsgCacheRecord(
-                    mdt=newerCacheStamp, xdt=stamp, d=1000, ml=5000, pml=5000,
+                    mdt=epochMs(newerCacheStamp), xdt=epochMs(stamp), d=1000, ml=5000, pml=5000,
                     xl=5000, pxl=5000))
             receiverHby.db.kevers.pop(senderHab.pre, None)
             with pytest.raises(MissingSenderKeyStateError):
@@ -5366,8 +5420,8 @@ def test_pruning_exchanges(fakeHelpingClock):
             # Assert: tmsc entry created, xip's exId is its own SAID
             cache = receiverHby.db.kramTMSC.get(keys=(senderHab.pre, xip.said, xip.said))
             assert cache is not None
-            assert cache.mdt == stamp
-            assert cache.xdt == stamp  # xip's xdt == its own dt
+            assert cache.mdt == epochMs(stamp)
+            assert cache.xdt == epochMs(stamp)  # xip's xdt == its own dt
 
             # Send first exn with exchange ID via processMsg
             firstStamp = helping.nowIso8601()
@@ -5394,8 +5448,8 @@ def test_pruning_exchanges(fakeHelpingClock):
             # Assert tmsc entry created for exn
             firstCache = receiverHby.db.kramTMSC.get(keys=(senderHab.pre, xip.said, exn.said))
             assert firstCache is not None
-            assert firstCache.mdt == firstStamp
-            assert firstCache.xdt == stamp  # inherited from xip's xdt
+            assert firstCache.mdt == epochMs(firstStamp)
+            assert firstCache.xdt == epochMs(stamp)  # inherited from xip's xdt
             assert firstCache.mdt == firstCache.xdt
 
             # Run pruner, shouldn't prune anything
@@ -5430,8 +5484,8 @@ def test_pruning_exchanges(fakeHelpingClock):
             # Assert tmsc entry created for exn2
             secondCache = receiverHby.db.kramTMSC.get(keys=(senderHab.pre, xip.said, exn2.said))
             assert secondCache is not None
-            assert secondCache.mdt == secondStamp
-            assert secondCache.xdt == stamp  # inherited from xip's xdt
+            assert secondCache.mdt == epochMs(secondStamp)
+            assert secondCache.xdt == epochMs(stamp)  # inherited from xip's xdt
             assert secondCache.mdt != secondCache.xdt   # message time and exchange time are different
 
             # Delete or archive any cache entries (all messages associated with the exchange) where [xdt, xdt+xl] is not true.
@@ -5450,6 +5504,103 @@ def test_pruning_exchanges(fakeHelpingClock):
             assert receiverHby.db.kramTMSC.get(keys=(senderHab.pre, xip.said, exn2.said)) is None
 
 
+def test_pruning_expiry_index():
+    """Kramer prunes caches by range scan of expiry index after one full sweep"""
+    from keri.db.migrations import kram_int_timestamps
+
+    assert epochMs("1970-01-01T00:00:01.001000+00:00") == 1001
+    assert epochMs("2021-01-01T00:00:00.123000+00:00") == 1609459200123
+    assert expiryKey(1001) == "00000000000003e9"
+    assert expiryKey(9) < expiryKey(10)
+
+    with openDB(name="test_pruning_expiry_index", temp=True) as db:
+        kramer = Kramer(db)
+        assert kramer._msgNotBefore is None and kramer._txnNotBefore is None
+
+        # records cached before any sweep, one bypassing the index
+        kramer._cacheMsg(("AID", "MID0"), MsgCacheRecord(mdt=10000, d=1000,
+                                                        ml=500, pml=5000))
+        db.kramMSGC.pin(("AID", "MID1"), MsgCacheRecord(mdt=12000, d=1000,
+                                                       ml=500, pml=5000))
+        kramer._cacheTxnMsg(("AID", "XID", "MID2"), TxnMsgCacheRecord(
+            mdt=10000, xdt=10000, d=1000, ml=500, pml=5000, xl=500, pxl=8000))
+        assert [keys for keys, _ in db.kramMSGX.getTopItemIter()] == [
+            (expiryKey(16000), "AID", "MID0")]
+
+        # first prune is a full sweep that backfills the index
+        assert not kramer._pruneMessages(rdt_ms=11000)
+        assert not kramer._pruneExchanges(rdt_ms=11000)
+        assert kramer._msgNotBefore == 11000
+        assert kramer._txnNotBefore == 10000
+        assert [keys for keys, _ in db.kramMSGX.getTopItemIter()] == [
+            (expiryKey(16000), "AID", "MID0"), (expiryKey(18000), "AID", "MID1")]
+
+        # later prunes only range scan expired index entries
+        assert not kramer._pruneMessages(rdt_ms=16000)  # expiry is inclusive
+        assert kramer._pruneMessages(rdt_ms=16001)
+        assert db.kramMSGC.get(("AID", "MID0")) is None
+        assert db.kramMSGC.get(("AID", "MID1")) is not None
+        assert kramer._pruneExchanges(rdt_ms=18001)
+        assert db.kramTMSC.get(("AID", "XID", "MID2")) is None
+        assert db.kramTMSX.cnt() == 0
+
+        # index only scan does not see unindexed record
+        db.kramMSGC.pin(("AID", "MID3"), MsgCacheRecord(mdt=12000, d=1000,
+                                                       ml=500, pml=1000))
+        assert kramer._pruneMessages(rdt_ms=18001)  # prunes MID1 only
+        assert db.kramMSGC.get(("AID", "MID3")) is not None
+
+        # stale index entry of recached record is dropped not pruned
+        kramer._cacheMsg(("AID", "MID4"), MsgCacheRecord(mdt=17000, d=1000,
+                                                        ml=500, pml=1000))
+        db.kramMSGC.pin(("AID", "MID4"), MsgCacheRecord(mdt=19000, d=1000,
+                                                       ml=500, pml=1000))
+        assert not kramer._pruneMessages(rdt_ms=19500)
+        assert db.kramMSGC.get(("AID", "MID4")) is not None
+        assert db.kramMSGX.cnt() == 0
+
+        # retrograde receiver clock falls back to full sweep
+        assert kramer._pruneMessages(rdt_ms=15000)  # mdt 19000 > rdt + d
+        assert db.kramMSGC.get(("AID", "MID4")) is None
+        assert db.kramMSGC.get(("AID", "MID3")) is None  # now expired
+        assert kramer._msgNotBefore == 0
+
+        # legacy ISO-8601 datetimes written as JSON load as int ms
+        stamp = "2021-01-01T00:00:00.000000+00:00"
+        ms = epochMs(stamp)
+        db.setVal(db=db.kramMSGC.sdb, key=db.kramMSGC._tokey(("AID", "MID5")),
+                  val=json.dumps(dict(mdt=stamp, d=1000, ml=500, pml=5000,
+                                      xl=0, pxl=0)).encode())
+        db.setVal(db=db.kramTMSC.sdb, key=db.kramTMSC._tokey(("AID", "XID", "MID6")),
+                  val=json.dumps(dict(mdt=stamp, xdt=stamp, d=1000, ml=500,
+                                      pml=5000, xl=500, pxl=8000)).encode())
+        assert db.kramMSGC.get(("AID", "MID5")).mdt == ms
+        assert db.kramTMSC.get(("AID", "XID", "MID6")) == TxnMsgCacheRecord(
+            mdt=ms, xdt=ms, d=1000, ml=500, pml=5000, xl=500, pxl=8000)
+        assert MsgCacheRecord(mdt=stamp).mdt == ms
+        assert Kramer._isNewerMdt(ms + 1, db.kramMSGC.get(("AID", "MID5")).mdt)
+
+        # first prune of a fresh Kramer is a full sweep over legacy records
+        kramer = Kramer(db)
+        assert not kramer._pruneMessages(rdt_ms=ms)
+        assert not kramer._pruneExchanges(rdt_ms=ms)
+        assert [keys for keys, _ in db.kramMSGX.getTopItemIter()] == [
+            (expiryKey(ms + 6000), "AID", "MID5")]
+        assert kramer._pruneMessages(rdt_ms=ms + 6001)
+        assert kramer._pruneExchanges(rdt_ms=ms + 8001)
+        assert db.kramMSGC.get(("AID", "MID5")) is None
+        assert db.kramTMSC.get(("AID", "XID", "MID6")) is None
+
+        # migration rewrites legacy records in int form
+        db.setVal(db=db.kramMSGC.sdb, key=db.kramMSGC._tokey(("AID", "MID7")),
+                  val=json.dumps(dict(mdt=stamp)).encode())
+        kram_int_timestamps.migrate(db)
+        kram_int_timestamps.migrate(db)  # idempotent
+        assert db.kramMSGC.get(("AID", "MID7")).mdt == ms
+        assert stamp.encode() not in bytes(db.getVal(db=db.kramMSGC.sdb,
+                                                     key=db.kramMSGC._tokey(("AID", "MID7"))))
+
+
 def test_pruning_exchanges_cleans_transactional_partial_multisig(fakeHelpingClock):
     """_pruneExchanges must remove PMKM/PMKS/PMSK at (AID, MID), matching txn kramit storage."""
 
@@ -15,7 +15,7 @@ from keri.kering import ValidationError, Vrsn_1_0, Vrsn_2_0, Kinds
 
 from keri.core import (Counter, Diger, GenDex, Codens, Seqner, Dater, Texter, Pather,
                        Blinder, Mediar, TypeMedia, Sealer, SealKind, Verser,
-                       Salter, Parser, Kever, Kevery, incept, rotate, interact,
+                       Salter, Parser, Pipeline, Kever, Kevery, incept, rotate, interact,
                        exchept, messagize)
 
 from keri.db import openDB
@@ -5130,6 +5130,112 @@ def test_parser_v2_substream():
         """Done Test"""
 
 
+def test_parser_piped():
+    """Test Parser piped mode with Pipeline staged processing of stream of
+    BodyWithAttachmentGroup framed messages
+    """
+    logger.setLevel("ERROR")
+
+    #  create transferable signers
+    raw = b"ABCDEFGH01234567"
+    signers = Salter(raw=raw).signers(count=8, path='psr', temp=True)
+
+    def enclose(serder, signer):
+        """Returns serder plus its sig enclosed in BodyWithAttachmentGroup"""
+        eims = bytearray()
+        texter = Texter(raw=serder.raw)
+        eims.extend(Counter.enclose(qb64=texter.qb64b,
+                                    code=Codens.NonNativeBodyGroup,
+                                    version=Vrsn_1_0))
+        aims = bytearray()
+        aims.extend(Counter(Codens.ControllerIdxSigs, version=Vrsn_1_0).qb64b)
+        aims.extend(signer.sign(serder.raw, index=0).qb64b)
+        eims.extend(Counter.enclose(qb64=aims, code=Codens.AttachmentGroup,
+                                    version=Vrsn_1_0))
+        return Counter.enclose(qb64=eims, code=Codens.BodyWithAttachmentGroup,
+                               version=Vrsn_1_0)
+
+    serders = []
+    units = []
+    serder = incept(keys=[signers[0].verfer.qb64],
+                    ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64], **V1_KWA)
+    pre = serder.pre
+    serders.append(serder)
+    units.append(enclose(serder, signers[0]))
+    for sn in range(1, 7):
+        if sn % 2:  # rotate
+            serder = rotate(pre=pre,
+                            keys=[signers[sn // 2 + 1].verfer.qb64],
+                            dig=serder.said,
+                            ndigs=[Diger(ser=signers[sn // 2 + 2].verfer.qb64b).qb64],
+                            sn=sn, **V1_KWA)
+        else:
+            serder = interact(pre=pre, dig=serder.said, sn=sn, **V1_KWA)
+        serders.append(serder)
+        units.append(enclose(serder, signers[(sn + 1) // 2]))
+
+    msgs = bytearray(b"".join(units))
+
+    # split only complete units off front of stream
+    pipeline = Pipeline(workers=4, batch=3)
+    ims = bytearray(msgs)
+    assert pipeline.split(ims, version=Vrsn_1_0) == units[:3]
+    assert ims == bytearray(b"".join(units[3:]))
+    ims = ims[:-4]  # last unit incomplete
+    assert pipeline.split(ims, version=Vrsn_1_0, limit=10) == units[3:6]
+    assert ims == units[6][:-4]
+    ims = bytearray(serder.raw)  # message not enclosed in group
+    assert pipeline.split(ims, version=Vrsn_1_0) == []
+    assert ims == bytearray(serder.raw)
+
+    # parse only results match unpiped results in stream order
+    parser = Parser(version=Vrsn_1_0, piped=True, pipeline=pipeline)
+    assert parser.piped
+    assert parser.pipeline is pipeline
+    ims = bytearray(msgs)
+    results = parser.parse(ims=ims, processive=False)
+    assert ims == bytearray(b'')
+    assert [result.serder.said for result in results] == [serder.said for serder in serders]
+    assert [result.sigers[0].qb64 for result in results] == \
+           [result.sigers[0].qb64 for result in
+            Parser(version=Vrsn_1_0).parse(ims=bytearray(msgs), processive=False)]
+    assert parser.version == Vrsn_1_0
+
+    # corrupted unit is dropped without losing following units
+    bad = bytearray(units[2])
+    bad[-10:-9] = b'A' if bad[-10:-9] != b'A' else b'B'  # corrupt signature
+    junk = bytearray(units[2])
+    junk[60:61] = b'-'  # corrupt body so decode fails
+    ims = bytearray(b"".join(units[:2]) + junk + b"".join(units[2:]))
+    parser = Parser(version=Vrsn_1_0, piped=True)
+    results = parser.parse(ims=ims, processive=False)
+    assert ims == bytearray(b'')
+    assert [result.serder.said for result in results] == [serder.said for serder in serders]
+    assert parser.pipeline.workers == Pipeline.Workers == 1
+    assert parser.pipeline._pool is None  # default decodes inline
+
+    with openDB(name="validator") as valDB:
+        kevery = Kevery(db=valDB)
+        parser = Parser(kvy=kevery, version=Vrsn_1_0, piped=True,
+                        pipeline=Pipeline(workers=4, batch=4))
+        ims = bytearray(b"".join(units[:2]) + bad + b"".join(units[2:]))
+        parser.parse(ims=ims)
+        assert ims == bytearray(b'')
+        assert kevery.kevers[pre].sn == 6  # bad signature dropped at apply
+        assert kevery.kevers[pre].serder.said == serders[-1].said
+        parser.pipeline.close()
+
+    with openDB(name="validator") as valDB:  # inline single worker
+        kevery = Kevery(db=valDB)
+        parser = Parser(kvy=kevery, version=Vrsn_1_0, piped=True,
+                        pipeline=Pipeline(workers=1))
+        parser.parse(ims=bytearray(msgs))
+        assert kevery.kevers[pre].sn == 6
+
+    pipeline.close()
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_parser_v1_basic()
     test_parser_v1_version()
@@ -5144,3 +5250,4 @@ if __name__ == "__main__":
     test_group_parsator()
     test_parse_native_cesr_fixed_field()
     test_parser_v2_substream()
+    test_parser_piped()
@@ -0,0 +1,163 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_routing module
+
+Test reply message route registration and lookup
+"""
+import time
+
+import pytest
+
+from keri.core import Router, Route, RouteTrie, compile_uri_template
+
+
+Templates = [("/end/role/{action}", "EndRole"),
+             ("/loc/scheme", "LocScheme"),
+             ("/ksn/{aid}", "KeyStateNotice"),
+             ("/watcher/{aid}/{action}", "AddWatched"),
+             ("/tsn/registry/{aid}", "RegistryTxnState"),
+             ("/tsn/credential/{aid}", "CredentialTxnState"),
+             ("/introduce", None)]
+
+Routes = ["/end/role/add",
+          "/end/role/cut",
+          "/loc/scheme",
+          "/ksn/EAbcdefghijklmnopqrstuvwxyz0123456789ABCDEF",
+          "/watcher/EAbcdefghijklmnopqrstuvwxyz0123456789ABCDEF/add",
+          "/tsn/registry/EAbcdefghijklmnopqrstuvwxyz0123456789ABCDEF",
+          "/tsn/credential/EAbcdefghijklmnopqrstuvwxyz0123456789ABCDEF",
+          "/introduce"]
+
+
+def linearFind(routes, route):
+    """Reference linear regex search in registration order"""
+    for r in routes:
+        if res := r.regex.search(route):
+            return r, res.groupdict()
+    return None, None
+
+
+def test_route_trie():
+    """
+    Test RouteTrie matches the same route as linear regex search
+    """
+    rtr = Router()
+    resource = object()
+    templates = ["/", "/ksn/{aid}", "/ksn/special", "/KSN/{aid}/{sn}",
+                 "/end/role/{action}/", "/files/{said}.json", "/x/{a}-{b}",
+                 "/loc/scheme"]
+    for template in templates:
+        rtr.addRoute(template, resource, suffix=template)
+
+    routes = ["/", "", "ksn/EAbc", "/ksn/EAbc", "/ksn/special", "/Ksn/Special",
+              "/ksn/EAbc/0", "/ksn/", "/ksn//0", "/end/role/add",
+              "/end/role/add/", "/end/role", "/files/EAbc.json",
+              "/files/.json", "/files/EAbc.jsonx", "/x/1-2-3", "/x/-2",
+              "/loc/scheme", "/loc/scheme/", "/nope"]
+    for route in routes:
+        found, kwargs = rtr._find(route)
+        expect, ekwargs = linearFind(rtr.routes, route)
+        assert found is expect, route
+        assert kwargs == ekwargs, route
+
+    found, kwargs = rtr._find("/ksn/special")
+    assert found.template == "/ksn/{aid}"  # first registered wins
+    assert kwargs == dict(aid="special")
+    found, kwargs = rtr._find("/x/1-2-3")
+    assert kwargs == dict(a="1-2", b="3")
+
+    # cached lookups return same result
+    assert rtr._find("/x/1-2-3") == (found, kwargs)
+    assert "/x/1-2-3" in rtr._cache
+    rtr.addRoute("/x/{c}", resource)
+    assert not rtr._cache  # registration clears cache
+
+    # preregistered routes without template are matched by regex in order
+    fields, regex = compile_uri_template("/ksn/{aid}")
+    pre = Route(regex=regex, fields=fields, resource=resource)
+    rtr = Router(routes=[pre])
+    rtr.addRoute("/ksn/{pre}", resource)
+    assert rtr._find("/ksn/EAbc") == (pre, dict(aid="EAbc"))
+
+    with pytest.raises(ValueError):
+        rtr.addRoute("ksn", resource)
+
+    trie = RouteTrie()
+    assert trie.find("/ksn/EAbc") == (None, None, None)
+
+
+def makeRouter(extra):
+    """Returns Router with extra unrelated routes registered ahead of builtins"""
+    resource = object()
+    rtr = Router()
+    for i in range(extra):
+        rtr.addRoute(f"/ext{i}/{{aid}}/item", resource)
+    for template, suffix in Templates:
+        rtr.addRoute(template, resource, suffix=suffix)
+    return rtr
+
+
+def benchRouter(extras=(0, 100, 1000), n=200):
+    """
+    Micro-benchmark of route lookup for the built-in reply routes with the
+    segment trie, the per route result cache and a linear regex search as
+    registered route count grows. Run this module as a script to print it.
+
+    Returns:
+        result (dict): extra route count keyed (trie, cached, linear) times
+            in microseconds per lookup
+    """
+    result = {}
+    for extra in extras:
+        rtr = makeRouter(extra)
+
+        start = time.perf_counter()
+        for _ in range(n):
+            for route in Routes:
+                rtr._trie.find(route)
+        trie = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n):
+            for route in Routes:
+                rtr._find(route)
+        cached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n):
+            for route in Routes:
+                linearFind(rtr.routes, route)
+        linear = time.perf_counter() - start
+
+        count = n * len(Routes)
+        result[extra] = (trie / count * 1e6, cached / count * 1e6,
+                         linear / count * 1e6)
+
+    return result
+
+
+def test_router_many_routes():
+    """
+    Test trie and cached route lookup match linear search as registered route
+    count grows
+    """
+    for extra in (0, 100, 1000):
+        rtr = makeRouter(extra)
+        assert len(rtr.routes) == extra + len(Templates)
+        for route in Routes:
+            expect = linearFind(rtr.routes, route)
+            assert expect[0] is not None
+            found = rtr._find(route)
+            assert found[0] is expect[0]
+            assert found[1] == expect[1]
+            assert rtr._find(route) == found  # cached
+        if extra:
+            assert rtr._find("/ext5/EAbc/item")[1] == dict(aid="EAbc")
+        assert rtr._find("/unknown")[0] is None
+
+
+if __name__ == "__main__":
+    test_route_trie()
+    for extra, (trie, cached, linear) in benchRouter().items():
+        print(f"{extra + len(Templates):5d} routes: trie {trie:7.2f}us "
+              f"cached {cached:7.2f}us linear {linear:7.2f}us per lookup")
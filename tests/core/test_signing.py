@@ -9,11 +9,13 @@ import pysodium
 import pytest
 
 from keri.kering import (ShortageError, EmptyMaterialError, RawMaterialError,
-                         InvalidCodeError, InvalidSizeError)
+                         InvalidCodeError, InvalidSizeError, InvalidValueError,
+                         Colds, Kinds, Vrsn_1_0, Vrsn_2_0)
 from keri.core import (Texter, Counter, Indexer, Matter, Cigar,
                        Verfer, Prefixer, Signer, Salter, Cipher,
                        Encrypter, Decrypter, Streamer,
-                       Codens, CiXDex, MtrDex, IdrDex, Tiers, CtrDex_2_0)
+                       Codens, CiXDex, MtrDex, IdrDex, Tiers, CtrDex_2_0,
+                       Diger, incept, messagize)
 
 
 def test_signer():
@@ -1357,7 +1359,61 @@ def test_roundtrip():
 
 def test_streamer():
     """Test streamer instance"""
-    pass
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+
+    # v2 stream of native, nested non-native, and bare non-native messages
+    stream = bytearray()
+    msgs = []
+    for kind, nested in ((Kinds.cesr, False), (Kinds.json, True),
+                         (Kinds.json, False)):
+        serder = incept(keys=[signers[0].verfer.qb64],
+                        ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64],
+                        code=MtrDex.Blake3_256, kind=kind, pvrsn=Vrsn_2_0,
+                        version=Vrsn_1_0)
+        sigers = [signers[0].sign(serder.raw, index=0)]
+        msgs.append(messagize(serder, sigers=sigers, gvrsn=Vrsn_2_0,
+                              nested=nested, genusify=True))
+        stream.extend(msgs[-1])
+    raw = serder.raw  # bare non-native body of last message
+
+    streamer = Streamer(stream, verify=True)
+    assert streamer.stream == stream
+    assert streamer._verify()
+    assert streamer.text == bytes(stream)  # already text
+    binary = streamer.binary
+    assert len(binary) < len(stream)
+    assert raw in binary  # non-native body passed through unchanged
+    assert Streamer(binary, verify=True).text == bytes(stream)
+    assert Streamer(binary).binary == binary
+
+    frames = [cold for cold, frame in Streamer.frames(stream)]
+    assert frames == [Colds.txt, Colds.txt, Colds.txt,  # gvc, body, attachments
+                      Colds.txt, Colds.txt,  # gvc, body with attachments
+                      Colds.txt, Colds.msg, Colds.txt]  # gvc, body, attachments
+
+    # incremental transcoding from arbitrary chunks in either direction
+    chunks = (binary[i:i+7] for i in range(0, len(binary), 7))
+    assert b"".join(Streamer.transcode(chunks, cold=Colds.txt)) == bytes(stream)
+    chunks = (stream[i:i+5] for i in range(0, len(stream), 5))
+    assert b"".join(Streamer.transcode(chunks, cold=Colds.bny)) == binary
+    with pytest.raises(ShortageError):  # ends in partial frame
+        list(Streamer.transcode([stream[:-4]]))
+    with pytest.raises(InvalidValueError):
+        list(Streamer.transcode([stream], cold=Colds.msg))
+
+    # text and bexter wrapping
+    assert Streamer(binary).texter.raw == binary
+    pure = msgs[0] + msgs[1]  # no non-native bodies so all Base64
+    assert Streamer(Streamer(pure).binary).bexter.bext == pure.decode()
+
+    # not sniffable
+    assert not Streamer(stream[:-4])._verify()  # truncated
+    assert not Streamer(b'ABCD')._verify()  # primitive at top level
+    bad = bytearray(stream)
+    bad[:8] = Counter.makeGVC(version=Vrsn_1_0)  # v1 not sniffable
+    assert not Streamer(bad)._verify()
+    with pytest.raises(InvalidValueError):
+        Streamer(bad, verify=True)
 
     """End Test"""
 
@@ -1862,6 +1862,151 @@ def test_baser_clone_all_pre_iter():
         assert hab2.pre in pres
 
 
+def test_fetch_sealing_event():
+    """
+    Test anchored seal index .anxs and fetch sealing event methods
+    """
+    from keri.db.migrations import index_anchor_seals
+
+    with openHby(name="test", base="test", temp=True) as hby:
+        hab = hby.makeHab(name="alice", isith="1", icount=1)
+        other = hby.makeHab(name="bob", isith="1", icount=1)
+        seal = dict(i=other.pre, s="0", d=other.kever.serder.said)
+        dseal = dict(d=other.kever.serder.said)
+        hab.interact(data=[seal])  # sn 1
+        hab.interact(data=[dict(d=hab.kever.serder.said)])  # sn 2
+        ixn = hab.kever.serder  # sn 2 anchors digest of sn 1
+        first = hby.db.getEvtLastPreIter(pre=hab.pre, sn=1)
+        anchor = next(first)
+        assert anchor.sn == 1
+
+        (number, diger), = hby.db.anxs.get(keys=(hab.pre, seal["d"]))
+        assert number.num == 1 and diger.qb64 == anchor.said
+
+        assert hby.db.fetchAllSealingEventByEventSeal(hab.pre, seal=seal).said == anchor.said
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal).said == anchor.said
+        assert hby.db.fetchLastSealingEventBySeal(hab.pre, seal=seal).said == anchor.said
+        assert hby.db.fetchLastSealingEventBySeal(hab.pre, seal=dseal) is None  # type differs
+        assert hby.db.fetchLastSealingEventBySeal(
+            hab.pre, seal=dict(d=anchor.said)).said == ixn.said
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal, sn=2) is None
+        assert hby.db.fetchLastSealingEventByEventSeal(other.pre, seal=seal) is None
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=dseal) is None  # wrong type
+        bad = dict(seal, s="1")
+        assert hby.db.fetchAllSealingEventByEventSeal(hab.pre, seal=bad) is None
+
+        # unindexed KEL is walked once to backfill its index
+        assert hab.pre in hby.db.anxed  # misses above walked KEL once
+        hby.db.anxs.trim()
+        hby.db.anxed.clear()  # as if reopened on a database without index
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal).said == anchor.said
+        assert hab.pre in hby.db.anxed
+        assert len(hby.db.anxs.get(keys=(hab.pre, seal["d"]))) == 1
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=bad) is None  # no rewalk
+
+        # backfill migration rebuilds index
+        hby.db.anxs.trim()
+        hby.db.anxed.clear()
+        index_anchor_seals.migrate(hby.db)
+        assert hby.db.anxs.get(keys=(hab.pre, seal["d"]))
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal).said == anchor.said
+        index_anchor_seals.migrate(hby.db)  # idempotent
+        assert len(hby.db.anxs.get(keys=(hab.pre, seal["d"]))) == 1
+
+
+def test_export_import_kels():
+    """
+    Test Baser bulk KEL export and import with signed snapshot manifest
+    """
+    import io
+    from keri.kering import ValidationError
+    from keri.recording import SnapshotRecord
+
+    with openHby(name="test", base="test", temp=True) as hby:
+        hab = hby.makeHab(name="alice", isith="1", icount=1)
+        other = hby.makeHab(name="bob", isith="1", icount=1)
+        for i in range(4):
+            hab.interact()
+        hab.rotate()
+        signer = Signer(transferable=False)
+
+        out = io.BytesIO()
+        snapshot, cigar = hby.db.exportKELs(out, signer=signer)
+        stream = out.getvalue()
+        assert stream == b''.join(hby.db.cloneAllPreIter())
+        assert snapshot.n == 8  # includes signator hab inception
+        assert snapshot.pres == []
+        assert snapshot.d == Diger(ser=stream).qb64
+        assert signer.verfer.verify(sig=cigar.raw, ser=snapshot._asjson())
+
+        out = io.BytesIO()
+        snap, sig = hby.db.exportKELs(out, pres=[other.pre])
+        assert sig is None
+        assert snap.n == 1 and snap.pres == [other.pre]
+        assert out.getvalue() == b''.join(hby.db.clonePreIter(pre=other.pre))
+
+        # untrusted import fully validates in small chunks
+        with openDB(name="copy", temp=True) as db:
+            db.importKELs(io.BytesIO(stream), size=64)
+            assert db.kevers[hab.pre].sn == hab.kever.sn == 5
+            assert db.kevers[other.pre].sn == 0
+            assert (list(db.fels.getAllItemIter(keys=hab.pre)) ==
+                    list(hby.db.fels.getAllItemIter(keys=hab.pre)))
+            assert (db.dtss.get(keys=(hab.pre, hab.kever.serder.said)).dts ==
+                    hby.db.dtss.get(keys=(hab.pre, hab.kever.serder.said)).dts)
+
+        # trusted import checks manifest signature and stream digest
+        with openDB(name="copy", temp=True) as db:
+            with pytest.raises(ValidationError):  # wrong signer
+                db.importKELs(io.BytesIO(stream), snapshot=snapshot,
+                              cigar=cigar, verfer=Signer().verfer)
+            with pytest.raises(ValidationError):  # stream not match manifest
+                db.importKELs(io.BytesIO(stream[:-1] + b'A'), snapshot=snapshot,
+                              cigar=cigar, verfer=signer.verfer)
+            assert not db.kevers
+            with pytest.raises(ValidationError):  # count not match manifest
+                miscount = SnapshotRecord(d=snapshot.d, n=snapshot.n + 1)
+                db.importKELs(io.BytesIO(stream), snapshot=miscount,
+                              cigar=signer.sign(ser=miscount._asjson()),
+                              verfer=signer.verfer)
+        with openDB(name="copy", temp=True) as db:
+            # ingests from verified copy so ims read once and need not seek
+            ims = io.BufferedReader(io.BytesIO(stream))
+            ims.seekable = lambda: False
+            db.importKELs(ims, snapshot=snapshot, cigar=cigar,
+                          verfer=signer.verfer, size=64)
+            assert db.kevers[hab.pre].sn == hab.kever.sn == 5
+            assert db.kevers[other.pre].sn == 0
+            # reimport counts events already in database
+            db.importKELs(io.BytesIO(stream), snapshot=snapshot, cigar=cigar,
+                          verfer=signer.verfer, size=64)
+            assert db.kevers[hab.pre].sn == hab.kever.sn == 5
+
+        # partial trailing message raises instead of being dropped
+        with openDB(name="copy", temp=True) as db:
+            with pytest.raises(ValidationError):
+                db.importKELs(io.BytesIO(stream[:-8]), size=64)
+            assert db.kevers[hab.pre].sn >= 4  # prior whole messages kept
+
+        # corrupted signature only accepted when trusted by signed manifest
+        siger = hby.db.sigs.get(keys=(other.pre, other.kever.serder.said))[0]
+        bad = Siger(raw=bytes(64), code=siger.code, index=siger.index)
+        tampered = stream.replace(siger.qb64b, bad.qb64b)
+        assert tampered != stream
+        snapshot = SnapshotRecord(d=Diger(ser=tampered).qb64, n=snapshot.n)
+        cigar = signer.sign(ser=snapshot._asjson())
+        with openDB(name="copy", temp=True) as db:
+            db.importKELs(io.BytesIO(tampered))
+            assert other.pre not in db.kevers
+            assert hab.pre in db.kevers
+        with openDB(name="copy", temp=True) as db:
+            db.importKELs(io.BytesIO(tampered), snapshot=snapshot, cigar=cigar,
+                          verfer=signer.verfer)
+            assert other.pre in db.kevers
+
+    """End Test"""
+
+
 def test_clean_baser():
     """
     Test Baser db clean clone method
@@ -1905,7 +2050,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.s == '6'
         assert state.f == '6'
-        assert natHab.db.env.stat()['entries'] <= 101 #68
+        assert natHab.db.env.stat()['entries'] <= 104 #68
 
         # test reopenDB with reuse  (because temp)
         with reopenDB(db=natHab.db, reuse=True):
@@ -1915,7 +2060,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = natHab.db.evts.get(keys=(natHab.pre, ldig))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] <= 101 #68
+            assert natHab.db.env.stat()['entries'] <= 104 #68
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.pre)
@@ -2382,6 +2527,63 @@ def test_statedict():
     """End Test"""
 
 
+
+def test_statedict_lru():
+    """
+    Test bounded statedict kever cache with pinning, counters and warm up
+    """
+    import io
+    from keri.db import KeverWarmer
+
+    with (openHby(name="remote", base="test", temp=True) as remote,
+          openHby(name="local", base="test", temp=True) as hby):
+        pres = []
+        for i in range(4):
+            rhab = remote.makeHab(name=f"r{i}", isith="1", icount=1)
+            pres.append(rhab.pre)
+        hab = hby.makeHab(name="alice", isith="1", icount=1)
+        out = io.BytesIO()
+        remote.db.exportKELs(out, pres=pres)
+
+        kevers = hby.db.kevers
+        assert isinstance(kevers, statedict)
+        kevers.maxSize = 2
+        assert kevers.pinned(hab.pre)
+        assert not kevers.pinned(pres[0])
+        hby.db.importKELs(io.BytesIO(out.getvalue()))
+        # pinned local hab kept and most recently used remote kept
+        assert list(dict(kevers)) == [pres[3], hab.pre]
+        assert kevers.evictions == 4  # three remotes and unpinned signator
+
+        kevers.maxSize = 4
+        misses, evictions = kevers.misses, kevers.evictions
+        assert pres[0] in kevers  # reloaded from key state
+        assert kevers.misses == misses + 1
+        assert kevers[pres[0]].sn == 0
+        assert kevers[pres[1]].prefixer.qb64 == pres[1]
+        assert list(dict(kevers))[-2:] == [pres[0], pres[1]]
+        hits = kevers.hits
+        kevers[pres[0]]  # most recently used moves to end
+        assert kevers.hits == hits + 1
+        assert list(dict(kevers))[-2:] == [pres[1], pres[0]]
+        assert pres[2] in kevers  # evicts least recently used pres[3]
+        assert kevers.evictions == evictions + 1
+        assert list(dict(kevers)) == [hab.pre, pres[1], pres[0], pres[2]]
+
+        # warm up preloads most recently updated key states
+        kevers.clear()
+        hottest = sorted((ksr.dt, pre) for (pre, ), ksr
+                         in hby.db.states.getTopItemIter())[-3:]
+        warmer = KeverWarmer(db=hby.db, size=3, chunk=1)
+        warmer.enter()
+        while not warmer.recur(tyme=0.0):
+            pass
+        assert warmer.loaded == 3
+        assert list(dict(kevers)) == [pre for dt, pre in hottest]
+
+    """End Test"""
+
+
 def test_baserdoer():
     """
     Test BaserDoer
@@ -2807,6 +3009,7 @@ if __name__ == "__main__":
     test_fetchkeldel()
     test_usebaser()
     test_statedict()
+    test_statedict_lru()
     test_baserdoer()
     test_db_keyspace_end_to_end_migration()
     test_trim_all_escrows_during_migration()
@@ -2209,8 +2209,110 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_batch():
+    """
+    Test LMDBer.batch shared write transaction
+    """
+    from keri.db import subing
+
+    with openLMDB() as dber:
+        assert not dber.batching
+        db = dber.env.open_db(key=b'beep.', dupsort=False)
+        ioset = dber.env.open_db(key=b'boop.', dupsort=False)
+        suber = subing.Suber(db=dber, subkey='bops.')
+
+        with dber.batch() as txn:
+            assert dber.batching
+            assert dber.putVal(db, b'a', b'A')
+            assert dber.addIoSetVal(ioset, b'b', b'B')
+            assert suber.put(keys="c", val="C")
+            # reads in batch see uncommitted writes
+            assert bytes(dber.getVal(db, b'a')) == b'A'
+            assert suber.get(keys="c") == "C"
+            with dber.batch() as inner:  # nested reuses outer transaction
+                assert inner is txn
+                assert dber.setVal(db, b'd', b'D')
+            assert dber.batching
+            # not yet visible outside batch transaction
+            with dber.env.begin(db=db) as other:
+                assert other.get(b'a') is None
+
+        assert not dber.batching
+        assert bytes(dber.getVal(db, b'a')) == b'A'
+        assert bytes(dber.getVal(db, b'd')) == b'D'
+        assert dber.cntIoSet(ioset, b'b') == 1
+        assert suber.get(keys="c") == "C"
+
+        # exception aborts all writes in batch
+        with pytest.raises(ValueError):
+            with dber.batch():
+                assert dber.putVal(db, b'e', b'E')
+                assert suber.pin(keys="c", val="X")
+                assert dber.remVal(db, b'a')
+                raise ValueError("abort")
+
+        assert not dber.batching
+        assert dber.getVal(db, b'e') is None
+        assert bytes(dber.getVal(db, b'a')) == b'A'
+        assert suber.get(keys="c") == "C"
+
+    """ End Test """
+
+
+def test_lmdber_reading():
+    """
+    Test LMDBer.reading shared read snapshot with cursor pool
+    """
+    from keri.db import subing, CursorPoolSize
+
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.', dupsort=False)
+        suber = subing.Suber(db=dber, subkey='bops.')
+        for key in (b'a', b'b', b'c'):
+            assert dber.putVal(db, key, key.upper())
+        assert suber.put(keys="c", val="C")
+
+        with dber.reading() as txn:
+            assert dber._reading is txn
+            assert bytes(dber.getVal(db, b'a')) == b'A'
+            assert suber.get(keys="c") == "C"
+            assert not dber._cursors[db]  # get needs no cursor
+            assert dber.cntAll(db) == 3
+            assert len(dber._cursors[db]) == 1  # cursor returned to pool
+            cursor = dber._cursors[db][0]
+            assert dber.cntAll(db) == 3  # pooled cursor iterates from first
+            assert dber._cursors[db] == [cursor]  # reused not recreated
+            # interleaved iterators each get own cursor
+            outer = dber.getTopItemIter(db)
+            key, val = next(outer)
+            assert bytes(key) == b'a'
+            items = [(bytes(k), bytes(v)) for k, v in dber.getTopItemIter(db)]
+            assert items == [(b'a', b'A'), (b'b', b'B'), (b'c', b'C')]
+            assert [bytes(k) for k, v in outer] == [b'b', b'c']
+            assert len(dber._cursors[db]) <= CursorPoolSize
+
+            # writes commit in own transaction and are not in snapshot
+            assert dber.putVal(db, b'd', b'D')
+            assert dber.getVal(db, b'd') is None
+            with dber.reading() as nested:  # nested reuses snapshot
+                assert nested is txn
+
+        assert dber._reading is None and not dber._cursors
+        assert bytes(dber.getVal(db, b'd')) == b'D'
+
+        with dber.batch() as txn:
+            with dber.reading() as snap:  # reading in batch sees batch writes
+                assert snap is txn
+                assert dber.putVal(db, b'e', b'E')
+                assert bytes(dber.getVal(db, b'e')) == b'E'
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_suffix()
     test_lmdber()
     test_opendatabaser()
+    test_lmdber_batch()
+    test_lmdber_reading()
@@ -12,7 +12,8 @@ import pytest
 
 from keri import Kinds
 from keri.db import (IoSetKomer, DupKomer, Komer,
-                     LMDBer, openLMDB)
+                     LMDBer, openLMDB, basing, koming)
+from keri.recording import KeyStateRecord, StateEERecord
 from keri.help import helping
 
 
@@ -832,6 +833,69 @@ def test_ioset_komer():
     assert not db.opened
 
 
+def test_packed_serialization():
+    """
+    Test compact Packed record kind with nested records, legacy json fallback,
+    appended schema fields and the compact_records migration
+    """
+    from keri.db.migrations import compact_records
+
+    ksr = KeyStateRecord(vn=[2, 0],
+                         i="EAbcd",
+                         s="3",
+                         d="EWxyz",
+                         k=["DKey0", "DKey1"],
+                         ee=StateEERecord(s="2", d="EEst", ba=["BWit0"]))
+
+    with openLMDB() as db:
+        k = Komer(db=db, klas=KeyStateRecord, subkey='stts.', kind=koming.Packed)
+        j = Komer(db=db, klas=KeyStateRecord, subkey='stts.')  # same table as json
+
+        assert koming.pack(ksr) == [[2, 0], 'EAbcd', '3', '', 'EWxyz', '0', '',
+                                    '', '0', ['DKey0', 'DKey1'], '0', [], '0',
+                                    [], [], ['2', 'EEst', [], ['BWit0']], '']
+        raw = k._ser(ksr)
+        assert len(raw) < len(j._ser(ksr))
+        assert k._des(raw) == ksr
+        assert isinstance(k._des(raw).ee, StateEERecord)
+
+        assert j.put(keys="EAbcd", val=ksr)  # legacy json record
+        assert bytes(db.getVal(k.sdb, k._tokey("EAbcd")))[:1] == b'{'
+        assert k.get(keys="EAbcd") == ksr  # falls back to json
+
+        assert k.pin(keys="EAbcd", val=ksr)
+        assert bytes(db.getVal(k.sdb, k._tokey("EAbcd"))) == raw
+        assert k.get(keys="EAbcd") == ksr
+
+        with pytest.raises(ValueError):
+            k.put(keys="EAbcd", val=StateEERecord())
+
+        @dataclass
+        class Record:
+            first: str
+            last: str = "Black"  # appended field takes default when missing
+
+        r = Komer(db=db, klas=Record, subkey='recs.', kind=koming.Packed)
+        assert r._des(b'\x91\xa3Jim') == Record(first="Jim", last="Black")
+        assert r._des(r._ser(Record(first="Jim", last="White"))).last == "White"
+
+    with basing.openDB(name="packed") as db:
+        ksr.i = "EPre0"
+        legacy = Komer(db=db, klas=KeyStateRecord, subkey='stts.')
+        legacy.pin(keys=ksr.i, val=ksr)
+        ksr.i = "EPre1"
+        db.states.pin(keys=ksr.i, val=ksr)  # already packed
+
+        compact_records.migrate(db)
+        compact_records.migrate(db)  # idempotent
+        for pre in ("EPre0", "EPre1"):
+            raw = bytes(db.getVal(db.states.sdb, db.states._tokey(pre)))
+            assert raw[:1] != b'{'
+            assert db.states.get(keys=pre).i == pre
+
+    assert not os.path.exists(db.path)
+
+
 if __name__ == "__main__":
     test_kom_happy_path()
     test_kom_get_item_iter()
@@ -841,5 +905,6 @@ if __name__ == "__main__":
     test_serialization()
     test_custom_serialization()
     test_deserialization()
+    test_packed_serialization()
     test_dup_komer()
     test_ioset_komer()
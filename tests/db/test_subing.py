@@ -3451,6 +3451,44 @@ def test_serder_suber():
         assert items == [(('b', '1'), srdr0.said),
                          (('b', '2'), srdr1.said)]
 
+        # test LRU cache of hydrated serders
+        serber = SerderSuber(db=db, subkey='hogs.', cacheSize=2)
+        assert serber.cacheSize == 2
+        keys = (pre, srdr0.said)
+        assert serber.put(keys=keys, val=srdr0)
+        actual = serber.get(keys=keys)
+        assert actual.said == srdr0.said
+        assert serber.cacheMisses == 1 and serber.cacheHits == 0
+        assert serber.get(keys=keys) is actual  # served from cache
+        assert serber.cacheHits == 1
+
+        assert serber.pin(keys=keys, val=srdr1)  # pin invalidates
+        actual = serber.get(keys=keys)
+        assert actual.said == srdr1.said
+        assert serber.cacheMisses == 2
+
+        assert serber.rem(keys=keys)  # rem invalidates
+        assert serber.get(keys=keys) is None
+
+        assert serber.put(keys=("c", "1"), val=srdr0)
+        assert serber.put(keys=("c", "2"), val=srdr1)
+        assert serber.put(keys=("d", "1"), val=srdr0)
+        first = serber.get(keys=("c", "1"))
+        serber.get(keys=("c", "2"))
+        serber.get(keys=("d", "1"))  # evicts ("c", "1")
+        assert list(serber._serders) == [b'c.2', b'd.1']
+        assert serber.get(keys=("c", "1")) is not first
+
+        assert serber.trim(keys=("c", ""))  # trim invalidates branch
+        assert list(serber._serders) == [b'd.1']
+        assert serber.get(keys=("c", "2")) is None
+        serber.clearCache()
+        assert not serber._serders
+
+        serber = SerderSuber(db=db, subkey='hogs.')  # cache disabled
+        assert serber.get(keys=("d", "1")) is not serber.get(keys=("d", "1"))
+        assert not serber._serders
+
     assert not os.path.exists(db.path)
     assert not db.opened
 
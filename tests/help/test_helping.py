@@ -8,10 +8,12 @@ import pytest
 import datetime
 import fractions
 import time
+import weakref
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, astuple
 
 from keri.help import (isign, sceil, extractValues, dictify, datify, klasify,
+                        icetuple,
                         intToB64, intToB64b, b64ToInt, B64_CHARS, fromIso8601,
                         codeB64ToB2, codeB2ToB64, Reb64, nabSextets,
                         nowIso8601, toIso8601, Reatt, Repath)
@@ -131,6 +133,39 @@ def test_dictify():
     assert dictify(c) == {'area': 50.24, 'perimeter': 25.12}
 
 
+def test_icetuple():
+    """
+    Test cached astuple of frozen dataclass
+    """
+
+    @dataclass(frozen=True)
+    class TestCodex:
+        Alpha: str = 'A'
+        Beta: str = 'B'
+
+        def __iter__(self):
+            return iter(icetuple(self))
+
+    TestDex = TestCodex()
+    values = icetuple(TestDex)
+    assert values == astuple(TestDex) == ('A', 'B')
+    assert icetuple(TestDex) is values  # cached
+    assert TestDex._icetuple is values  # on instance not module
+    assert TestDex == TestCodex()  # cache is not a field
+    assert 'A' in TestDex
+    assert 'C' not in TestDex
+    assert list(TestDex) == ['A', 'B']
+
+    OtherDex = TestCodex(Beta='C')  # distinct instance distinct cache entry
+    assert icetuple(OtherDex) == ('A', 'C')
+    assert 'C' in OtherDex
+    assert 'C' not in TestDex
+
+    ref = weakref.ref(OtherDex)
+    del OtherDex  # cache holds no reference so instance is collectable
+    assert ref() is None
+
+
 def test_klasify():
     """
     Test klasify utility function
@@ -500,6 +535,7 @@ if __name__ == "__main__":
     test_utilities()
     test_datify()
     test_dictify()
+    test_icetuple()
     test_klasify()
     test_extractvalues()
     test_iso8601()
@@ -12,6 +12,7 @@ from keri.app import openHab
 from keri.core import (Saider, Kevery, SerderKERI, Seqner,
                        Diger, Parser, SealEvent,
                        MtrDex, Saids)
+from keri.core.kraming import epochMs
 from keri.kering import Ilks, Kinds, Vrsn_2_0
 from keri.help import helping
 from keri.vc import credential
@@ -76,7 +77,7 @@ def test_verifier_query_v2(mockHelpingNowUTC, mockCoringRandomNonce):
         Parser(version=Vrsn_2_0).parse(ims=bytearray(qry), kvy=kvy, tvy=tvy)
         cache = hby.db.kramMSGC.get(keys=(hab.pre, serder.said))
         assert cache is not None
-        assert cache.mdt == serder.stamp
+        assert cache.mdt == epochMs(serder.stamp)
         assert cache.d == 1000
 
 